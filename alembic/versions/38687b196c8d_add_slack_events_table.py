@@ -0,0 +1,39 @@
+"""Add slack_events table for event deduplication
+
+Revision ID: 38687b196c8d
+Revises: ff3cca6e9925
+Create Date: 2026-10-19 11:12:40.218391
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '38687b196c8d'
+down_revision: str | Sequence[str] | None = 'ff3cca6e9925'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('slack_events',
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('received_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(
+        op.f('ix_slack_events_received_at'),
+        'slack_events',
+        ['received_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_slack_events_received_at'), table_name='slack_events')
+    op.drop_table('slack_events')
@@ -0,0 +1,45 @@
+"""Add idempotency_keys table
+
+Revision ID: 5ec1fc6ff847
+Revises: 38687b196c8d
+Create Date: 2026-10-19 13:41:05.774210
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5ec1fc6ff847'
+down_revision: str | Sequence[str] | None = '38687b196c8d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('request_hash', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response_body', sa.Text(), nullable=True),
+    sa.Column('response_headers', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(
+        op.f('ix_idempotency_keys_created_at'),
+        'idempotency_keys',
+        ['created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_idempotency_keys_created_at'), table_name='idempotency_keys'
+    )
+    op.drop_table('idempotency_keys')
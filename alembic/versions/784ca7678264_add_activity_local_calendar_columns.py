@@ -0,0 +1,110 @@
+"""Add activity local calendar columns
+
+Revision ID: 784ca7678264
+Revises: f49de551a508
+Create Date: 2026-10-19 09:12:41.318207
+
+"""
+from collections.abc import Sequence
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '784ca7678264'
+down_revision: str | Sequence[str] | None = 'f49de551a508'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_CHUNK_SIZE = 1000
+LOCAL_TIMEZONE = ZoneInfo('America/Sao_Paulo')
+
+
+def _backfill() -> None:
+    activities = sa.table(
+        'activities',
+        sa.column('id', sa.Integer()),
+        sa.column('performed_at', sa.DateTime(timezone=True)),
+        sa.column('performed_on', sa.Date()),
+        sa.column('cycle_key', sa.Integer()),
+    )
+    bind = op.get_bind()
+    update = (
+        activities.update()
+        .where(activities.c.id == sa.bindparam('_id'))
+        .values(
+            performed_on=sa.bindparam('performed_on'),
+            cycle_key=sa.bindparam('cycle_key'),
+        )
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(activities.c.id, activities.c.performed_at)
+            .where(activities.c.id > last_id)
+            .order_by(activities.c.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for row in rows:
+            performed_at = row.performed_at
+            if isinstance(performed_at, str):
+                performed_at = datetime.fromisoformat(performed_at)
+            # Naive datetimes are already local
+            if performed_at.tzinfo is not None:
+                performed_at = performed_at.astimezone(LOCAL_TIMEZONE)
+            params.append({
+                '_id': row.id,
+                'performed_on': performed_at.date(),
+                'cycle_key': performed_at.year * 12 + performed_at.month,
+            })
+        bind.execute(update, params)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('activities', sa.Column('performed_on', sa.Date(), nullable=True))
+    op.add_column('activities', sa.Column('cycle_key', sa.Integer(), nullable=True))
+
+    _backfill()
+
+    with op.batch_alter_table('activities') as batch_op:
+        batch_op.alter_column('performed_on', nullable=False)
+        batch_op.alter_column('cycle_key', nullable=False)
+
+    op.create_index(
+        'ix_activities_user_cycle',
+        'activities',
+        ['user_id', 'cycle_key'],
+        unique=False
+    )
+    op.create_index(
+        'ix_activities_program_cycle',
+        'activities',
+        ['program_id', 'cycle_key', 'user_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_activities_user_program_performed_on',
+        'activities',
+        ['user_id', 'program_id', 'performed_on'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_activities_user_program_performed_on', table_name='activities')
+    op.drop_index('ix_activities_program_cycle', table_name='activities')
+    op.drop_index('ix_activities_user_cycle', table_name='activities')
+    with op.batch_alter_table('activities') as batch_op:
+        batch_op.drop_column('cycle_key')
+        batch_op.drop_column('performed_on')
@@ -0,0 +1,91 @@
+"""Add activity calendars table
+
+Revision ID: a5f2c8e4d913
+Revises: e3a8f61b0d27
+Create Date: 2026-10-19 19:21:08.642951
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5f2c8e4d913'
+down_revision: str | Sequence[str] | None = 'e3a8f61b0d27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_CHUNK_SIZE = 1000
+# Bit i of a year's bitmap is the local day with ordinal i + 1, stored
+# little-endian in (366 + 7) // 8 bytes
+BITMAP_BYTES = 46
+
+
+def _backfill(calendars: sa.Table) -> None:
+    activities = sa.table(
+        'activities',
+        sa.column('user_id', sa.Integer()),
+        sa.column('program_id', sa.Integer()),
+        sa.column('performed_on', sa.Date()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            activities.c.user_id, activities.c.program_id, activities.c.performed_on
+        )
+    )
+
+    bitmaps: dict[tuple[int, int, int], int] = {}
+    for row in rows:
+        key = (row.user_id, row.program_id, row.performed_on.year)
+        day_index = row.performed_on.timetuple().tm_yday - 1
+        bitmaps[key] = bitmaps.get(key, 0) | 1 << day_index
+
+    params = [
+        {
+            'user_id': user_id,
+            'program_id': program_id,
+            'year': year,
+            'days': bitmap.to_bytes(BITMAP_BYTES, 'little'),
+        }
+        for (user_id, program_id, year), bitmap in bitmaps.items()
+    ]
+    for start in range(0, len(params), BACKFILL_CHUNK_SIZE):
+        op.bulk_insert(calendars, params[start:start + BACKFILL_CHUNK_SIZE])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    calendars = op.create_table(
+        'activity_calendars',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('program_id', sa.Integer(), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('days', sa.LargeBinary(), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.ForeignKeyConstraint(['program_id'], ['programs.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'program_id', 'year')
+    )
+    op.create_index(
+        'ix_activity_calendars_program_year',
+        'activity_calendars',
+        ['program_id', 'year'],
+        unique=False
+    )
+
+    _backfill(calendars)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_activity_calendars_program_year', table_name='activity_calendars'
+    )
+    op.drop_table('activity_calendars')
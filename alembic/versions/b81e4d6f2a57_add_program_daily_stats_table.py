@@ -0,0 +1,72 @@
+"""Add program daily stats table
+
+Revision ID: b81e4d6f2a57
+Revises: a5f2c8e4d913
+Create Date: 2026-10-19 20:34:52.117630
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81e4d6f2a57'
+down_revision: str | Sequence[str] | None = 'a5f2c8e4d913'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _backfill() -> None:
+    activities = sa.table(
+        'activities',
+        sa.column('id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('program_id', sa.Integer()),
+        sa.column('performed_on', sa.Date()),
+    )
+    stats = sa.table(
+        'program_daily_stats',
+        sa.column('program_id', sa.Integer()),
+        sa.column('day', sa.Date()),
+        sa.column('activity_count', sa.Integer()),
+        sa.column('distinct_users', sa.Integer()),
+    )
+    op.execute(
+        stats.insert().from_select(
+            ['program_id', 'day', 'activity_count', 'distinct_users'],
+            sa.select(
+                activities.c.program_id,
+                activities.c.performed_on,
+                sa.func.count(activities.c.id),
+                sa.func.count(sa.distinct(activities.c.user_id)),
+            ).group_by(activities.c.program_id, activities.c.performed_on),
+        )
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'program_daily_stats',
+        sa.Column('program_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('activity_count', sa.Integer(), nullable=False),
+        sa.Column('distinct_users', sa.Integer(), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.ForeignKeyConstraint(['program_id'], ['programs.id'], ),
+        sa.PrimaryKeyConstraint('program_id', 'day')
+    )
+
+    _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('program_daily_stats')
@@ -0,0 +1,77 @@
+"""Add program cycle users table
+
+Revision ID: c4d7a9e3f152
+Revises: b81e4d6f2a57
+Create Date: 2026-10-20 09:12:40.583214
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a9e3f152'
+down_revision: str | Sequence[str] | None = 'b81e4d6f2a57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _backfill() -> None:
+    activities = sa.table(
+        'activities',
+        sa.column('id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('program_id', sa.Integer()),
+        sa.column('cycle_key', sa.Integer()),
+    )
+    cycle_users = sa.table(
+        'program_cycle_users',
+        sa.column('program_id', sa.Integer()),
+        sa.column('cycle_key', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('activity_count', sa.Integer()),
+    )
+    op.execute(
+        cycle_users.insert().from_select(
+            ['program_id', 'cycle_key', 'user_id', 'activity_count'],
+            sa.select(
+                activities.c.program_id,
+                activities.c.cycle_key,
+                activities.c.user_id,
+                sa.func.count(activities.c.id),
+            ).group_by(
+                activities.c.program_id,
+                activities.c.cycle_key,
+                activities.c.user_id,
+            ),
+        )
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'program_cycle_users',
+        sa.Column('program_id', sa.Integer(), nullable=False),
+        sa.Column('cycle_key', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('activity_count', sa.Integer(), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.ForeignKeyConstraint(['program_id'], ['programs.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('program_id', 'cycle_key', 'user_id')
+    )
+
+    _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('program_cycle_users')
@@ -0,0 +1,63 @@
+"""Add per-program goal tiers and the achievement tier
+
+Revision ID: c7d1e5a9b2f4
+Revises: 9b4e2a7c1f03
+Create Date: 2026-10-19 17:40:12.093518
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d1e5a9b2f4'
+down_revision: str | Sequence[str] | None = '9b4e2a7c1f03'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Matches the former hard-coded GOAL_ACTIVITIES = 12
+DEFAULT_GOAL_TIERS = '[{"name": "goal", "threshold": 12}]'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'programs',
+        sa.Column(
+            'goal_tiers',
+            sa.JSON(),
+            server_default=sa.text(f"'{DEFAULT_GOAL_TIERS}'"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'achievements',
+        sa.Column(
+            'tier', sa.String(), server_default=sa.text("'goal'"), nullable=False
+        ),
+    )
+    op.drop_index('ix_achievements_user_program_cycle', table_name='achievements')
+    op.create_index(
+        'ix_achievements_user_program_cycle',
+        'achievements',
+        ['user_id', 'program_id', 'cycle_reference', 'tier'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM achievements WHERE tier <> 'goal'")
+    op.drop_index('ix_achievements_user_program_cycle', table_name='achievements')
+    op.create_index(
+        'ix_achievements_user_program_cycle',
+        'achievements',
+        ['user_id', 'program_id', 'cycle_reference'],
+        unique=True
+    )
+    with op.batch_alter_table('achievements') as batch_op:
+        batch_op.drop_column('tier')
+    with op.batch_alter_table('programs') as batch_op:
+        batch_op.drop_column('goal_tiers')
@@ -0,0 +1,31 @@
+"""Add idempotency key lock deadline
+
+Revision ID: d8f3b6a1c950
+Revises: c4d7a9e3f152
+Create Date: 2026-10-21 10:04:17.318502
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3b6a1c950'
+down_revision: str | Sequence[str] | None = 'c4d7a9e3f152'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'idempotency_keys',
+        sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('idempotency_keys', 'locked_until')
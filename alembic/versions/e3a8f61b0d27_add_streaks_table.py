@@ -0,0 +1,103 @@
+"""Add streaks table
+
+Revision ID: e3a8f61b0d27
+Revises: c7d1e5a9b2f4
+Create Date: 2026-10-19 18:05:37.504118
+
+"""
+from collections.abc import Sequence
+from datetime import timedelta
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a8f61b0d27'
+down_revision: str | Sequence[str] | None = 'c7d1e5a9b2f4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def _backfill(streaks: sa.Table) -> None:
+    activities = sa.table(
+        'activities',
+        sa.column('user_id', sa.Integer()),
+        sa.column('program_id', sa.Integer()),
+        sa.column('performed_on', sa.Date()),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            activities.c.user_id, activities.c.program_id, activities.c.performed_on
+        ).order_by(
+            activities.c.user_id, activities.c.program_id, activities.c.performed_on
+        )
+    )
+
+    params = []
+    state = None
+    for row in rows:
+        key = (row.user_id, row.program_id)
+        if state is None or state['key'] != key:
+            if state is not None:
+                params.append(state)
+            state = {
+                'key': key,
+                'current_start': row.performed_on,
+                'last_date': row.performed_on,
+                'longest_length': 1,
+            }
+            continue
+
+        if row.performed_on != state['last_date'] + timedelta(days=1):
+            state['current_start'] = row.performed_on
+        state['last_date'] = row.performed_on
+        state['longest_length'] = max(
+            state['longest_length'],
+            (state['last_date'] - state['current_start']).days + 1,
+        )
+    if state is not None:
+        params.append(state)
+
+    for start in range(0, len(params), BACKFILL_CHUNK_SIZE):
+        op.bulk_insert(streaks, [
+            {
+                'user_id': state['key'][0],
+                'program_id': state['key'][1],
+                'current_start': state['current_start'],
+                'last_date': state['last_date'],
+                'longest_length': state['longest_length'],
+            }
+            for state in params[start:start + BACKFILL_CHUNK_SIZE]
+        ])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    streaks = op.create_table(
+        'streaks',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('program_id', sa.Integer(), nullable=False),
+        sa.Column('current_start', sa.Date(), nullable=False),
+        sa.Column('last_date', sa.Date(), nullable=False),
+        sa.Column('longest_length', sa.Integer(), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+            nullable=False
+        ),
+        sa.ForeignKeyConstraint(['program_id'], ['programs.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'program_id')
+    )
+
+    _backfill(streaks)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('streaks')
@@ -0,0 +1,71 @@
+"""Scope idempotency keys by endpoint
+
+Revision ID: e6a2c9d4b718
+Revises: d8f3b6a1c950
+Create Date: 2026-10-21 11:26:48.905113
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a2c9d4b718'
+down_revision: str | Sequence[str] | None = 'd8f3b6a1c950'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _idempotency_keys(*extra: sa.Column) -> sa.Table:
+    """The table as the batch copies it, without its old primary key."""
+    return sa.Table(
+        'idempotency_keys',
+        sa.MetaData(),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('request_hash', sa.String(length=64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('response_body', sa.Text(), nullable=True),
+        sa.Column('response_headers', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+        *extra,
+        sa.Index('ix_idempotency_keys_created_at', 'created_at'),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing keys get an empty scope: no endpoint matches it, so they only
+    # wait for the TTL purge.
+    op.add_column(
+        'idempotency_keys',
+        sa.Column(
+            'scope', sa.String(length=255), nullable=False, server_default=''
+        ),
+    )
+    copy_from = _idempotency_keys(
+        sa.Column('scope', sa.String(length=255), nullable=False)
+    )
+    with op.batch_alter_table(
+        'idempotency_keys', recreate='always', copy_from=copy_from
+    ) as batch_op:
+        batch_op.create_primary_key('pk_idempotency_keys', ['scope', 'key'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Keys reused across endpoints cannot share the old single-column key.
+    op.execute(
+        'DELETE FROM idempotency_keys WHERE key IN ('
+        'SELECT key FROM idempotency_keys GROUP BY key HAVING COUNT(*) > 1)'
+    )
+    copy_from = _idempotency_keys(
+        sa.Column('scope', sa.String(length=255), nullable=False)
+    )
+    with op.batch_alter_table(
+        'idempotency_keys', recreate='always', copy_from=copy_from
+    ) as batch_op:
+        batch_op.create_primary_key('pk_idempotency_keys', ['key'])
+        batch_op.drop_column('scope')
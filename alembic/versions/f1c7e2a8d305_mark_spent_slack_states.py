@@ -0,0 +1,36 @@
+"""Mark spent slack states
+
+Revision ID: f1c7e2a8d305
+Revises: e6a2c9d4b718
+Create Date: 2026-10-21 14:52:09.617340
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7e2a8d305'
+down_revision: str | Sequence[str] | None = 'e6a2c9d4b718'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'slack_states',
+        sa.Column(
+            'spent', sa.Boolean(), nullable=False, server_default=sa.false()
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Without the flag a spent nonce would read as a valid state.
+    op.execute(sa.text('DELETE FROM slack_states WHERE spent'))
+    with op.batch_alter_table('slack_states') as batch_op:
+        batch_op.drop_column('spent')
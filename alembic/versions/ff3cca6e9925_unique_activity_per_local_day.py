@@ -0,0 +1,127 @@
+"""Unique activity per user, program and local day
+
+Revision ID: ff3cca6e9925
+Revises: 784ca7678264
+Create Date: 2026-10-19 10:03:17.552904
+
+"""
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'ff3cca6e9925'
+down_revision: str | Sequence[str] | None = '784ca7678264'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+ARCHIVE_TABLE = 'activities_same_day_archive'
+ARCHIVE_OPTION = 'archive_same_day_duplicates'
+REPORT_LIMIT = 50
+
+activities = sa.table(
+    'activities',
+    sa.column('id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('program_id', sa.Integer()),
+    sa.column('performed_on', sa.Date()),
+)
+
+
+def _resolve_same_day_duplicates() -> None:
+    """
+    The old read-before-write check compared UTC dates and was racy, so a few
+    local days may hold more than one activity. Aborts with a report of them
+    unless the upgrade runs with `-x archive_same_day_duplicates=true`, which
+    moves every one but the first registered to ARCHIVE_TABLE. Downgrading
+    moves them back.
+    """
+    first_ids = (
+        sa.select(sa.func.min(activities.c.id))
+        .group_by(
+            activities.c.user_id,
+            activities.c.program_id,
+            activities.c.performed_on,
+        )
+        .scalar_subquery()
+    )
+    duplicates = op.get_bind().execute(
+        sa.select(
+            activities.c.id,
+            activities.c.user_id,
+            activities.c.program_id,
+            activities.c.performed_on,
+        )
+        .where(activities.c.id.not_in(first_ids))
+        .order_by(activities.c.id)
+    ).all()
+    if not duplicates:
+        return
+
+    archive = context.get_x_argument(as_dictionary=True).get(ARCHIVE_OPTION)
+    if archive != 'true':
+        report = '\n'.join(
+            f'  activity {row.id}: user {row.user_id}, program {row.program_id}, '
+            f'{row.performed_on}'
+            for row in duplicates[:REPORT_LIMIT]
+        )
+        if len(duplicates) > REPORT_LIMIT:
+            report += f'\n  ... and {len(duplicates) - REPORT_LIMIT} more'
+        raise RuntimeError(
+            f'{len(duplicates)} activities share a local day with an earlier '
+            f'activity of the same user and program:\n{report}\n'
+            'Resolve them by hand, or rerun with '
+            f'`alembic -x {ARCHIVE_OPTION}=true upgrade head` to move them to '
+            f'{ARCHIVE_TABLE}.'
+        )
+
+    op.execute(
+        f'CREATE TABLE {ARCHIVE_TABLE} AS SELECT * FROM activities WHERE 1 = 0'
+    )
+    duplicate_ids = [row.id for row in duplicates]
+    op.execute(
+        sa.text(
+            f'INSERT INTO {ARCHIVE_TABLE} SELECT * FROM activities '
+            'WHERE id IN :ids'
+        ).bindparams(sa.bindparam('ids', duplicate_ids, expanding=True))
+    )
+    op.execute(activities.delete().where(activities.c.id.in_(duplicate_ids)))
+    logger.warning(
+        'Moved %s same-day duplicate activities to %s', len(duplicates), ARCHIVE_TABLE
+    )
+
+
+def _restore_same_day_duplicates() -> None:
+    if not sa.inspect(op.get_bind()).has_table(ARCHIVE_TABLE):
+        return
+    op.execute(f'INSERT INTO activities SELECT * FROM {ARCHIVE_TABLE}')
+    op.drop_table(ARCHIVE_TABLE)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _resolve_same_day_duplicates()
+    op.drop_index('ix_activities_user_program_performed_on', table_name='activities')
+    op.create_index(
+        'ix_activities_user_program_performed_on',
+        'activities',
+        ['user_id', 'program_id', 'performed_on'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_activities_user_program_performed_on', table_name='activities')
+    op.create_index(
+        'ix_activities_user_program_performed_on',
+        'activities',
+        ['user_id', 'program_id', 'performed_on'],
+        unique=False
+    )
+    _restore_same_day_duplicates()
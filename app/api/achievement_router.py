@@ -1,11 +1,15 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
+from app.api.idempotency import IdempotentRoute
+from app.api.job_router import JobServiceDep, accepted, prefers_async
 from app.schemas.achievement import NotifyResponse
+from app.schemas.job_schema import JobResponse
 from app.services.achievement_service import AchievementService
+from app.services.job_handlers import NOTIFY_ACHIEVEMENTS_JOB
 
-router = APIRouter(tags=["Achievement"])
+router = APIRouter(tags=["Achievement"], route_class=IdempotentRoute)
 
 AchievementServiceDep = Annotated[AchievementService, Depends()]
 
@@ -14,12 +18,21 @@ AchievementServiceDep = Annotated[AchievementService, Depends()]
     "/achievements/notify/{program_name}/{cycle_reference}",
     response_model=NotifyResponse,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def notify_achievements(
     program_name: str,
     cycle_reference: str,
+    request: Request,
     service: AchievementServiceDep,
+    job_service: JobServiceDep,
 ):
+    if prefers_async(request):
+        job = await job_service.enqueue(
+            NOTIFY_ACHIEVEMENTS_JOB,
+            {"program_name": program_name, "cycle_reference": cycle_reference},
+        )
+        return accepted(job)
     return await service.notify_achievements(
         program_name=program_name,
         cycle_reference=cycle_reference,
@@ -1,30 +1,48 @@
+from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Header, Path, Query, Response, status
 from fastapi.responses import JSONResponse
 
+from app.api.idempotency import IdempotentRoute
+from app.schemas.activity_calendar_schema import HeatmapResponse, TeamHeatmapResponse
 from app.schemas.activity_schema import (
     ActivityCreate,
+    ActivityCycleResponse,
     ActivityResponse,
     ActivitySummaryResponse,
     ActivityUpdate,
 )
+from app.schemas.streak_schema import StreakResponse
 from app.services.activity_service import ActivityService
 
-router = APIRouter(tags=["Activity"])
+router = APIRouter(tags=["Activity"], route_class=IdempotentRoute)
 
 ActivityServiceDep = Annotated[ActivityService, Depends()]
 
 
+CYCLE_PATTERN = r"^\d{4}-\d{2}$"
+
+
 @router.get("/activities", response_model=list[ActivityResponse])
 async def get_activities_by_user(
     service: ActivityServiceDep,
     x_slack_user_id: str = Header(..., title="ID Slack User"),
-    reference_date: str = Query(..., pattern=r"^\d{4}-\d{2}$"),
+    reference_date: str = Query(..., pattern=CYCLE_PATTERN),
 ):
     return await service.find_by_user(x_slack_user_id, reference_date)
 
 
+@router.get("/activities/history", response_model=list[ActivityCycleResponse])
+async def get_activity_history_by_user(
+    service: ActivityServiceDep,
+    x_slack_user_id: str = Header(..., title="ID Slack User"),
+    from_cycle: str = Query(..., alias="from", pattern=CYCLE_PATTERN),
+    to_cycle: str | None = Query(None, alias="to", pattern=CYCLE_PATTERN),
+):
+    return await service.find_history_by_user(x_slack_user_id, from_cycle, to_cycle)
+
+
 @router.get("/activities/{id}", response_model=ActivityResponse)
 async def get_activity_by_id(
     service: ActivityServiceDep,
@@ -70,13 +88,29 @@ async def get_activities_by_user_and_program(
     service: ActivityServiceDep,
     slack_channel: str = Path(..., title="Program Slack Channel"),
     x_slack_user_id: str = Header(..., title="ID Slack User"),
-    reference_date: str = Query(..., pattern=r"^\d{4}-\d{2}$"),
+    reference_date: str = Query(..., pattern=CYCLE_PATTERN),
 ):
     return await service.find_by_user_and_program(
         slack_channel, x_slack_user_id, reference_date
     )
 
 
+@router.get(
+    "/programs/{slack_channel}/activities/history",
+    response_model=list[ActivityCycleResponse],
+)
+async def get_activity_history_by_user_and_program(
+    service: ActivityServiceDep,
+    slack_channel: str = Path(..., title="Program Slack Channel"),
+    x_slack_user_id: str = Header(..., title="ID Slack User"),
+    from_cycle: str = Query(..., alias="from", pattern=CYCLE_PATTERN),
+    to_cycle: str | None = Query(None, alias="to", pattern=CYCLE_PATTERN),
+):
+    return await service.find_history_by_user_and_program(
+        slack_channel, x_slack_user_id, from_cycle, to_cycle
+    )
+
+
 @router.post(
     "/programs/{slack_channel}/activities",
     status_code=status.HTTP_201_CREATED,
@@ -94,3 +128,38 @@ async def create_activity(
         content=summary.model_dump(),
         headers={"Location": f"/activities/{summary.id}"},
     )
+
+
+@router.get("/programs/{slack_channel}/streak", response_model=StreakResponse)
+async def get_streak_by_user_and_program(
+    service: ActivityServiceDep,
+    slack_channel: str = Path(..., title="Program Slack Channel"),
+    x_slack_user_id: str = Header(..., title="ID Slack User"),
+):
+    return await service.find_streak(slack_channel, x_slack_user_id)
+
+
+@router.get("/programs/{slack_channel}/heatmap", response_model=HeatmapResponse)
+async def get_heatmap_by_user_and_program(
+    service: ActivityServiceDep,
+    slack_channel: str = Path(..., title="Program Slack Channel"),
+    x_slack_user_id: str = Header(..., title="ID Slack User"),
+    year: int | None = Query(None, ge=1970, le=9999),
+    start: date | None = None,
+    end: date | None = None,
+):
+    return await service.find_heatmap(slack_channel, x_slack_user_id, year, start, end)
+
+
+@router.get(
+    "/programs/{slack_channel}/heatmap/team", response_model=TeamHeatmapResponse
+)
+async def get_team_heatmap_by_program(
+    service: ActivityServiceDep,
+    slack_channel: str = Path(..., title="Program Slack Channel"),
+    year: int | None = Query(None, ge=1970, le=9999),
+    slack_id: Annotated[list[str] | None, Query()] = None,
+    start: date | None = None,
+    end: date | None = None,
+):
+    return await service.find_team_heatmap(slack_channel, year, slack_id, start, end)
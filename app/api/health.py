@@ -1,8 +1,17 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter
 
+from app.core.slack_executor import slack_listener_executor
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
 async def health_check():
     return {"status": "healthy", "message": "Sports Program API is running!"}
+
+
+@router.get("/health/slack-listeners")
+async def slack_listeners_health():
+    return asdict(slack_listener_executor.stats())
@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from app.services.idempotency_service import IdempotencyService, StoredResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+REPLAYED_RESPONSE_HEADERS = ("content-type", "location")
+
+_last_purge = time.monotonic()
+
+
+async def _request_hash(request: Request) -> str:
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+async def _with_service(action: Callable[[IdempotencyService], Coroutine]) -> Any:
+    async with async_session() as session:
+        return await action(IdempotencyService(IdempotencyKeyRepository(session)))
+
+
+async def _purge_if_due() -> None:
+    global _last_purge
+    if time.monotonic() - _last_purge < settings.IDEMPOTENCY_KEY_TTL_SECONDS:
+        return
+    _last_purge = time.monotonic()
+    try:
+        purged = await _with_service(lambda service: service.purge_expired())
+        logger.info("Purged %s expired idempotency keys", purged)
+    except Exception as e:
+        logger.warning("Failed to purge idempotency keys: %s", e)
+
+
+class IdempotentRoute(APIRoute):
+    """
+    Honors the Idempotency-Key header on POST requests. The first request runs
+    normally and its successful response is stored; retries with the same key
+    and payload get the stored response back without running the endpoint.
+    Keys are scoped to the route, so clients only need them unique per
+    endpoint.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if request.method != "POST" or key is None:
+                return await handler(request)
+
+            scope = f"{request.method} {self.path}"
+            request_hash = await _request_hash(request)
+            stored = await _with_service(
+                lambda service: service.begin(scope, key, request_hash)
+            )
+            if stored is not None:
+                return Response(
+                    content=stored.body,
+                    status_code=stored.status_code,
+                    headers={**stored.headers, REPLAYED_HEADER: "true"},
+                )
+
+            try:
+                response = await handler(request)
+            except Exception:
+                await _with_service(lambda service: service.abandon(scope, key))
+                raise
+
+            if response.status_code >= 500:
+                await _with_service(lambda service: service.abandon(scope, key))
+                return response
+
+            stored = StoredResponse(
+                status_code=response.status_code,
+                body=response.body.decode(),
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name in REPLAYED_RESPONSE_HEADERS
+                },
+            )
+            await _with_service(lambda service: service.complete(scope, key, stored))
+            await _purge_if_due()
+            return response
+
+        return idempotent_handler
@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse
+
+from app.models.job import Job
+from app.schemas.job_schema import JobResponse
+from app.services.job_service import JobService
+
+router = APIRouter(tags=["Job"])
+
+JobServiceDep = Annotated[JobService, Depends()]
+
+RESPOND_ASYNC = "respond-async"
+
+
+def prefers_async(request: Request) -> bool:
+    """True when the client sent `Prefer: respond-async` (RFC 7240)."""
+    preferences = request.headers.get("prefer", "")
+    return any(
+        token.strip().lower() == RESPOND_ASYNC for token in preferences.split(",")
+    )
+
+
+def accepted(job: Job) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobResponse.model_validate(job).model_dump(mode="json"),
+        headers={"Location": f"/jobs/{job.id}", "Preference-Applied": RESPOND_ASYNC},
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int, service: JobServiceDep):
+    return await service.find_by_id(job_id)
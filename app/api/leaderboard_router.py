@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Path, Query
+
+from app.schemas.leaderboard_schema import LeaderboardResponse
+from app.services.leaderboard_service import LeaderboardService
+
+router = APIRouter(tags=["Leaderboard"])
+
+LeaderboardServiceDep = Annotated[LeaderboardService, Depends()]
+
+
+@router.get("/programs/{slack_channel}/leaderboard", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    service: LeaderboardServiceDep,
+    slack_channel: str = Path(..., title="Program Slack Channel"),
+    cycle_reference: str | None = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    limit: int | None = Query(None, ge=1, le=100),
+    x_slack_user_id: str | None = Header(None, title="ID Slack User"),
+):
+    return await service.find(slack_channel, cycle_reference, limit, x_slack_user_id)
@@ -1,17 +1,24 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
+from app.api.idempotency import IdempotentRoute
+from app.api.job_router import JobServiceDep, accepted, prefers_async
 from app.exceptions.business import EntityNotFoundError
 from app.schemas.achievement import AchievementBatchResponse
+from app.schemas.dashboard_schema import ProgramDashboardResponse
+from app.schemas.job_schema import JobResponse
 from app.schemas.program_schema import ProgramCreate, ProgramResponse, ProgramUpdate
 from app.services.achievement_service import AchievementService
+from app.services.job_handlers import CLOSE_CYCLE_JOB
+from app.services.program_dashboard_service import ProgramDashboardService
 from app.services.program_service import ProgramService
 
-router = APIRouter(tags=["Program"])
+router = APIRouter(tags=["Program"], route_class=IdempotentRoute)
 
 CloseCycleServiceDep = Annotated[AchievementService, Depends()]
 ProgramServiceDep = Annotated[ProgramService, Depends()]
+DashboardServiceDep = Annotated[ProgramDashboardService, Depends()]
 
 
 @router.get("/programs", response_model=list[ProgramResponse])
@@ -19,6 +26,17 @@ async def get_programs(service: ProgramServiceDep):
     return await service.find_all()
 
 
+@router.get(
+    "/programs/{slack_channel}/dashboard", response_model=ProgramDashboardResponse
+)
+async def get_program_dashboard(
+    slack_channel: str,
+    service: DashboardServiceDep,
+    cycle_reference: str | None = Query(None, pattern=r"^\d{4}-\d{2}$"),
+):
+    return await service.find(slack_channel, cycle_reference)
+
+
 @router.get("/programs/{slack_channel}/{name}", response_model=ProgramResponse)
 async def get_program_by_slack_channel_and_name(
     name: str, slack_channel: str, service: ProgramServiceDep
@@ -51,8 +69,24 @@ async def update_program(
     "/programs/{program_name}/close-cycle/{cycle_reference}",
     response_model=AchievementBatchResponse | None,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def close_cycle(
-    program_name: str, cycle_reference: str, service: CloseCycleServiceDep
+    program_name: str,
+    cycle_reference: str,
+    request: Request,
+    service: CloseCycleServiceDep,
+    job_service: JobServiceDep,
+    reconcile: bool = False,
 ):
-    return await service.close_cycle(program_name, cycle_reference)
+    if prefers_async(request):
+        job = await job_service.enqueue(
+            CLOSE_CYCLE_JOB,
+            {
+                "program_name": program_name,
+                "cycle_reference": cycle_reference,
+                "reconcile": reconcile,
+            },
+        )
+        return accepted(job)
+    return await service.close_cycle(program_name, cycle_reference, reconcile)
@@ -1,3 +1,5 @@
+import time
+
 from fastapi import APIRouter, Request
 from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
 
@@ -11,7 +13,8 @@ app_handler = AsyncSlackRequestHandler(slack_app)
 
 @router.post("/events")
 async def slack_events(request: Request):
-    return await app_handler.handle(request)
+    # Ack budgets are counted from here, so time spent queueing counts too
+    return await app_handler.handle(request, {"received_at": time.monotonic()})
 
 
 @router.get("/install")
@@ -1,8 +1,11 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 
+from app.api.job_router import JobServiceDep, accepted
+from app.schemas.job_schema import JobResponse
 from app.schemas.user_schema import UserCreate, UserResponse
+from app.services.job_handlers import SLACK_DIRECTORY_SYNC_JOB
 from app.services.user_service import UserService
 
 router = APIRouter(tags=["User"])
@@ -19,3 +22,13 @@ async def get_users(service: UserServiceDep):
 @router.post("/users", response_model=UserResponse)
 async def create_user(user: UserCreate, service: UserServiceDep):
     return await service.create(user)
+
+
+@router.post(
+    "/users/slack-sync",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def sync_slack_directory(job_service: JobServiceDep):
+    job = await job_service.enqueue(SLACK_DIRECTORY_SYNC_JOB, {})
+    return accepted(job)
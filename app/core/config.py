@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,10 +14,45 @@ class BasicConfig(BaseSettings):
     SLACK_SIGNING_SECRET: str = ""
     SLACK_CLIENT_ID: str = ""
     SLACK_CLIENT_SECRET: str = ""
-    SLACK_SCOPES: str = "commands,chat:write"
+    SLACK_SCOPES: str = "commands,chat:write,users:read"
     SLACK_INSTALL_PATH: str = "/slack/install"
     SLACK_REDIRECT_URI_PATH: str = "/slack/oauth_redirect"
     SLACK_STATE_EXPIRATION_SECONDS: int = 600
+    SLACK_STATE_STORE: Literal["database", "signed"] = "database"
+    SLACK_STATE_SECRET: str = ""
+    SLACK_STATE_SPENT_SET_DB: bool = True
+    SLACK_API_BASE_URL: str = "https://slack.com/api/"
+    SLACK_DIRECTORY_SYNC_INTERVAL_SECONDS: int = 0
+    SLACK_CLIENT_POOL_MAX_WORKSPACES: int = 256
+    SLACK_HTTP_CONNECTION_LIMIT: int = 50
+    SLACK_HTTP_KEEPALIVE_SECONDS: int = 60
+    SLACK_ACK_BUDGET_SECONDS: float = 2.0
+    SLACK_EVENT_DEDUP_WINDOW: int = 10000
+    SLACK_EVENT_DEDUP_DB: bool = False
+    SLACK_EVENT_DEDUP_RETENTION_SECONDS: int = 3600
+    SLACK_LISTENER_MAX_CONCURRENCY: int = 10
+    SLACK_LISTENER_MAX_QUEUE: int = 200
+    SLACK_LISTENER_MAX_LOW_PRIORITY_QUEUE: int = 20
+    SLACK_LISTENER_MAX_WAIT_SECONDS: float = 1.0
+    SLACK_LISTENER_DRAIN_TIMEOUT_SECONDS: float = 25.0
+    DB_CONCURRENT_READS: bool = False
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_KEY_LOCK_SECONDS: int = 60
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_LEASE_SECONDS: int = 300
+    SCHEDULER_RUN_RETENTION_DAYS: int = 90
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_LOCK_SECONDS: int = 300
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: int = 30
+    JOB_WORKER_DRAIN_TIMEOUT_SECONDS: float = 25.0
+    LEADERBOARD_TTL_SECONDS: int = 300
+    LEADERBOARD_SIZE: int = 10
+    ACTIVITY_WRITE_COALESCING: bool = False
+    ACTIVITY_WRITE_COALESCING_WINDOW_MS: int = 5
+    ACTIVITY_WRITE_COALESCING_MAX_BATCH: int = 100
     DEBUG: bool = True
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -1,3 +1,7 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -23,3 +27,59 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+class LazySession:
+    """
+    Stands in for an AsyncSession that is only created on first attribute
+    access, so requests that never reach the database don't build and close a
+    session (or check out a connection) at all.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def opened(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._session_factory()
+        return getattr(self._session, name)
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+ReadQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class ConcurrentReads:
+    """
+    Runs independent read-only queries concurrently, each one on its own
+    pooled connection. A single AsyncSession cannot execute statements in
+    parallel, so every query receives a short-lived session of its own.
+
+    Objects returned are detached from any session; only use attributes
+    that were loaded by the query itself.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def gather(self, *queries: ReadQuery) -> list[Any]:
+        return list(await asyncio.gather(*(self._run(query) for query in queries)))
+
+    async def _run(self, query: ReadQuery) -> Any:
+        async with self.session_factory() as session:
+            return await query(session)
+
+
+def get_concurrent_reads() -> ConcurrentReads | None:
+    if not settings.DB_CONCURRENT_READS:
+        return None
+    return ConcurrentReads(async_session)
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.exceptions.business import BusinessException, ExternalServiceError
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+_running_workers: set["JobWorker"] = set()
+
+
+@dataclass
+class JobContext:
+    job_id: int
+    attempt: int
+    payload: dict[str, Any]
+    session: AsyncSession
+    report_progress: Callable[[int, str | None], Awaitable[None]]
+
+
+JobHandler = Callable[[JobContext], Awaitable[Any]]
+
+
+def is_retryable(error: Exception) -> bool:
+    """Business rule failures won't succeed on retry; infrastructure ones may."""
+    return not isinstance(error, BusinessException) or isinstance(
+        error, ExternalServiceError
+    )
+
+
+async def enqueue_job(
+    session: AsyncSession,
+    kind: str,
+    payload: dict[str, Any],
+    max_attempts: int = settings.JOB_MAX_ATTEMPTS,
+) -> Job:
+    job = await JobRepository(session).create(
+        Job(
+            kind=kind,
+            payload=json.dumps(payload),
+            max_attempts=max_attempts,
+            run_after=datetime.now(UTC),
+        )
+    )
+    for worker in _running_workers:
+        worker.wake()
+    return job
+
+
+class JobWorker:
+    """
+    Runs jobs from the jobs table. Each of `concurrency` loops claims one job
+    at a time, keeps its lock alive while the handler runs, and either marks
+    it succeeded or schedules a retry with exponential backoff until
+    `max_attempts` is reached. Jobs left running by a dead worker are claimed
+    again once their lock expires, or failed if that was their last attempt.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        handlers: dict[str, JobHandler],
+        concurrency: int = settings.JOB_WORKER_CONCURRENCY,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+        lock_seconds: int = settings.JOB_LOCK_SECONDS,
+        retry_backoff_seconds: int = settings.JOB_RETRY_BACKOFF_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lock_seconds = lock_seconds
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._loops: list[asyncio.Task] = []
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+
+    def wake(self) -> None:
+        """Skips the rest of the poll interval; called when a job is enqueued."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        self._stopping = False
+        _running_workers.add(self)
+        for index in range(self.concurrency):
+            self._loops.append(
+                asyncio.create_task(self._loop(), name=f"job-worker:{index}")
+            )
+
+    async def stop(self, timeout: float) -> None:
+        """Lets running jobs finish for up to `timeout` seconds, then cancels."""
+        self._stopping = True
+        _running_workers.discard(self)
+        self.wake()
+        if self._loops:
+            _, pending = await asyncio.wait(self._loops, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops = []
+
+    async def _loop(self) -> None:
+        while not self._stopping:
+            try:
+                ran = await self.run_next()
+            except Exception as e:
+                logger.error("Job worker failed to claim a job: %s", e)
+                ran = False
+            if not ran and not self._stopping:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+
+    async def run_next(self) -> bool:
+        """Claims and runs one job. Returns False when nothing was runnable."""
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            job_repo = JobRepository(session)
+            if failed := await job_repo.fail_exhausted(now):
+                logger.warning(
+                    "Failed %s jobs whose lock expired on their last attempt", failed
+                )
+            job = await job_repo.claim(
+                self.worker_id, now, now + timedelta(seconds=self.lock_seconds)
+            )
+        if job is None:
+            return False
+
+        heartbeat = asyncio.create_task(self._keep_locked(job.id))
+        try:
+            result = await self._execute(job)
+        except Exception as e:
+            await self._record_failure(job, e)
+        else:
+            async with self.session_factory() as session:
+                recorded = await JobRepository(session).mark_succeeded(
+                    job.id,
+                    self.worker_id,
+                    None if result is None else json.dumps(result, default=str),
+                    datetime.now(UTC),
+                )
+            if recorded:
+                logger.info("Job %s (%s) succeeded", job.id, job.kind)
+            else:
+                self._log_lost_lease(job)
+        finally:
+            heartbeat.cancel()
+        return True
+
+    async def _execute(self, job: Job) -> Any:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind {job.kind}")
+
+        async def report_progress(progress: int, detail: str | None = None) -> None:
+            async with self.session_factory() as session:
+                await JobRepository(session).report_progress(job.id, progress, detail)
+
+        async with self.session_factory() as session:
+            return await handler(
+                JobContext(
+                    job_id=job.id,
+                    attempt=job.attempts,
+                    payload=json.loads(job.payload),
+                    session=session,
+                    report_progress=report_progress,
+                )
+            )
+
+    async def _record_failure(self, job: Job, error: Exception) -> None:
+        retry_at = None
+        if is_retryable(error) and job.attempts < job.max_attempts:
+            delay = self.retry_backoff_seconds * 2 ** (job.attempts - 1)
+            retry_at = datetime.now(UTC) + timedelta(seconds=delay)
+        logger.warning(
+            "Job %s (%s) attempt %s/%s failed: %s%s",
+            job.id,
+            job.kind,
+            job.attempts,
+            job.max_attempts,
+            error,
+            f", retrying at {retry_at.isoformat()}" if retry_at else "",
+        )
+        async with self.session_factory() as session:
+            recorded = await JobRepository(session).mark_failed(
+                job.id, self.worker_id, repr(error), retry_at, datetime.now(UTC)
+            )
+        if not recorded:
+            self._log_lost_lease(job)
+
+    def _log_lost_lease(self, job: Job) -> None:
+        logger.warning(
+            "Job %s (%s) attempt %s lost its lock to another worker; "
+            "its outcome was discarded",
+            job.id,
+            job.kind,
+            job.attempts,
+        )
+
+    async def _keep_locked(self, job_id: int) -> None:
+        while True:
+            await asyncio.sleep(self.lock_seconds / 3)
+            try:
+                async with self.session_factory() as session:
+                    await JobRepository(session).extend_lock(
+                        job_id,
+                        self.worker_id,
+                        datetime.now(UTC) + timedelta(seconds=self.lock_seconds),
+                    )
+            except Exception as e:
+                logger.warning("Failed to extend lock on job %s: %s", job_id, e)
@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.scheduled_job import JobRun
+from app.repositories.job_lease_repository import JobLeaseRepository
+from app.repositories.job_run_repository import JobRunRepository
+from app.utils.cycle import LOCAL_TIMEZONE
+
+logger = logging.getLogger(__name__)
+
+Schedule = Callable[[datetime], datetime]
+
+
+def every(seconds: int) -> Schedule:
+    def next_run(now: datetime) -> datetime:
+        return now + timedelta(seconds=seconds)
+
+    return next_run
+
+
+def daily_at(hour: int, minute: int = 0) -> Schedule:
+    """Every day at hour:minute, local time."""
+
+    def next_run(now: datetime) -> datetime:
+        local = now.astimezone(LOCAL_TIMEZONE)
+        candidate = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if candidate <= local:
+            candidate += timedelta(days=1)
+        return candidate.astimezone(UTC)
+
+    return next_run
+
+
+def monthly_at(day: int, hour: int, minute: int = 0) -> Schedule:
+    """On `day` (1-28) of every month at hour:minute, local time."""
+
+    def next_run(now: datetime) -> datetime:
+        local = now.astimezone(LOCAL_TIMEZONE)
+        candidate = local.replace(
+            day=day, hour=hour, minute=minute, second=0, microsecond=0
+        )
+        if candidate <= local:
+            year, month = divmod(local.year * 12 + local.month, 12)
+            candidate = candidate.replace(year=year, month=month + 1)
+        return candidate.astimezone(UTC)
+
+    return next_run
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    schedule: Schedule
+    func: Callable[..., Awaitable[Any]]
+    # Catch-up jobs are called with the time each run was scheduled for
+    catch_up: bool = False
+
+
+class Scheduler:
+    """
+    Runs recurring jobs inside the application process. Before each run, the
+    replica takes a lease on the job in job_leases; the lease is renewed while
+    the job runs and kept for `lease_seconds` afterwards, so replicas that
+    wake up at the same time (give or take clock skew) skip the run.
+
+    Every run is recorded in job_runs with its duration and outcome. On start,
+    catch-up jobs first run every occurrence missed since their last
+    successful run, e.g. while no replica was up.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        lease_seconds: int = settings.SCHEDULER_LEASE_SECONDS,
+        holder: str | None = None,
+    ):
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.holder = holder or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.jobs: dict[str, ScheduledJob] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add(
+        self,
+        name: str,
+        schedule: Schedule,
+        func: Callable[..., Awaitable[Any]],
+        catch_up: bool = False,
+    ) -> None:
+        self.jobs[name] = ScheduledJob(name, schedule, func, catch_up)
+
+    def start(self) -> None:
+        for job in self.jobs.values():
+            self._tasks.append(
+                asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}")
+            )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        if job.catch_up:
+            await self.catch_up(job)
+        while True:
+            now = datetime.now(UTC)
+            scheduled_at = job.schedule(now)
+            await asyncio.sleep((scheduled_at - now).total_seconds())
+            await self.run_once(job, scheduled_at)
+
+    async def catch_up(self, job: ScheduledJob) -> int:
+        """
+        Runs the occurrences of `job` scheduled since its last successful run,
+        oldest first. A job that never succeeded has nothing to catch up on.
+        Returns how many occurrences ran.
+        """
+        try:
+            async with self.session_factory() as session:
+                last = await JobRunRepository(session).find_last_succeeded(job.name)
+        except Exception as e:
+            logger.error("Failed to find the last run of job %s: %s", job.name, e)
+            return 0
+        if last is None:
+            return 0
+
+        last_started = last.started_at
+        if last_started.tzinfo is None:
+            last_started = last_started.replace(tzinfo=UTC)
+        ran = 0
+        scheduled_at = job.schedule(last_started)
+        while scheduled_at <= datetime.now(UTC):
+            logger.info(
+                "Catching up on job %s scheduled at %s",
+                job.name,
+                scheduled_at.isoformat(),
+            )
+            if not await self.run_once(job, scheduled_at):
+                break
+            ran += 1
+            scheduled_at = job.schedule(scheduled_at)
+        return ran
+
+    async def run_once(
+        self, job: ScheduledJob, scheduled_at: datetime | None = None
+    ) -> bool:
+        """Runs the job if this replica gets its lease. Returns whether it ran."""
+        try:
+            if not await self._acquire(job.name):
+                logger.debug("Job %s is leased by another replica", job.name)
+                return False
+        except Exception as e:
+            logger.error("Failed to acquire lease for job %s: %s", job.name, e)
+            return False
+
+        renewal = asyncio.create_task(self._renew(job.name))
+        started_at = datetime.now(UTC)
+        started = time.monotonic()
+        run = JobRun(job_name=job.name, holder=self.holder, status="succeeded")
+        try:
+            if job.catch_up:
+                result = await job.func(scheduled_at or started_at)
+            else:
+                result = await job.func()
+            run.detail = None if result is None else str(result)
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.name, e, exc_info=True)
+            run.status = "failed"
+            run.error = repr(e)
+        finally:
+            renewal.cancel()
+
+        run.started_at = started_at
+        run.finished_at = datetime.now(UTC)
+        run.duration_ms = int((time.monotonic() - started) * 1000)
+        logger.info("Job %s %s in %sms", job.name, run.status, run.duration_ms)
+        try:
+            async with self.session_factory() as session:
+                await JobRunRepository(session).record(run)
+        except Exception as e:
+            logger.error("Failed to record run of job %s: %s", job.name, e)
+        return True
+
+    async def _acquire(self, job_name: str) -> bool:
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            return await JobLeaseRepository(session).acquire(
+                job_name,
+                self.holder,
+                now,
+                now + timedelta(seconds=self.lease_seconds),
+            )
+
+    async def _renew(self, job_name: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self._acquire(job_name)
+            except Exception as e:
+                logger.warning("Failed to renew lease for job %s: %s", job_name, e)
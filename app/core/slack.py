@@ -1,12 +1,27 @@
+import functools
 import logging
 
 from slack_bolt.async_app import AsyncApp
+from slack_bolt.listener.async_listener_completion_handler import (
+    AsyncCustomListenerCompletionHandler,
+)
 from slack_bolt.oauth.async_callback_options import AsyncCallbackOptions
 from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
 
 from app.core.config import settings
-from app.core.database import async_session
-from app.core.slack_stores import SQLAlchemyInstallationStore, SQLAlchemyStateStore
+from app.core.database import LazySession, async_session
+from app.core.slack_clients import slack_client_pool
+from app.core.slack_events import slack_event_deduplicator
+from app.core.slack_executor import (
+    ListenerPriority,
+    ListenerRejectedError,
+    slack_listener_executor,
+)
+from app.core.slack_stores import (
+    SignedStateStore,
+    SQLAlchemyInstallationStore,
+    SQLAlchemyStateStore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +45,26 @@ async def oauth_failure(args):
     return await args.default.failure(args)
 
 
+def build_state_store():
+    if settings.SLACK_STATE_STORE == "signed":
+        return SignedStateStore(
+            settings.SLACK_STATE_SECRET or settings.SLACK_CLIENT_SECRET,
+            expiration_seconds=settings.SLACK_STATE_EXPIRATION_SECONDS,
+            session_factory=async_session
+            if settings.SLACK_STATE_SPENT_SET_DB
+            else None,
+        )
+    return SQLAlchemyStateStore(
+        async_session, expiration_seconds=settings.SLACK_STATE_EXPIRATION_SECONDS
+    )
+
+
 oauth_settings = AsyncOAuthSettings(
     client_id=settings.SLACK_CLIENT_ID,
     client_secret=settings.SLACK_CLIENT_SECRET,
     scopes=settings.SLACK_SCOPES.split(","),
     installation_store=SQLAlchemyInstallationStore(async_session),
-    state_store=SQLAlchemyStateStore(
-        async_session, expiration_seconds=settings.SLACK_STATE_EXPIRATION_SECONDS
-    ),
+    state_store=build_state_store(),
     install_path=settings.SLACK_INSTALL_PATH,
     redirect_uri_path=settings.SLACK_REDIRECT_URI_PATH,
     callback_options=AsyncCallbackOptions(
@@ -52,8 +79,117 @@ slack_app = AsyncApp(
 )
 
 
+def is_actionable_event(body: dict) -> bool:
+    """
+    Whether an Events API payload can reach a listener that does anything.
+    Bot posts and message subtypes (edits, deletions, joins, file shares) are
+    never handled, and plain messages are only answered in DMs.
+    """
+    event = body.get("event")
+    if event is None:
+        return True
+    if event.get("bot_id") or event.get("subtype"):
+        return False
+    if event.get("type") == "message":
+        return event.get("channel_type") == "im"
+    return True
+
+
+@slack_app.middleware
+async def prefilter_events(body, ack, next):
+    if not is_actionable_event(body):
+        return await ack()
+    return await next()
+
+
+@slack_app.middleware
+async def deduplicate_events(body, request, ack, next):
+    event_id = body.get("event_id")
+    if event_id and await slack_event_deduplicator.is_duplicate(event_id):
+        logger.info(
+            "Dropping duplicate Slack event %s (retry %s, reason %s)",
+            event_id,
+            request.headers.get("x-slack-retry-num", ["-"])[0],
+            request.headers.get("x-slack-retry-reason", ["-"])[0],
+        )
+        return await ack()
+    return await next()
+
+
 @slack_app.middleware
 async def inject_db_session(context, next):
-    async with async_session() as db:
-        context["db"] = db
-        await next()
+    context["db"] = LazySession(async_session)
+    await next()
+
+
+async def close_db_session(context) -> None:
+    db = context.get("db")
+    if isinstance(db, LazySession):
+        await db.aclose()
+
+
+# Global middleware return before Bolt runs the listener, so the session is
+# closed by the listener completion handler, which runs after every listener.
+slack_app.listener_runner.listener_completion_handler = (
+    AsyncCustomListenerCompletionHandler(logger, close_db_session)
+)
+
+
+BUSY_TEXT = ":hourglass: I'm a bit busy right now, please try again in a moment."
+
+
+async def reply_busy(kwargs: dict) -> None:
+    """
+    Tells the user a rejected command or mention was not processed, using the
+    cheapest channel still available: the ack body, response_url, or
+    chat.postEphemeral for mentions.
+    """
+    ack = kwargs.get("ack")
+    command = kwargs.get("command")
+    event = kwargs.get("event")
+    if ack is not None and ack.response is None:
+        await ack(text=BUSY_TEXT, response_type="ephemeral")
+    elif command and command.get("response_url") and kwargs.get("respond"):
+        await kwargs["respond"](
+            text=BUSY_TEXT, response_type="ephemeral", replace_original=False
+        )
+    elif event and event.get("type") == "app_mention":
+        await kwargs["context"].client.chat_postEphemeral(
+            channel=event.get("channel"), user=event.get("user"), text=BUSY_TEXT
+        )
+
+
+def bounded_listener(priority: ListenerPriority = ListenerPriority.HIGH):
+    """
+    Runs a Slack listener through slack_listener_executor. Bolt passes
+    listener arguments by name. Rejected HIGH priority listeners get a "busy"
+    reply; LOW ones are dropped.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await slack_listener_executor.run(
+                    func, *args, priority=priority, **kwargs
+                )
+            except ListenerRejectedError as e:
+                logger.warning(str(e))
+                if priority == ListenerPriority.HIGH:
+                    await reply_busy(kwargs)
+                elif kwargs.get("ack") is not None and kwargs["ack"].response is None:
+                    await kwargs["ack"]()
+
+        return wrapper
+
+    return decorator
+
+
+async def start_slack_clients():
+    # Bolt builds each request's context.client from slack_app.client.session
+    slack_app.client.session = await slack_client_pool.start()
+
+
+async def close_slack_clients():
+    slack_app.client.session = None
+    await slack_client_pool.close()
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+import aiohttp
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncRateLimitErrorRetryHandler,
+)
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.core.config import settings
+
+
+class SlackClientPool:
+    """
+    AsyncWebClient instances keyed by bot token. Every client shares a single
+    aiohttp session, so keep-alive connections and TLS handshakes to the Slack
+    API are reused across workspaces and requests. The least recently used
+    workspace is dropped once `max_clients` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = settings.SLACK_CLIENT_POOL_MAX_WORKSPACES,
+        connection_limit: int = settings.SLACK_HTTP_CONNECTION_LIMIT,
+        keepalive_seconds: int = settings.SLACK_HTTP_KEEPALIVE_SECONDS,
+        base_url: str = settings.SLACK_API_BASE_URL,
+    ):
+        self.max_clients = max_clients
+        self.connection_limit = connection_limit
+        self.keepalive_seconds = keepalive_seconds
+        self.base_url = base_url
+        self.session: aiohttp.ClientSession | None = None
+        self._clients: OrderedDict[str, AsyncWebClient] = OrderedDict()
+
+    async def start(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+            for client in self._clients.values():
+                client.session = self.session
+        return self.session
+
+    def get(self, token: str) -> AsyncWebClient:
+        client = self._clients.get(token)
+        if client is not None:
+            self._clients.move_to_end(token)
+            return client
+
+        client = AsyncWebClient(
+            token=token,
+            base_url=self.base_url,
+            session=self.session,
+            retry_handlers=[AsyncRateLimitErrorRetryHandler(max_retry_count=3)],
+        )
+        self._clients[token] = client
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    async def close(self) -> None:
+        self._clients.clear()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+slack_client_pool = SlackClientPool()
@@ -0,0 +1,68 @@
+import logging
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.repositories.slack_event_repository import SlackEventRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SlackEventDeduplicator:
+    """
+    Recognises redelivered Events API payloads by `event_id`. The most recent
+    `window_size` ids are kept in memory; with a `session_factory`, ids are also
+    claimed in the slack_events table so replicas share the same view.
+
+    Database errors fail open: the event is processed rather than dropped.
+    """
+
+    def __init__(
+        self,
+        window_size: int = settings.SLACK_EVENT_DEDUP_WINDOW,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        retention_seconds: int = settings.SLACK_EVENT_DEDUP_RETENTION_SECONDS,
+    ):
+        self.window_size = window_size
+        self.session_factory = session_factory
+        self.retention_seconds = retention_seconds
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._last_purge = time.monotonic()
+
+    async def is_duplicate(self, event_id: str) -> bool:
+        if event_id in self._seen:
+            self._seen.move_to_end(event_id)
+            return True
+
+        self._seen[event_id] = None
+        while len(self._seen) > self.window_size:
+            self._seen.popitem(last=False)
+
+        if self.session_factory is None:
+            return False
+        try:
+            return not await self._claim(event_id)
+        except Exception as e:
+            logger.warning("Slack event dedup lookup failed for %s: %s", event_id, e)
+            return False
+
+    async def _claim(self, event_id: str) -> bool:
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            repo = SlackEventRepository(session)
+            claimed = await repo.claim(event_id, now)
+            if time.monotonic() - self._last_purge >= self.retention_seconds:
+                self._last_purge = time.monotonic()
+                await repo.purge_received_before(
+                    now - timedelta(seconds=self.retention_seconds)
+                )
+        return claimed
+
+
+slack_event_deduplicator = SlackEventDeduplicator(
+    session_factory=async_session if settings.SLACK_EVENT_DEDUP_DB else None
+)
@@ -0,0 +1,189 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ListenerPriority(IntEnum):
+    HIGH = 0
+    LOW = 1
+
+
+class ListenerRejectedError(Exception):
+    pass
+
+
+@dataclass
+class ListenerExecutorStats:
+    max_concurrency: int
+    max_queue: int
+    running: int
+    queued: int
+    queued_low_priority: int
+    oldest_queued_seconds: float
+    completed: int
+    failed: int
+    rejected: int
+    draining: bool
+
+
+class ListenerExecutor:
+    """
+    Admission control for Slack listeners. Bolt still starts a task per
+    listener after the ack; each task waits here for one of `max_concurrency`
+    slots. Free slots go to HIGH priority waiters first, FIFO within a class.
+
+    A listener is rejected instead of queued when `max_queue` tasks are already
+    waiting (`max_low_priority_queue` for LOW), and dropped from the queue when
+    no slot frees up within `max_wait_seconds`. Keep that below
+    SLACK_ACK_BUDGET_SECONDS: the ack budget counts from receipt and includes
+    the wait, and a rejected command still acks with its "busy" reply.
+
+    Every admitted task is tracked so `drain()` can wait for in-flight work on
+    shutdown.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.SLACK_LISTENER_MAX_CONCURRENCY,
+        max_queue: int = settings.SLACK_LISTENER_MAX_QUEUE,
+        max_low_priority_queue: int = settings.SLACK_LISTENER_MAX_LOW_PRIORITY_QUEUE,
+        max_wait_seconds: float = settings.SLACK_LISTENER_MAX_WAIT_SECONDS,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_low_priority_queue = max_low_priority_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._available = max_concurrency
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._queued: dict[object, tuple[ListenerPriority, float]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._draining = False
+
+    async def run(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        priority: ListenerPriority = ListenerPriority.HIGH,
+        **kwargs: Any,
+    ) -> T:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            await self._acquire(func.__name__, priority)
+            self._running += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                self._failed += 1
+                raise
+            finally:
+                self._running -= 1
+                self._release()
+            self._completed += 1
+            return result
+        finally:
+            self._tasks.discard(task)
+
+    async def _acquire(self, name: str, priority: ListenerPriority) -> None:
+        if self._draining:
+            self._reject(name, "shutting down")
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+
+        limit = (
+            self.max_queue
+            if priority == ListenerPriority.HIGH
+            else self.max_low_priority_queue
+        )
+        if len(self._queued) >= limit:
+            self._reject(name, f"{len(self._queued)} queued")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        token = object()
+        self._queued[token] = (priority, time.monotonic())
+        try:
+            async with asyncio.timeout(self.max_wait_seconds):
+                await future
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was granted as the wait ended; pass it on
+                self._release()
+            if isinstance(e, TimeoutError):
+                self._reject(name, f"no slot within {self.max_wait_seconds}s")
+            raise
+        finally:
+            del self._queued[token]
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+    def _reject(self, name: str, reason: str) -> None:
+        self._rejected += 1
+        raise ListenerRejectedError(
+            f"Slack listener {name} rejected ({reason}, {self._running} running)"
+        )
+
+    def stats(self) -> ListenerExecutorStats:
+        now = time.monotonic()
+        oldest = min((since for _, since in self._queued.values()), default=now)
+        return ListenerExecutorStats(
+            max_concurrency=self.max_concurrency,
+            max_queue=self.max_queue,
+            running=self._running,
+            queued=len(self._queued),
+            queued_low_priority=sum(
+                1
+                for priority, _ in self._queued.values()
+                if priority == ListenerPriority.LOW
+            ),
+            oldest_queued_seconds=round(now - oldest, 3),
+            completed=self._completed,
+            failed=self._failed,
+            rejected=self._rejected,
+            draining=self._draining,
+        )
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Stops admitting listeners and waits up to `timeout` seconds for the
+        ones in flight. Returns False if some were still running.
+        """
+        self._draining = True
+        pending = set(self._tasks)
+        if not pending:
+            return True
+        _, pending = await asyncio.wait(pending, timeout=timeout)
+        if pending:
+            logger.warning(
+                "%s Slack listeners still running after a %ss drain",
+                len(pending),
+                timeout,
+            )
+        return not pending
+
+
+slack_listener_executor = ListenerExecutor()
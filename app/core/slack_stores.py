@@ -1,6 +1,13 @@
+import base64
+import hashlib
+import hmac
 import logging
+import secrets
+import time
 import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 
 from slack_sdk.oauth.installation_store import Installation
 from slack_sdk.oauth.installation_store.async_installation_store import (
@@ -72,12 +79,17 @@ class SQLAlchemyStateStore(AsyncOAuthStateStore):
     def __init__(self, session_factory, expiration_seconds: int):
         self.session_factory = session_factory
         self.expiration_seconds = expiration_seconds
+        self._last_purge = time.monotonic()
 
     async def async_issue(self, *args, **kwargs) -> str:
         state = str(uuid.uuid4())
         try:
             async with slack_oauth_context(self.session_factory) as service:
-                return await service.issue_state(state, self.expiration_seconds)
+                issued = await service.issue_state(state, self.expiration_seconds)
+                if time.monotonic() - self._last_purge >= self.expiration_seconds:
+                    self._last_purge = time.monotonic()
+                    await service.purge_expired_states()
+                return issued
         except Exception as e:
             logger.error("Failed to issue Slack OAuth state: %s", str(e), exc_info=True)
             raise
@@ -94,3 +106,87 @@ class SQLAlchemyStateStore(AsyncOAuthStateStore):
                 exc_info=True,
             )
             return False
+
+
+class SignedStateStore(AsyncOAuthStateStore):
+    """
+    Stateless OAuth state: `<nonce>.<expires>.<signature>`, signed with
+    HMAC-SHA256, so issuing a state touches no storage. Single use is enforced
+    by a bounded in-memory set of spent nonces and, with a `session_factory`,
+    by recording them in slack_states as spent rows until they expire, so
+    replicas and restarts reject replays too. SQLAlchemyStateStore never
+    consumes spent rows.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        expiration_seconds: int,
+        session_factory=None,
+        max_spent: int = 10000,
+    ):
+        self._key = hashlib.sha256(f"slack-oauth-state:{secret}".encode()).digest()
+        self.expiration_seconds = expiration_seconds
+        self.session_factory = session_factory
+        self.max_spent = max_spent
+        self._spent: OrderedDict[str, int] = OrderedDict()
+        self._last_purge = time.monotonic()
+
+    async def async_issue(self, *args, **kwargs) -> str:
+        nonce = secrets.token_urlsafe(16)
+        expires = int(time.time()) + self.expiration_seconds
+        payload = f"{nonce}.{expires}"
+        return f"{payload}.{self._sign(payload)}"
+
+    async def async_consume(self, state: str) -> bool:
+        try:
+            nonce, expires_text, signature = state.split(".")
+            expires = int(expires_text)
+        except ValueError:
+            logger.warning("Rejected malformed Slack OAuth state")
+            return False
+
+        if not hmac.compare_digest(signature, self._sign(f"{nonce}.{expires}")):
+            logger.warning("Rejected Slack OAuth state with an invalid signature")
+            return False
+        if expires <= time.time():
+            logger.warning("Rejected expired Slack OAuth state")
+            return False
+        if nonce in self._spent:
+            logger.warning("Rejected reused Slack OAuth state")
+            return False
+
+        self._remember_spent(nonce, expires)
+        if self.session_factory is None:
+            return True
+        try:
+            return await self._mark_spent_in_db(nonce, expires)
+        except Exception as e:
+            logger.error(
+                "Failed to record spent Slack OAuth state: %s", str(e), exc_info=True
+            )
+            return False
+
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._key, payload.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def _remember_spent(self, nonce: str, expires: int) -> None:
+        now = time.time()
+        while self._spent and next(iter(self._spent.values())) <= now:
+            self._spent.popitem(last=False)
+        self._spent[nonce] = expires
+        while len(self._spent) > self.max_spent:
+            self._spent.popitem(last=False)
+
+    async def _mark_spent_in_db(self, nonce: str, expires: int) -> bool:
+        async with slack_oauth_context(self.session_factory) as service:
+            first_use = await service.mark_state_spent(
+                nonce, datetime.fromtimestamp(expires, tz=UTC)
+            )
+            if time.monotonic() - self._last_purge >= self.expiration_seconds:
+                self._last_purge = time.monotonic()
+                await service.purge_expired_states()
+        if not first_use:
+            logger.warning("Rejected reused Slack OAuth state")
+        return first_use
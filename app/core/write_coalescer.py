@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base, async_session
+from app.models.activity import Activity
+from app.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class WriteCoalescer:
+    """
+    Group commit for inserts. A single writer task collects the rows submitted
+    during a short window (or until `max_batch` rows are waiting), inserts them
+    in one transaction and resolves each caller's future with the new id.
+
+    If a batch fails, its rows are retried one by one so that only the
+    offending caller receives the error.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        model: type[Base],
+        window_seconds: float = 0.005,
+        max_batch: int = 100,
+    ):
+        self.session_factory = session_factory
+        self.model = model
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+
+    async def submit(self, values: dict[str, Any]) -> int:
+        self._ensure_writer()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((values, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._writer is None:
+            return
+        await self._queue.join()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+        self._queue = None
+
+    def _ensure_writer(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._writer is None or self._writer.done():
+            # Rows still queued for a writer that died go to the new one
+            self._writer = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.window_seconds
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                await self._flush(batch)
+            except Exception as e:
+                logger.error(
+                    "Coalesced insert of %s %s rows failed: %s",
+                    len(batch),
+                    self.model.__tablename__,
+                    e,
+                    exc_info=True,
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                # Only left pending when the writer itself is cancelled
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            rows = await self._insert([values for values, _ in batch])
+        except Exception:
+            if len(batch) == 1:
+                await self._flush_one(*batch[0])
+                return
+            logger.warning(
+                "Coalesced insert of %s %s rows failed, retrying one by one",
+                len(batch),
+                self.model.__tablename__,
+            )
+            for values, future in batch:
+                await self._flush_one(values, future)
+            return
+
+        for (_, future), row in zip(batch, rows, strict=True):
+            if not future.done():
+                future.set_result(row.id)
+
+    async def _flush_one(self, values: dict[str, Any], future: asyncio.Future) -> None:
+        try:
+            [row] = await self._insert([values])
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(row.id)
+
+    async def _insert(self, rows: list[dict[str, Any]]):
+        async with self.session_factory() as session:
+            return await BaseRepository(session, self.model).bulk_insert(
+                rows, chunk_size=self.max_batch
+            )
+
+
+_activity_write_coalescer: WriteCoalescer | None = None
+
+
+def get_activity_write_coalescer() -> WriteCoalescer | None:
+    global _activity_write_coalescer
+    if not settings.ACTIVITY_WRITE_COALESCING:
+        return None
+    if _activity_write_coalescer is None:
+        _activity_write_coalescer = WriteCoalescer(
+            async_session,
+            Activity,
+            window_seconds=settings.ACTIVITY_WRITE_COALESCING_WINDOW_MS / 1000,
+            max_batch=settings.ACTIVITY_WRITE_COALESCING_MAX_BATCH,
+        )
+    return _activity_write_coalescer
+
+
+async def close_write_coalescers() -> None:
+    if _activity_write_coalescer is not None:
+        await _activity_write_coalescer.close()
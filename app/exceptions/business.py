@@ -23,6 +23,12 @@ class BusinessRuleViolationError(BusinessException):
         super().__init__(self.message)
 
 
+class RequestInProgressError(BusinessException):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
 class DatabaseError(Exception):
     def __init__(
             self,
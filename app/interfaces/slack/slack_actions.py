@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
 
 from app.schemas.activity_schema import ActivityCreate
+from app.schemas.leaderboard_schema import LeaderboardResponse
 from app.schemas.program_schema import ProgramCreate, ProgramResponse
 from app.services.activity_service import ActivityService
+from app.services.leaderboard_service import LeaderboardService
 from app.services.program_service import ProgramService
 
 
@@ -52,3 +54,16 @@ async def register_activity_action(
         slack_id=slack_user_id,
         activity_create=activity_create,
     )
+
+
+async def leaderboard_action(
+    service: LeaderboardService,
+    channel_id: str,
+    slack_user_id: str,
+    reference_date: str | None = None,
+) -> LeaderboardResponse:
+    return await service.find(
+        program_slack_channel=channel_id,
+        cycle_reference=reference_date,
+        slack_id=slack_user_id,
+    )
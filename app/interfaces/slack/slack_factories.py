@@ -1,11 +1,20 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_concurrent_reads
+from app.core.write_coalescer import get_activity_write_coalescer
 from app.repositories.achievement_repository import AchievementRepository
+from app.repositories.activity_calendar_repository import ActivityCalendarRepository
 from app.repositories.activity_repository import ActivityRepository
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
 from app.repositories.program_repository import ProgramRepository
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.streak_repository import StreakRepository
 from app.repositories.user_repository import UserRepository
+from app.services.activity_calendar_service import ActivityCalendarService
 from app.services.activity_service import ActivityService
+from app.services.leaderboard_service import LeaderboardService
 from app.services.program_service import ProgramService
+from app.services.streak_service import StreakService
 from app.services.user_service import UserService
 
 
@@ -19,8 +28,13 @@ def get_activity_service(db: AsyncSession) -> ActivityService:
     program_repo = ProgramRepository(session=db)
     activity_repo = ActivityRepository(session=db)
     achievement_repo = AchievementRepository(session=db)
+    streak_repo = StreakRepository(session=db)
+    calendar_repo = ActivityCalendarRepository(session=db)
 
-    user_service = UserService(user_repo=user_repo)
+    user_service = UserService(
+        user_repo=user_repo,
+        installation_repo=SlackInstallationRepository(session=db),
+    )
     program_service = ProgramService(program_repo=program_repo)
 
     return ActivityService(
@@ -29,4 +43,17 @@ def get_activity_service(db: AsyncSession) -> ActivityService:
         program_service=program_service,
         activity_repo=activity_repo,
         achievement_repo=achievement_repo,
+        calendar_service=ActivityCalendarService(calendar_repo, activity_repo),
+        streak_service=StreakService(streak_repo, activity_repo),
+        daily_stats_repo=ProgramDailyStatRepository(session=db),
+        concurrent_reads=get_concurrent_reads(),
+        write_coalescer=get_activity_write_coalescer(),
+    )
+
+
+def get_leaderboard_service(db: AsyncSession) -> LeaderboardService:
+    return LeaderboardService(
+        activity_repo=ActivityRepository(session=db),
+        user_repo=UserRepository(session=db),
+        program_service=get_program_service(db),
     )
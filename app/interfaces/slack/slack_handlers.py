@@ -1,18 +1,22 @@
 import logging
 
-from slack_bolt import Ack, BoltContext
+from slack_bolt import Ack, BoltContext, Respond
 
-from app.core.slack import slack_app
+from app.core.slack import bounded_listener, slack_app
+from app.core.slack_executor import ListenerPriority
 from app.interfaces.slack.slack_actions import (
     create_program_action,
+    leaderboard_action,
     list_activities_action,
     list_programs_action,
     register_activity_action,
 )
 from app.interfaces.slack.slack_factories import (
     get_activity_service,
+    get_leaderboard_service,
     get_program_service,
 )
+from app.interfaces.slack.slack_replies import CommandReply
 from app.interfaces.slack.slack_views import (
     activities_list_blocks,
     activity_registered_blocks,
@@ -22,6 +26,7 @@ from app.interfaces.slack.slack_views import (
     help_blocks,
     invalid_date_blocks,
     invalid_reference_date_blocks,
+    leaderboard_blocks,
 )
 from app.schemas.activity_schema import ActivityCreate
 from app.utils.parsers import parse_activity_date, parse_reference_date
@@ -31,22 +36,22 @@ logger = logging.getLogger(__name__)
 
 
 @slack_app.command("/create-program")
-async def handle_create_program(ack: Ack, command: dict, context: BoltContext):
+@bounded_listener(ListenerPriority.HIGH)
+async def handle_create_program(
+    ack: Ack, command: dict, context: BoltContext, respond: Respond | None = None
+):
     """
     Handle the /create-program command.
     """
-    await ack()
+    reply = CommandReply(ack, respond, command, context)
     channel_id = command.get("channel_id")
-    user_id = command.get("user_id")
     program_name = command.get("text")
 
     if not program_name:
         blocks = error_blocks(
             "Please, provide a program name. Example: `/create-program <program-name>`"
         )
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
+        await reply.ephemeral(
             blocks=blocks,
             text="Error on creating program because of undefined program name",
         )
@@ -56,7 +61,9 @@ async def handle_create_program(ack: Ack, command: dict, context: BoltContext):
 
     try:
         service = get_program_service(db)
-        program = await create_program_action(service, program_name, channel_id)
+        program = await reply.within_ack_deadline(
+            create_program_action(service, program_name, channel_id)
+        )
 
         blocks = create_program_success_blocks(
             program.name, program.slack_channel, program.start_date, program.end_date
@@ -64,53 +71,43 @@ async def handle_create_program(ack: Ack, command: dict, context: BoltContext):
     except Exception as e:
         logger.error(f"Error on creating program: {str(e)}", exc_info=True)
         blocks = error_blocks(str(e))
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            blocks=blocks,
-            text="Error on creating program",
-        )
+        await reply.ephemeral(blocks=blocks, text="Error on creating program")
         return
 
+    await reply.ack()
     await context.say(
         blocks=blocks, text=f"Program {program.name} successfully created!"
     )
 
 
 @slack_app.command("/list-programs")
-async def handle_list_programs(ack: Ack, command: dict, context: BoltContext):
+@bounded_listener(ListenerPriority.HIGH)
+async def handle_list_programs(
+    ack: Ack, command: dict, context: BoltContext, respond: Respond | None = None
+):
     """
     Handle the /list-programs command.
     """
-    await ack()
+    reply = CommandReply(ack, respond, command, context)
     db = context["db"]
-    channel_id = command.get("channel_id")
-    user_id = command.get("user_id")
     try:
         service = get_program_service(db)
-        programs = await list_programs_action(service)
+        programs = await reply.within_ack_deadline(list_programs_action(service))
         blocks = create_programs_list_blocks(programs)
     except Exception as e:
         logger.error(f"Error listing programs: {str(e)}", exc_info=True)
         blocks = error_blocks(str(e))
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            blocks=blocks,
-            text="Error on listing programs",
-        )
+        await reply.ephemeral(blocks=blocks, text="Error on listing programs")
         return
-    await context.client.chat_postEphemeral(
-        channel=channel_id,
-        user=user_id,
-        blocks=blocks,
-        text="Programs",
-    )
+    await reply.ephemeral(blocks=blocks, text="Programs")
 
 
 @slack_app.command("/list-activities")
-async def handle_list_activities(ack: Ack, command: dict, context: BoltContext):
-    await ack()
+@bounded_listener(ListenerPriority.HIGH)
+async def handle_list_activities(
+    ack: Ack, command: dict, context: BoltContext, respond: Respond | None = None
+):
+    reply = CommandReply(ack, respond, command, context)
     user_id = command.get("user_id")
     channel_id = command.get("channel_id")
     text = command.get("text", "")
@@ -118,43 +115,63 @@ async def handle_list_activities(ack: Ack, command: dict, context: BoltContext):
         reference_date = parse_reference_date(text)
     except Exception:
         blocks = invalid_reference_date_blocks()
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            blocks=blocks,
-            text="Invalid date!",
-        )
+        await reply.ephemeral(blocks=blocks, text="Invalid date!")
         return
 
     db = context["db"]
 
     try:
         service = get_activity_service(db)
-        activities = await list_activities_action(
-            service, channel_id, user_id, reference_date
+        activities = await reply.within_ack_deadline(
+            list_activities_action(service, channel_id, user_id, reference_date)
         )
 
         blocks = activities_list_blocks(activities)
 
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            blocks=blocks,
-            text="Activities:",
-        )
+        await reply.ephemeral(blocks=blocks, text="Activities:")
 
     except Exception as e:
         blocks = error_blocks(str(e))
-        await context.client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            blocks=blocks,
-            text="Error on listing activities",
+        await reply.ephemeral(blocks=blocks, text="Error on listing activities")
+        return
+
+
+@slack_app.command("/leaderboard")
+@bounded_listener(ListenerPriority.HIGH)
+async def handle_leaderboard(
+    ack: Ack, command: dict, context: BoltContext, respond: Respond | None = None
+):
+    reply = CommandReply(ack, respond, command, context)
+    user_id = command.get("user_id")
+    channel_id = command.get("channel_id")
+    text = command.get("text", "")
+    try:
+        reference_date = parse_reference_date(text)
+    except Exception:
+        blocks = invalid_reference_date_blocks()
+        await reply.ephemeral(blocks=blocks, text="Invalid date!")
+        return
+
+    db = context["db"]
+
+    try:
+        service = get_leaderboard_service(db)
+        leaderboard = await reply.within_ack_deadline(
+            leaderboard_action(service, channel_id, user_id, reference_date)
         )
+
+        blocks = leaderboard_blocks(leaderboard)
+
+        await reply.ephemeral(blocks=blocks, text="Leaderboard:")
+
+    except Exception as e:
+        blocks = error_blocks(str(e))
+        await reply.ephemeral(blocks=blocks, text="Error on loading the leaderboard")
         return
 
 
 @slack_app.event("app_mention")
+@bounded_listener(ListenerPriority.HIGH)
 async def handle_app_mention(event: dict, context: BoltContext):
     text = event.get("text", "")
     user_id = event.get("user")
@@ -200,7 +217,12 @@ async def handle_app_mention(event: dict, context: BoltContext):
         )
 
         blocks = activity_registered_blocks(
-            description, activity_date, activity.count_month
+            description,
+            activity_date,
+            activity.count_month,
+            activity.awarded_tiers,
+            activity.current_streak,
+            activity.longest_streak,
         )
         await context.client.chat_postEphemeral(
             channel=channel_id,
@@ -220,6 +242,7 @@ async def handle_app_mention(event: dict, context: BoltContext):
 
 
 @slack_app.event("message")
+@bounded_listener(ListenerPriority.LOW)
 async def handle_message_events(event, context: BoltContext):
     if event.get("channel_type") == "im":
         if event.get("text", "").lower() == "help":
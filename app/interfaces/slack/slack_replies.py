@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from slack_bolt import Ack, BoltContext, Respond
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class CommandReply:
+    """
+    Ephemeral replies for slash commands, cheapest channel first:
+    1. the ack response body, while the command has not been acknowledged;
+    2. the command's response_url, through Bolt's respond();
+    3. chat.postEphemeral, which spends Web API quota.
+    """
+
+    def __init__(
+        self,
+        ack: Ack,
+        respond: Respond | None,
+        command: dict,
+        context: BoltContext,
+    ):
+        self._ack = ack
+        self._respond = respond
+        self.command = command
+        self.context = context
+        self.acknowledged = False
+
+    async def ack(self) -> None:
+        if not self.acknowledged:
+            self.acknowledged = True
+            await self._ack()
+
+    def ack_budget(self) -> float:
+        """
+        Seconds of SLACK_ACK_BUDGET_SECONDS left, counted from when the request
+        was received, so a wait for a listener slot is deducted.
+        """
+        received_at = self.context.get("received_at")
+        if received_at is None:
+            return settings.SLACK_ACK_BUDGET_SECONDS
+        return settings.SLACK_ACK_BUDGET_SECONDS - (time.monotonic() - received_at)
+
+    async def within_ack_deadline(self, work: Awaitable[T]) -> T:
+        """
+        Awaits `work`, acknowledging the command first if it outlasts what is
+        left of SLACK_ACK_BUDGET_SECONDS, so the reply can still go in the ack
+        body whenever the work is fast enough.
+        """
+        task = asyncio.ensure_future(work)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(task), max(self.ack_budget(), 0)
+            )
+        except TimeoutError:
+            await self.ack()
+            return await task
+
+    async def ephemeral(self, blocks: list[dict], text: str) -> None:
+        if not self.acknowledged:
+            self.acknowledged = True
+            await self._ack(blocks=blocks, text=text, response_type="ephemeral")
+            return
+
+        if self._respond is not None and self.command.get("response_url"):
+            await self._respond(
+                blocks=blocks,
+                text=text,
+                response_type="ephemeral",
+                replace_original=False,
+            )
+            return
+
+        await self.context.client.chat_postEphemeral(
+            channel=self.command.get("channel_id"),
+            user=self.command.get("user_id"),
+            blocks=blocks,
+            text=text,
+        )
@@ -3,6 +3,7 @@ from datetime import datetime
 from app.core.config import settings
 from app.models.activity import Activity
 from app.models.program import Program
+from app.schemas.leaderboard_schema import LeaderboardResponse
 
 
 def create_program_success_blocks(
@@ -71,12 +72,17 @@ def create_programs_list_blocks(programs: list[Program]) -> list[dict]:
 
 
 def activity_registered_blocks(
-    description: str, activity_date: str, count_month: int
+    description: str,
+    activity_date: str,
+    count_month: int,
+    awarded_tiers: list[str] | None = None,
+    current_streak: int = 0,
+    longest_streak: int = 0,
 ) -> list[dict]:
     """
     Build blocks for successful activity registration message.
     """
-    return [
+    blocks = [
         {
             "type": "header",
             "text": {
@@ -108,6 +114,33 @@ def activity_registered_blocks(
             },
         },
     ]
+    if current_streak:
+        blocks.append(
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f":fire: *Streak:* {current_streak} day(s) in a row "
+                        f"(best: {longest_streak})"
+                    ),
+                },
+            }
+        )
+    if awarded_tiers:
+        blocks.append(
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        ":trophy: *Goal reached!* "
+                        f"You earned this cycle's {', '.join(awarded_tiers)}."
+                    ),
+                },
+            }
+        )
+    return blocks
 
 
 def invalid_date_blocks() -> list[dict]:
@@ -247,6 +280,68 @@ def activities_list_blocks(activities: list[Activity]) -> list[dict]:
     return blocks
 
 
+def leaderboard_blocks(leaderboard: LeaderboardResponse) -> list[dict]:
+    """
+    Build blocks for a program cycle leaderboard.
+    """
+    medals = {
+        1: ":first_place_medal:",
+        2: ":second_place_medal:",
+        3: ":third_place_medal:",
+    }
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"Leaderboard: {leaderboard.program}",
+                "emoji": True,
+            },
+        },
+        {
+            "type": "context",
+            "elements": [
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        f":calendar: Cycle {leaderboard.cycle_reference} · "
+                        f"{leaderboard.participants} participant(s)"
+                    ),
+                }
+            ],
+        },
+        {"type": "divider"},
+    ]
+
+    if not leaderboard.entries:
+        lines = "No activities recorded in this cycle yet."
+    else:
+        lines = "\n".join(
+            f"{medals.get(entry.rank, f'*{entry.rank}.*')} <@{entry.slack_id}> "
+            f"· {entry.count} activities"
+            for entry in leaderboard.entries
+        )
+    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": lines}})
+
+    if leaderboard.me:
+        blocks.extend(
+            [
+                {"type": "divider"},
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": (
+                            f":bust_in_silhouette: *Your rank:* {leaderboard.me.rank} "
+                            f"with {leaderboard.me.count} activities"
+                        ),
+                    },
+                },
+            ]
+        )
+    return blocks
+
+
 def help_blocks():
     return [
         {
@@ -317,7 +412,10 @@ def help_blocks():
                     "\n\n:calendar: *Filtering*: By default, it shows the "
                     "*current month*. To view a past month, use the `@MM/YYYY` "
                     "format."
-                    "\n\nExample: `/list-activities @12/2025`\n\n"
+                    "\n\nExample: `/list-activities @12/2025`"
+                    "\n\n:trophy: *Ranking*: Use `/leaderboard` in a program "
+                    "channel to see who logged the most activities this cycle, "
+                    "or `/leaderboard @12/2025` for a past one.\n\n"
                 ),
             },
         },
@@ -6,11 +6,16 @@ from fastapi.responses import JSONResponse
 from app.api.achievement_router import router as achievement_router
 from app.api.activity_router import router as activity_router
 from app.api.health import router as health_router
+from app.api.job_router import router as job_router
+from app.api.leaderboard_router import router as leaderboard_router
 from app.api.program_router import router as program_router
 from app.api.slack_router import router as slack_router
 from app.api.user_router import router as user_router
 from app.core.config import settings
 from app.core.database import engine
+from app.core.slack import close_slack_clients, start_slack_clients
+from app.core.slack_executor import slack_listener_executor
+from app.core.write_coalescer import close_write_coalescers
 from app.exceptions.business import (
     BusinessException,
     BusinessRuleViolationError,
@@ -18,12 +23,33 @@ from app.exceptions.business import (
     DuplicateEntityError,
     EntityNotFoundError,
     ExternalServiceError,
+    RequestInProgressError,
 )
+from app.services.display_name_resolver import display_name_resolver
+from app.services.job_handlers import build_job_worker
+from app.services.leaderboard_service import warm_leaderboards
+from app.services.scheduled_jobs import build_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await start_slack_clients()
+    await warm_leaderboards()
+    scheduler = build_scheduler() if settings.SCHEDULER_ENABLED else None
+    if scheduler:
+        scheduler.start()
+    job_worker = build_job_worker() if settings.JOB_WORKER_ENABLED else None
+    if job_worker:
+        job_worker.start()
     yield
+    if scheduler:
+        await scheduler.stop()
+    if job_worker:
+        await job_worker.stop(settings.JOB_WORKER_DRAIN_TIMEOUT_SECONDS)
+    await slack_listener_executor.drain(settings.SLACK_LISTENER_DRAIN_TIMEOUT_SECONDS)
+    await display_name_resolver.close()
+    await close_write_coalescers()
+    await close_slack_clients()
     await engine.dispose()
 
 
@@ -40,6 +66,12 @@ def setup_exception_handlers(app: FastAPI):
             status_code=status.HTTP_409_CONFLICT, content={"detail": exc.message}
         )
 
+    @app.exception_handler(RequestInProgressError)
+    async def request_in_progress_handler(request, exc):
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT, content={"detail": exc.message}
+        )
+
     @app.exception_handler(BusinessRuleViolationError)
     async def business_rule_violation_handler(request, exc):
         return JSONResponse(
@@ -77,8 +109,10 @@ app = FastAPI(
 app.include_router(health_router)
 app.include_router(user_router)
 app.include_router(activity_router)
+app.include_router(leaderboard_router)
 app.include_router(program_router)
 app.include_router(achievement_router)
+app.include_router(job_router)
 app.include_router(slack_router)
 setup_exception_handlers(app)
 
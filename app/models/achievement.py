@@ -5,6 +5,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
+DEFAULT_TIER = "goal"
+DEFAULT_GOAL_TIERS = [{"name": DEFAULT_TIER, "threshold": 12}]
+
 
 class Achievement(Base):
     __tablename__ = "achievements"
@@ -14,6 +17,7 @@ class Achievement(Base):
             'user_id',
             'program_id',
             'cycle_reference',
+            'tier',
             unique=True
         ),
     )
@@ -24,6 +28,7 @@ class Achievement(Base):
     program_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("programs.id"), nullable=False)
     cycle_reference: Mapped[str] = mapped_column(String, nullable=False)
+    tier: Mapped[str] = mapped_column(String, nullable=False, default=DEFAULT_TIER)
     is_notified: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now())
@@ -1,15 +1,25 @@
-import calendar
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import date, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.utils.cycle import cycle_key, cycle_key_of, local_date
 
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_user_cycle", "user_id", "cycle_key"),
+        Index("ix_activities_program_cycle", "program_id", "cycle_key", "user_id"),
+        Index(
+            "ix_activities_user_program_performed_on",
+            "user_id",
+            "program_id",
+            "performed_on",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -21,6 +31,9 @@ class Activity(Base):
     description: Mapped[str] = mapped_column(String, nullable=False)
     evidence_url: Mapped[str] = mapped_column(String, nullable=True)
     performed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # Denormalized from performed_at in America/Sao_Paulo (see app.utils.cycle)
+    performed_on: Mapped[date] = mapped_column(Date, nullable=False)
+    cycle_key: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -28,13 +41,17 @@ class Activity(Base):
     user = relationship("User", back_populates="activities")
     program = relationship("Program", back_populates="activities")
 
-    @classmethod
-    def filter_date_tz(cls, year: int, month: int):
-        start_date = datetime(year, month, 1, 0, 0, 1, 0, ZoneInfo("America/Sao_Paulo"))
+    @validates("performed_at")
+    def _sync_local_calendar(self, key, value):
+        if isinstance(value, datetime):
+            self.performed_on = local_date(value)
+            self.cycle_key = cycle_key_of(value)
+        return value
 
-        last_day = calendar.monthrange(year, month)[1]
-        end_date = datetime(
-            year, month, last_day, 23, 59, 59, 999, ZoneInfo("America/Sao_Paulo")
-        )
+    @classmethod
+    def filter_cycle(cls, year: int, month: int):
+        return cls.cycle_key == cycle_key(year, month)
 
-        return cls.performed_at.between(start_date, end_date)
+    @classmethod
+    def filter_cycle_range(cls, start_key: int, end_key: int):
+        return cls.cycle_key.between(start_key, end_key)
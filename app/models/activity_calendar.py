@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ActivityCalendar(Base):
+    """
+    One bit per local day of `year` on which the user logged an activity in
+    the program (see app.utils.day_bitmap), packed into 46 bytes.
+    """
+
+    __tablename__ = "activity_calendars"
+    __table_args__ = (
+        Index("ix_activity_calendars_program_year", "program_id", "year"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True
+    )
+    program_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("programs.id"), primary_key=True
+    )
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    days: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
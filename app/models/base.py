@@ -1,6 +1,14 @@
 # Import all models here for Alembic to detect them
 from app.models.achievement import Achievement  # noqa: F401
 from app.models.activity import Activity  # noqa: F401
+from app.models.activity_calendar import ActivityCalendar  # noqa: F401
+from app.models.idempotency_key import IdempotencyKey  # noqa: F401
+from app.models.job import Job  # noqa: F401
 from app.models.program import Program  # noqa: F401
+from app.models.program_cycle_user import ProgramCycleUser  # noqa: F401
+from app.models.program_daily_stat import ProgramDailyStat  # noqa: F401
+from app.models.scheduled_job import JobLease, JobRun  # noqa: F401
+from app.models.slack_event import SlackEvent  # noqa: F401
 from app.models.slack_installation import SlackInstallation, SlackState  # noqa: F401
+from app.models.streak import Streak  # noqa: F401
 from app.models.user import User  # noqa: F401
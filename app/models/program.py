@@ -1,10 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy import JSON, DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.achievement import Achievement
+from app.models.achievement import DEFAULT_GOAL_TIERS, Achievement
 from app.models.activity import Activity
 
 
@@ -18,6 +18,8 @@ class Program(Base):
         DateTime(timezone=True), nullable=False)
     end_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=True)
+    goal_tiers: Mapped[list[dict]] = mapped_column(
+        JSON, nullable=False, default=lambda: list(DEFAULT_GOAL_TIERS))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now())
 
@@ -25,3 +27,24 @@ class Program(Base):
         "Activity", back_populates="program")
     achievements: Mapped[list["Achievement"]] = relationship(
         "Achievement", back_populates="program")
+
+    @property
+    def tiers(self) -> list[dict]:
+        """Goal tiers ordered by threshold, lowest first."""
+        return sorted(
+            self.goal_tiers or DEFAULT_GOAL_TIERS, key=lambda tier: tier["threshold"]
+        )
+
+    @property
+    def lowest_goal(self) -> int:
+        return self.tiers[0]["threshold"]
+
+    def tiers_reached(self, activity_count: int) -> list[str]:
+        return [
+            tier["name"] for tier in self.tiers if tier["threshold"] <= activity_count
+        ]
+
+    def tiers_missed(self, activity_count: int) -> list[str]:
+        return [
+            tier["name"] for tier in self.tiers if tier["threshold"] > activity_count
+        ]
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ProgramCycleUser(Base):
+    """
+    Monthly rollup of a program's activities by user, kept next to
+    program_daily_stats. Users active in a cycle are the rows with a
+    positive count, so they are counted without aggregating activities and
+    without racing writes that would decide "first of the month" themselves.
+    """
+
+    __tablename__ = "program_cycle_users"
+
+    program_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("programs.id"), primary_key=True
+    )
+    cycle_key: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True
+    )
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ProgramDailyStat(Base):
+    """
+    Daily rollup of a program's activities by local date. A user logs at
+    most one activity per program and day, so every activity on a day is
+    also a distinct user and both counters move together.
+    """
+
+    __tablename__ = "program_daily_stats"
+
+    program_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("programs.id"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    distinct_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Integer, String, false, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -29,3 +29,7 @@ class SlackState(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     state: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     expire_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Nonces of signed states already used; never a valid state to consume.
+    spent: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
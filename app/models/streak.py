@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Streak(Base):
+    """
+    Running streak state per user and program. The current run is the span
+    of consecutive local days [current_start, last_date], so reading either
+    streak never touches the activities table.
+    """
+
+    __tablename__ = "streaks"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True
+    )
+    program_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("programs.id"), primary_key=True
+    )
+    current_start: Mapped[date] = mapped_column(Date, nullable=False)
+    last_date: Mapped[date] = mapped_column(Date, nullable=False)
+    longest_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    @property
+    def current_length(self) -> int:
+        return (self.last_date - self.current_start).days + 1
@@ -1,8 +1,7 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import exists as sql_exists
-from sqlalchemy import select, update
+from sqlalchemy import Row, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -18,17 +17,6 @@ class AchievementRepository(BaseRepository[Achievement]):
     ):
         super().__init__(session, Achievement)
 
-    async def find_existing_user_ids(
-        self, program_id: int, cycle_reference: str, user_ids: list[int]
-    ) -> set[int]:
-        stmt = select(Achievement.user_id).where(
-            Achievement.program_id == program_id,
-            Achievement.cycle_reference == cycle_reference,
-            Achievement.user_id.in_(user_ids),
-        )
-        result = await self.session.execute(stmt)
-        return set(result.scalars().all())
-
     async def find_pending_notification(
         self, program_id: int, cycle_reference: str
     ) -> list[Achievement]:
@@ -60,20 +48,70 @@ class AchievementRepository(BaseRepository[Achievement]):
         await self.session.commit()
         return result.rowcount
 
-    async def user_has_achievement(
-        self,
-        user_id: int,
-        program_id: int,
-        cycle_reference: str
-    ) -> bool:
+    async def award(
+        self, user_id: int, program_id: int, cycle_reference: str, tiers: list[str]
+    ) -> list[str]:
+        """
+        Creates the achievements for `tiers` that do not exist yet and returns
+        the tiers this call created.
+        """
+        rows = await self.award_many(
+            [
+                {
+                    "user_id": user_id,
+                    "program_id": program_id,
+                    "cycle_reference": cycle_reference,
+                    "tier": tier,
+                }
+                for tier in tiers
+            ]
+        )
+        return [row.tier for row in rows]
+
+    async def award_many(self, rows: list[dict]) -> list[Row]:
+        """
+        Inserts every (user, program, cycle, tier) row in one statement per
+        chunk, skipping the ones already awarded. Returns the created rows.
+        """
+        return await self.bulk_upsert(
+            [{**row, "is_notified": False} for row in rows],
+            conflict_columns=["user_id", "program_id", "cycle_reference", "tier"],
+            update_columns=[],
+            returning=("id", "user_id", "tier"),
+        )
+
+    async def revoke_unnotified(
+        self, user_id: int, program_id: int, cycle_reference: str, tiers: list[str]
+    ) -> int:
+        """Deletes the achievements for `tiers` that have not been announced yet."""
+        if not tiers:
+            return 0
+        stmt = delete(Achievement).where(
+            Achievement.user_id == user_id,
+            Achievement.program_id == program_id,
+            Achievement.cycle_reference == cycle_reference,
+            Achievement.tier.in_(tiers),
+            Achievement.is_notified.is_(False),
+        )
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
 
-        stmt = select(
-            sql_exists().where(
-                Achievement.user_id == user_id,
+    async def find_by_program_and_cycle(
+        self, program_id: int, cycle_reference: str
+    ) -> list[Achievement]:
+        stmt = (
+            select(Achievement)
+            .options(joinedload(Achievement.user))
+            .where(
                 Achievement.program_id == program_id,
                 Achievement.cycle_reference == cycle_reference,
             )
-    )
+            .order_by(Achievement.id)
+        )
         result = await self.session.execute(stmt)
-        return result.scalar()
-
+        return list(result.scalars().unique().all())
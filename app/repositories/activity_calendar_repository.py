@@ -0,0 +1,123 @@
+from datetime import UTC, date, datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.activity_calendar import ActivityCalendar
+from app.repositories.base_repository import BaseRepository
+from app.utils.day_bitmap import from_bytes, to_bytes, with_day
+
+MAX_WRITE_ATTEMPTS = 5
+
+
+class ActivityCalendarRepository(BaseRepository[ActivityCalendar]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, ActivityCalendar)
+
+    async def find(
+        self, user_id: int, program_id: int, year: int
+    ) -> ActivityCalendar | None:
+        stmt = select(ActivityCalendar).where(
+            ActivityCalendar.user_id == user_id,
+            ActivityCalendar.program_id == program_id,
+            ActivityCalendar.year == year,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_by_program_and_year(
+        self, program_id: int, year: int, user_ids: list[int] | None = None
+    ) -> list[ActivityCalendar]:
+        stmt = select(ActivityCalendar).where(
+            ActivityCalendar.program_id == program_id,
+            ActivityCalendar.year == year,
+        )
+        if user_ids is not None:
+            stmt = stmt.where(ActivityCalendar.user_id.in_(user_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def set_day(
+        self, user_id: int, program_id: int, day: date, active: bool
+    ) -> int:
+        """
+        Flips one day's bit with a compare-and-swap on the stored bytes, so
+        concurrent writes for other days of the same year are never lost.
+        Returns the resulting bitmap.
+        """
+        key = (
+            ActivityCalendar.user_id == user_id,
+            ActivityCalendar.program_id == program_id,
+            ActivityCalendar.year == day.year,
+        )
+        try:
+            for _ in range(MAX_WRITE_ATTEMPTS):
+                result = await self.session.execute(
+                    select(ActivityCalendar.days).where(*key)
+                )
+                stored = result.scalar_one_or_none()
+                bitmap = with_day(from_bytes(stored), day, active)
+
+                if stored is None:
+                    inserted = await self._insert_if_missing(
+                        user_id, program_id, day.year, bitmap
+                    )
+                    if inserted:
+                        await self.session.commit()
+                        return bitmap
+                    continue
+
+                if bitmap == from_bytes(stored):
+                    return bitmap
+                result = await self.session.execute(
+                    update(ActivityCalendar)
+                    .where(*key, ActivityCalendar.days == stored)
+                    .values(days=to_bytes(bitmap), updated_at=datetime.now(UTC))
+                )
+                if result.rowcount == 1:
+                    await self.session.commit()
+                    return bitmap
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        raise RuntimeError(
+            f"Activity calendar of user {user_id} for program {program_id} "
+            f"and year {day.year} kept changing, giving up"
+        )
+
+    async def save(self, user_id: int, program_id: int, year: int, bitmap: int) -> None:
+        await self.bulk_upsert(
+            [
+                {
+                    "user_id": user_id,
+                    "program_id": program_id,
+                    "year": year,
+                    "days": to_bytes(bitmap),
+                    "updated_at": datetime.now(UTC),
+                }
+            ],
+            conflict_columns=["user_id", "program_id", "year"],
+            returning=("year",),
+        )
+
+    async def _insert_if_missing(
+        self, user_id: int, program_id: int, year: int, bitmap: int
+    ) -> bool:
+        dialect_insert = self._dialect_insert()
+        stmt = (
+            dialect_insert(ActivityCalendar)
+            .values(
+                user_id=user_id,
+                program_id=program_id,
+                year=year,
+                days=to_bytes(bitmap),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "program_id", "year"])
+            .returning(ActivityCalendar.year)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
@@ -26,7 +26,7 @@ class ActivityRepository(BaseRepository[Activity]):
             .join(Activity.program)
             .where(
                 Activity.user_id == user_id,
-                Activity.filter_date_tz(year, month),
+                Activity.filter_cycle(year, month),
             )
             .options(contains_eager(Activity.user), contains_eager(Activity.program))
         )
@@ -56,47 +56,112 @@ class ActivityRepository(BaseRepository[Activity]):
             .where(
                 Activity.user_id == user_id,
                 Program.slack_channel == slack_channel,
-                Activity.filter_date_tz(year, month),
+                Activity.filter_cycle(year, month),
             )
             .options(contains_eager(Activity.user), contains_eager(Activity.program))
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def count_monthly(self, user_id: int, year: int, month: int) -> int:
+    async def find_by_user_id_and_cycle_range(
+        self,
+        user_id: int,
+        start_key: int,
+        end_key: int,
+        slack_channel: str | None = None,
+    ) -> list[tuple[Activity, int]]:
+        """
+        Returns (activity, activities in its cycle) pairs for every cycle from
+        start_key to end_key, ordered by cycle, in one scan of
+        ix_activities_user_cycle.
+        """
+        cycle_count = func.count(Activity.id).over(partition_by=Activity.cycle_key)
+        stmt = (
+            select(Activity, cycle_count)
+            .join(Activity.user)
+            .join(Activity.program)
+            .where(
+                Activity.user_id == user_id,
+                Activity.filter_cycle_range(start_key, end_key),
+            )
+            .options(contains_eager(Activity.user), contains_eager(Activity.program))
+            .order_by(Activity.cycle_key, Activity.performed_at, Activity.id)
+        )
+        if slack_channel is not None:
+            stmt = stmt.where(Program.slack_channel == slack_channel)
+        result = await self.session.execute(stmt)
+        return [(activity, count) for activity, count in result.all()]
+
+    async def count_in_cycle(
+        self, user_id: int, program_id: int, year: int, month: int
+    ) -> int:
         stmt = select(func.count(Activity.id)).where(
-            Activity.user_id == user_id, Activity.filter_date_tz(year, month)
+            Activity.user_id == user_id,
+            Activity.program_id == program_id,
+            Activity.filter_cycle(year, month),
         )
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
-    async def check_activity_same_day(
+    async def exists_on_day(
         self,
-        program_id: int,
         user_id: int,
-        activity_date: date,
+        program_id: int,
+        day: date,
         exclude_id: int | None = None,
-    ) -> Activity | None:
-        stmt = select(Activity).where(
+    ) -> bool:
+        stmt = select(Activity.id).where(
             Activity.user_id == user_id,
             Activity.program_id == program_id,
-            func.date(Activity.performed_at) == activity_date,
+            Activity.performed_on == day,
         )
         if exclude_id is not None:
             stmt = stmt.where(Activity.id != exclude_id)
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        result = await self.session.execute(stmt.limit(1))
+        return result.first() is not None
 
-    async def find_users_with_completed_program(
-        self, program_id: int, year: int, month: int, goal: int
-    ) -> list[int]:
+    async def count_by_user_in_cycle(
+        self, program_id: int, year: int, month: int, min_count: int
+    ) -> list[tuple[int, int]]:
+        """(user_id, activity count) for users with at least `min_count`."""
         stmt = (
-            select(Activity.user_id)
+            select(Activity.user_id, func.count(Activity.id))
             .where(
-                Activity.program_id == program_id, Activity.filter_date_tz(year, month)
+                Activity.program_id == program_id, Activity.filter_cycle(year, month)
             )
             .group_by(Activity.user_id)
-            .having(func.count(Activity.id) >= goal)
+            .having(func.count(Activity.id) >= min_count)
+        )
+        result = await self.session.execute(stmt)
+        return [(user_id, count) for user_id, count in result.all()]
+
+    async def find_days_between(
+        self, user_id: int, program_id: int, start: date, end: date
+    ) -> set[date]:
+        stmt = select(Activity.performed_on).where(
+            Activity.user_id == user_id,
+            Activity.program_id == program_id,
+            Activity.performed_on.between(start, end),
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def find_last_day_before(
+        self, user_id: int, program_id: int, day: date
+    ) -> date | None:
+        stmt = select(func.max(Activity.performed_on)).where(
+            Activity.user_id == user_id,
+            Activity.program_id == program_id,
+            Activity.performed_on < day,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def find_all_days(self, user_id: int, program_id: int) -> list[date]:
+        stmt = (
+            select(Activity.performed_on)
+            .where(Activity.user_id == user_id, Activity.program_id == program_id)
+            .order_by(Activity.performed_on)
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -1,26 +1,57 @@
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+DEFAULT_CHUNK_SIZE = 500
+
+_UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    if size < 1:
+        raise ValueError("chunk_size must be greater than zero")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class BaseRepository(Generic[ModelType]):
     def __init__(self, session: AsyncSession, model: type[ModelType]):
         self.session = session
         self.model = model
 
-    async def create(self, obj_in: ModelType) -> ModelType:
-        self.session.add(obj_in)
+    @asynccontextmanager
+    async def _transaction(self, commit: bool) -> AsyncIterator[None]:
+        """
+        With `commit`, the writes in the block are their own transaction:
+        committed on success, rolled back on error. Without it they join the
+        caller's transaction, which commits or rolls back as a whole.
+        """
+        if not commit:
+            yield
+            return
         try:
+            yield
             await self.session.commit()
-            await self.session.refresh(obj_in)
         except Exception:
             await self.session.rollback()
             raise
+
+    async def create(self, obj_in: ModelType, commit: bool = True) -> ModelType:
+        self.session.add(obj_in)
+        async with self._transaction(commit):
+            await self.session.flush()
+        await self.session.refresh(obj_in)
         return obj_in
 
     async def get_by_id(self, item_id: int) -> ModelType | None:
@@ -33,23 +64,143 @@ class BaseRepository(Generic[ModelType]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def update(self, obj_in: ModelType) -> ModelType | None:
+    async def update(self, obj_in: ModelType, commit: bool = True) -> ModelType | None:
         self.session.add(obj_in)
-        try:
-            await self.session.commit()
-            await self.session.refresh(obj_in)
-        except Exception:
-            await self.session.rollback()
-            raise
+        async with self._transaction(commit):
+            await self.session.flush()
+        await self.session.refresh(obj_in)
         return obj_in
 
-    async def create_many(self, objs: list[ModelType]) -> list[ModelType]:
+    async def create_many(
+        self, objs: list[ModelType], commit: bool = True
+    ) -> list[ModelType]:
         if not objs:
             return []
         self.session.add_all(objs)
-        try:
-            await self.session.commit()
-            return objs
-        except Exception:
-            await self.session.rollback()
-            raise
+        async with self._transaction(commit):
+            await self.session.flush()
+        return objs
+
+    async def bulk_insert(
+        self,
+        rows: Sequence[dict[str, Any]],
+        returning: Sequence[str] = ("id",),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> list[Row]:
+        """
+        Insert plain dicts with executemany batches of `chunk_size`, skipping the
+        ORM unit of work. All chunks share one transaction and the returned rows
+        follow the order of `rows`. Pass `commit=False` to leave the transaction
+        to the caller.
+        """
+        if not rows:
+            return []
+
+        table = self.model.__table__
+        stmt = insert(table).returning(
+            *(table.c[name] for name in returning), sort_by_parameter_order=True
+        )
+        inserted: list[Row] = []
+        async with self._transaction(commit):
+            for chunk in _chunked(rows, chunk_size):
+                result = await self.session.execute(stmt, list(chunk))
+                inserted.extend(result.all())
+        return inserted
+
+    async def bulk_update(
+        self,
+        rows: Sequence[dict[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> None:
+        """
+        Update rows by primary key. Every dict must carry `id` plus the same set
+        of columns to change. Nothing is returned: executemany row counts are
+        not reliable across drivers (asyncpg reports -1), so callers that need
+        a count should derive it from the rows they submit.
+        """
+        if not rows:
+            return
+
+        table = self.model.__table__
+        columns = [key for key in rows[0] if key != "id"]
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("_pk"))
+            .values({name: bindparam(name) for name in columns})
+        )
+        async with self._transaction(commit):
+            for chunk in _chunked(rows, chunk_size):
+                params = [
+                    {"_pk": row["id"], **{name: row[name] for name in columns}}
+                    for row in chunk
+                ]
+                await self.session.execute(stmt, params)
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        returning: Sequence[str] = ("id",),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> list[Row]:
+        """
+        INSERT ... ON CONFLICT DO UPDATE for PostgreSQL and SQLite. Without
+        `update_columns`, every non-conflict column of the first row is updated;
+        an empty list turns the statement into ON CONFLICT DO NOTHING.
+        """
+        if not rows:
+            return []
+
+        dialect_insert = self._dialect_insert()
+        table = self.model.__table__
+        if update_columns is None:
+            update_columns = [
+                key for key in rows[0] if key not in conflict_columns and key != "id"
+            ]
+
+        stmt = dialect_insert(table)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={name: stmt.excluded[name] for name in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        stmt = stmt.returning(*(table.c[name] for name in returning))
+
+        upserted: list[Row] = []
+        async with self._transaction(commit):
+            for chunk in _chunked(rows, chunk_size):
+                result = await self.session.execute(stmt, list(chunk))
+                upserted.extend(result.all())
+        return upserted
+
+    async def bulk_delete(
+        self,
+        ids: Sequence[int],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> int:
+        if not ids:
+            return 0
+
+        table = self.model.__table__
+        deleted = 0
+        async with self._transaction(commit):
+            for chunk in _chunked(ids, chunk_size):
+                result = await self.session.execute(
+                    delete(table).where(table.c.id.in_(chunk))
+                )
+                deleted += result.rowcount
+        return deleted
+
+    def _dialect_insert(self):
+        dialect = self.session.get_bind().dialect.name
+        dialect_insert = _UPSERT_DIALECTS.get(dialect)
+        if dialect_insert is None:
+            raise NotImplementedError(f"Upsert is not supported for {dialect}")
+        return dialect_insert
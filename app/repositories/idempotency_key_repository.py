@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.base_repository import BaseRepository
+
+
+class IdempotencyKeyRepository(BaseRepository[IdempotencyKey]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, IdempotencyKey)
+
+    async def find_by_key(self, scope: str, key: str) -> IdempotencyKey | None:
+        stmt = select(IdempotencyKey).where(
+            IdempotencyKey.scope == scope, IdempotencyKey.key == key
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def claim(
+        self,
+        scope: str,
+        key: str,
+        request_hash: str,
+        created_at: datetime,
+        locked_until: datetime,
+    ) -> bool:
+        """
+        Inserts a pending record for the key. Returns False when the key is
+        already taken.
+        """
+        rows = await self.bulk_upsert(
+            [
+                {
+                    "scope": scope,
+                    "key": key,
+                    "request_hash": request_hash,
+                    "created_at": created_at,
+                    "locked_until": locked_until,
+                }
+            ],
+            conflict_columns=["scope", "key"],
+            update_columns=[],
+            returning=("key",),
+        )
+        return bool(rows)
+
+    async def take_over(
+        self, scope: str, key: str, now: datetime, locked_until: datetime
+    ) -> bool:
+        """
+        Relocks a pending record whose lock deadline has passed. Returns False
+        when the record completed or is still locked by another request.
+        """
+        stmt = (
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None),
+                or_(
+                    IdempotencyKey.locked_until.is_(None),
+                    IdempotencyKey.locked_until < now,
+                ),
+            )
+            .values(locked_until=locked_until)
+        )
+        return await self._execute_write(stmt) == 1
+
+    async def save_response(
+        self, scope: str, key: str, status_code: int, body: str, headers: str
+    ) -> None:
+        stmt = (
+            update(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .values(
+                status_code=status_code,
+                response_body=body,
+                response_headers=headers,
+                locked_until=None,
+            )
+        )
+        await self._execute_write(stmt)
+
+    async def delete_by_key(self, scope: str, key: str) -> None:
+        await self._execute_write(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.scope == scope, IdempotencyKey.key == key
+            )
+        )
+
+    async def delete_by_key_if_created_before(
+        self, scope: str, key: str, cutoff: datetime
+    ) -> int:
+        stmt = delete(IdempotencyKey).where(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key,
+            IdempotencyKey.created_at < cutoff,
+        )
+        return await self._execute_write(stmt)
+
+    async def purge_created_before(self, cutoff: datetime) -> int:
+        stmt = delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+        return await self._execute_write(stmt)
+
+    async def _execute_write(self, stmt) -> int:
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.scheduled_job import JobLease
+from app.repositories.base_repository import BaseRepository
+
+
+class JobLeaseRepository(BaseRepository[JobLease]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, JobLease)
+
+    async def acquire(
+        self, job_name: str, holder: str, now: datetime, expires_at: datetime
+    ) -> bool:
+        """
+        Takes or extends the lease on `job_name` in one statement. Succeeds when
+        there is no lease yet, it has expired, or `holder` already owns it.
+        """
+        insert = self._dialect_insert()
+        stmt = insert(JobLease).values(
+            job_name=job_name, holder=holder, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_name"],
+            set_={
+                "holder": stmt.excluded.holder,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=or_(JobLease.expires_at < now, JobLease.holder == holder),
+        ).returning(JobLease.job_name)
+        try:
+            result = await self.session.execute(stmt)
+            acquired = result.first() is not None
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return acquired
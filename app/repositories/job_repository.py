@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.job import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, Job
+from app.repositories.base_repository import BaseRepository
+
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, Job)
+
+    async def claim(
+        self, worker_id: str, now: datetime, locked_until: datetime
+    ) -> Job | None:
+        """
+        Atomically moves the next runnable job to running for `worker_id`.
+        Runnable means queued and due, or running under an expired lock (the
+        worker holding it died) with attempts left. PostgreSQL skips rows other
+        workers are claiming with FOR UPDATE SKIP LOCKED; SQLite serializes
+        writers, so a single UPDATE ... WHERE id = (SELECT ...) is atomic there.
+        """
+        runnable = or_(
+            and_(Job.status == JOB_QUEUED, Job.run_after <= now),
+            and_(
+                Job.status == JOB_RUNNING,
+                Job.locked_until < now,
+                Job.attempts < Job.max_attempts,
+            ),
+        )
+        next_id = (
+            select(Job.id).where(runnable).order_by(Job.run_after, Job.id).limit(1)
+        )
+        if self.session.get_bind().dialect.name == "postgresql":
+            next_id = next_id.with_for_update(skip_locked=True)
+            target = await self.session.scalar(next_id)
+            if target is None:
+                await self.session.rollback()
+                return None
+            condition = Job.id == target
+        else:
+            condition = and_(Job.id == next_id.scalar_subquery(), runnable)
+
+        stmt = (
+            update(Job)
+            .where(condition)
+            .values(
+                status=JOB_RUNNING,
+                attempts=Job.attempts + 1,
+                locked_by=worker_id,
+                locked_until=locked_until,
+            )
+            .returning(Job)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            job = result.scalar_one_or_none()
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return job
+
+    async def fail_exhausted(self, now: datetime) -> int:
+        """
+        Fails running jobs whose lock expired on their last attempt, which
+        claim no longer picks up. Returns how many were failed.
+        """
+        stmt = (
+            update(Job)
+            .where(
+                Job.status == JOB_RUNNING,
+                Job.locked_until < now,
+                Job.attempts >= Job.max_attempts,
+            )
+            .values(
+                status=JOB_FAILED,
+                last_error="Lock expired on the last attempt",
+                locked_by=None,
+                locked_until=None,
+                finished_at=now,
+            )
+            .returning(Job.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            failed = len(result.all())
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return failed
+
+    async def report_progress(
+        self, job_id: int, progress: int, detail: str | None = None
+    ) -> None:
+        await self._update(job_id, progress=progress, progress_detail=detail)
+
+    async def extend_lock(self, job_id: int, worker_id: str, locked_until: datetime):
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id)
+            .values(locked_until=locked_until)
+        )
+        await self._execute(stmt)
+
+    async def mark_succeeded(
+        self, job_id: int, worker_id: str, result: str | None, finished_at: datetime
+    ) -> bool:
+        """Returns False when `worker_id` lost the lease and nothing changed."""
+        return await self._update_leased(
+            job_id,
+            worker_id,
+            status=JOB_SUCCEEDED,
+            progress=100,
+            result=result,
+            last_error=None,
+            locked_by=None,
+            locked_until=None,
+            finished_at=finished_at,
+        )
+
+    async def mark_failed(
+        self,
+        job_id: int,
+        worker_id: str,
+        error: str,
+        retry_at: datetime | None,
+        finished_at: datetime,
+    ) -> bool:
+        """Returns False when `worker_id` lost the lease and nothing changed."""
+        if retry_at is not None:
+            return await self._update_leased(
+                job_id,
+                worker_id,
+                status=JOB_QUEUED,
+                run_after=retry_at,
+                last_error=error,
+                locked_by=None,
+                locked_until=None,
+            )
+        return await self._update_leased(
+            job_id,
+            worker_id,
+            status=JOB_FAILED,
+            last_error=error,
+            locked_by=None,
+            locked_until=None,
+            finished_at=finished_at,
+        )
+
+    async def _update(self, job_id: int, **values) -> None:
+        await self._execute(update(Job).where(Job.id == job_id).values(**values))
+
+    async def _update_leased(self, job_id: int, worker_id: str, **values) -> bool:
+        stmt = (
+            update(Job)
+            .where(
+                Job.id == job_id, Job.status == JOB_RUNNING, Job.locked_by == worker_id
+            )
+            .values(**values)
+            .returning(Job.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            updated = result.first() is not None
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return updated
+
+    async def _execute(self, stmt) -> None:
+        try:
+            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.scheduled_job import JobRun
+from app.repositories.base_repository import BaseRepository
+
+
+class JobRunRepository(BaseRepository[JobRun]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, JobRun)
+
+    async def record(self, run: JobRun) -> JobRun:
+        return await self.create(run)
+
+    async def find_last_succeeded(self, job_name: str) -> JobRun | None:
+        stmt = (
+            select(JobRun)
+            .where(JobRun.job_name == job_name, JobRun.status == "succeeded")
+            .order_by(JobRun.started_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def purge_started_before(self, cutoff: datetime) -> int:
+        try:
+            result = await self.session.execute(
+                delete(JobRun).where(JobRun.started_at < cutoff)
+            )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
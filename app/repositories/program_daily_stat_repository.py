@@ -0,0 +1,180 @@
+from datetime import UTC, date, datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import delete, distinct, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.activity import Activity
+from app.models.program_cycle_user import ProgramCycleUser
+from app.models.program_daily_stat import ProgramDailyStat
+from app.repositories.base_repository import BaseRepository
+from app.utils.cycle import cycle_key
+
+
+class ProgramDailyStatRepository(BaseRepository[ProgramDailyStat]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, ProgramDailyStat)
+
+    async def find_between(
+        self, program_id: int, start: date, end: date
+    ) -> list[ProgramDailyStat]:
+        stmt = (
+            select(ProgramDailyStat)
+            .where(
+                ProgramDailyStat.program_id == program_id,
+                ProgramDailyStat.day.between(start, end),
+            )
+            .order_by(ProgramDailyStat.day)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_active_users(self, program_id: int, key: int) -> int:
+        stmt = select(func.count()).where(
+            ProgramCycleUser.program_id == program_id,
+            ProgramCycleUser.cycle_key == key,
+            ProgramCycleUser.activity_count > 0,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def count_members(self, program_id: int) -> int:
+        """Users with at least one activity in the program."""
+        stmt = select(func.count(distinct(ProgramCycleUser.user_id))).where(
+            ProgramCycleUser.program_id == program_id,
+            ProgramCycleUser.activity_count > 0,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def increment(
+        self, program_id: int, user_id: int, day: date, delta: int
+    ) -> None:
+        """
+        Adds `delta` to the day's counters and to the user's count for the
+        day's cycle in one transaction. Both are INSERT ... ON CONFLICT
+        statements, so concurrent writes don't overwrite each other.
+        """
+        dialect_insert = self._dialect_insert()
+        now = datetime.now(UTC)
+
+        daily = ProgramDailyStat.__table__
+        daily_stmt = dialect_insert(daily).values(
+            program_id=program_id,
+            day=day,
+            activity_count=max(delta, 0),
+            distinct_users=max(delta, 0),
+            updated_at=now,
+        )
+        daily_stmt = daily_stmt.on_conflict_do_update(
+            index_elements=["program_id", "day"],
+            set_={
+                "activity_count": daily.c.activity_count + delta,
+                "distinct_users": daily.c.distinct_users + delta,
+                "updated_at": daily_stmt.excluded.updated_at,
+            },
+        )
+
+        cycle = ProgramCycleUser.__table__
+        cycle_stmt = dialect_insert(cycle).values(
+            program_id=program_id,
+            cycle_key=cycle_key(day.year, day.month),
+            user_id=user_id,
+            activity_count=max(delta, 0),
+            updated_at=now,
+        )
+        cycle_stmt = cycle_stmt.on_conflict_do_update(
+            index_elements=["program_id", "cycle_key", "user_id"],
+            set_={
+                "activity_count": cycle.c.activity_count + delta,
+                "updated_at": cycle_stmt.excluded.updated_at,
+            },
+        )
+        try:
+            await self.session.execute(daily_stmt)
+            await self.session.execute(cycle_stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def rebuild_between(self, program_id: int, start: date, end: date) -> int:
+        """
+        Replaces the rollup rows of [start, end] with a fresh aggregate of
+        activities in one transaction. Returns the number of days written.
+        """
+        aggregate = (
+            select(
+                Activity.performed_on,
+                func.count(Activity.id),
+                func.count(distinct(Activity.user_id)),
+            )
+            .where(
+                Activity.program_id == program_id,
+                Activity.performed_on.between(start, end),
+            )
+            .group_by(Activity.performed_on)
+        )
+        try:
+            result = await self.session.execute(aggregate)
+            rows = [
+                {
+                    "program_id": program_id,
+                    "day": day,
+                    "activity_count": activity_count,
+                    "distinct_users": distinct_users,
+                    "updated_at": datetime.now(UTC),
+                }
+                for day, activity_count, distinct_users in result.all()
+            ]
+            await self.session.execute(
+                delete(ProgramDailyStat).where(
+                    ProgramDailyStat.program_id == program_id,
+                    ProgramDailyStat.day.between(start, end),
+                )
+            )
+            if rows:
+                await self.session.execute(insert(ProgramDailyStat.__table__), rows)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return len(rows)
+
+    async def rebuild_cycle(self, program_id: int, key: int) -> int:
+        """
+        Replaces the per-user counts of one cycle with a fresh aggregate of
+        activities in one transaction. Returns the number of users written.
+        """
+        aggregate = (
+            select(Activity.user_id, func.count(Activity.id))
+            .where(Activity.program_id == program_id, Activity.cycle_key == key)
+            .group_by(Activity.user_id)
+        )
+        try:
+            result = await self.session.execute(aggregate)
+            rows = [
+                {
+                    "program_id": program_id,
+                    "cycle_key": key,
+                    "user_id": user_id,
+                    "activity_count": activity_count,
+                    "updated_at": datetime.now(UTC),
+                }
+                for user_id, activity_count in result.all()
+            ]
+            await self.session.execute(
+                delete(ProgramCycleUser).where(
+                    ProgramCycleUser.program_id == program_id,
+                    ProgramCycleUser.cycle_key == key,
+                )
+            )
+            if rows:
+                await self.session.execute(insert(ProgramCycleUser.__table__), rows)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return len(rows)
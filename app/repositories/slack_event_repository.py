@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.slack_event import SlackEvent
+from app.repositories.base_repository import BaseRepository
+
+
+class SlackEventRepository(BaseRepository[SlackEvent]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, SlackEvent)
+
+    async def claim(self, event_id: str, received_at: datetime) -> bool:
+        """
+        Records the event id. Returns False when another delivery of the same
+        event was already recorded.
+        """
+        rows = await self.bulk_upsert(
+            [{"event_id": event_id, "received_at": received_at}],
+            conflict_columns=["event_id"],
+            update_columns=[],
+            returning=("event_id",),
+        )
+        return bool(rows)
+
+    async def purge_received_before(self, cutoff: datetime) -> int:
+        stmt = delete(SlackEvent).where(SlackEvent.received_at < cutoff)
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
@@ -1,12 +1,16 @@
+from typing import Annotated
+
+from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_db
 from app.models.slack_installation import SlackInstallation
 from app.repositories.base_repository import BaseRepository
 
 
 class SlackInstallationRepository(BaseRepository[SlackInstallation]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
         super().__init__(session, SlackInstallation)
 
     async def find_by_team_id(self, team_id: str) -> SlackInstallation | None:
@@ -24,6 +28,17 @@ class SlackInstallationRepository(BaseRepository[SlackInstallation]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def find_latest(self) -> SlackInstallation | None:
+        stmt = (
+            select(SlackInstallation)
+            .order_by(
+                SlackInstallation.installed_at.desc(), SlackInstallation.id.desc()
+            )
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_team_or_enterprise(
         self, team_id: str | None, enterprise_id: str | None
     ) -> SlackInstallation | None:
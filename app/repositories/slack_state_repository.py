@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.slack_installation import SlackState
@@ -10,12 +12,53 @@ class SlackStateRepository(BaseRepository[SlackState]):
         super().__init__(session, SlackState)
 
     async def find_by_state(self, state: str) -> SlackState | None:
-        stmt = select(SlackState).where(SlackState.state == state)
+        stmt = select(SlackState).where(
+            SlackState.state == state, SlackState.spent.is_(False)
+        )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def delete_by_state(self, state: str) -> None:
-        db_state = await self.find_by_state(state)
-        if db_state:
-            await self.session.delete(db_state)
+    async def consume(self, state: str, now: datetime) -> bool:
+        """
+        Deletes the state if it has not expired, in a single statement.
+        Expired states are left for purge_expired, and spent nonces are never
+        consumed.
+        """
+        stmt = (
+            delete(SlackState)
+            .where(
+                SlackState.state == state,
+                SlackState.expire_at > now,
+                SlackState.spent.is_(False),
+            )
+            .returning(SlackState.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            consumed = result.first() is not None
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return consumed
+
+    async def mark_spent(self, state: str, expire_at: datetime) -> bool:
+        """
+        Records a stateless token as used. Returns False if it already was.
+        """
+        rows = await self.bulk_upsert(
+            [{"state": state, "expire_at": expire_at, "spent": True}],
+            conflict_columns=["state"],
+            update_columns=[],
+        )
+        return bool(rows)
+
+    async def purge_expired(self, now: datetime) -> int:
+        stmt = delete(SlackState).where(SlackState.expire_at <= now)
+        try:
+            result = await self.session.execute(stmt)
             await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
@@ -0,0 +1,63 @@
+from datetime import UTC, date, datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.streak import Streak
+from app.repositories.base_repository import BaseRepository
+
+
+class StreakRepository(BaseRepository[Streak]):
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_db)]):
+        super().__init__(session, Streak)
+
+    async def find(self, user_id: int, program_id: int) -> Streak | None:
+        stmt = select(Streak).where(
+            Streak.user_id == user_id, Streak.program_id == program_id
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save(
+        self,
+        user_id: int,
+        program_id: int,
+        current_start: date,
+        last_date: date,
+        longest_length: int,
+    ) -> Streak:
+        await self.bulk_upsert(
+            [
+                {
+                    "user_id": user_id,
+                    "program_id": program_id,
+                    "current_start": current_start,
+                    "last_date": last_date,
+                    "longest_length": longest_length,
+                    "updated_at": datetime.now(UTC),
+                }
+            ],
+            conflict_columns=["user_id", "program_id"],
+            returning=("user_id",),
+        )
+        return Streak(
+            user_id=user_id,
+            program_id=program_id,
+            current_start=current_start,
+            last_date=last_date,
+            longest_length=longest_length,
+        )
+
+    async def delete_for(self, user_id: int, program_id: int) -> None:
+        stmt = delete(Streak).where(
+            Streak.user_id == user_id, Streak.program_id == program_id
+        )
+        try:
+            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
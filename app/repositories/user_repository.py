@@ -1,7 +1,7 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -22,3 +22,49 @@ class UserRepository(BaseRepository[User]):
         stmt = select(User).where(User.id.in_(user_ids))
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def find_all_by_slack_ids(self, slack_ids: list[str]) -> list[User]:
+        stmt = select(User).where(User.slack_id.in_(slack_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_or_create(self, slack_id: str, display_name: str) -> User:
+        """
+        INSERT ... ON CONFLICT (slack_id) DO NOTHING RETURNING, falling back to a
+        select when a concurrent request inserted the user first.
+        """
+        stmt = (
+            self._dialect_insert()(User)
+            .values(slack_id=slack_id, display_name=display_name)
+            .on_conflict_do_nothing(index_elements=[User.slack_id])
+            .returning(User)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            user = result.scalar_one_or_none()
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        if user is not None:
+            return user
+        return await self.find_by_slack_id(slack_id)
+
+    async def update_display_name(
+        self, slack_id: str, display_name: str, placeholder: str | None = None
+    ) -> int:
+        stmt = (
+            update(User)
+            .where(User.slack_id == slack_id)
+            .values(display_name=display_name)
+        )
+        if placeholder is not None:
+            stmt = stmt.where(User.display_name == placeholder)
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
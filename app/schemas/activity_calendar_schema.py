@@ -0,0 +1,26 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class HeatmapResponse(BaseModel):
+    """`bitmap` is hex of the 46 little-endian bytes; bit i is day i + 1."""
+
+    year: int
+    start: date
+    end: date
+    bitmap: str
+    days: list[date]
+    days_active: int
+    longest_gap: int
+
+
+class TeamHeatmapResponse(BaseModel):
+    year: int
+    start: date
+    end: date
+    members: int
+    all_active: list[date]
+    any_active: list[date]
+    days_all_active: int
+    days_any_active: int
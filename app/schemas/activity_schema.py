@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, field_validator
 from app.exceptions.business import BusinessRuleViolationError
 from app.schemas.program_schema import ProgramSimple
 from app.schemas.user_schema import UserBase
+from app.utils.cycle import as_aware
 from app.utils.date_validator import is_within_allowed_window
 
 
@@ -15,8 +16,8 @@ class DateValidation(BaseModel):
         if value is None:
             return value
 
-        if value.tzinfo is not None:
-            value = value.replace(tzinfo=None)
+        # Naive dates are local time; keep the offset of aware ones
+        value = as_aware(value)
 
         if not is_within_allowed_window(value):
             raise BusinessRuleViolationError(
@@ -46,6 +47,10 @@ class ActivityUpdate(ActivityBase, DateValidation):
 class ActivitySummaryResponse(BaseModel):
     id: int
     count_month: int
+    achievement_awarded: bool = False
+    awarded_tiers: list[str] = []
+    current_streak: int = 0
+    longest_streak: int = 0
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -57,3 +62,9 @@ class ActivityResponse(ActivityBase):
     program: ProgramSimple | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ActivityCycleResponse(BaseModel):
+    cycle_reference: str
+    count: int
+    activities: list[ActivityResponse]
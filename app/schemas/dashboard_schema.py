@@ -0,0 +1,28 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class DailyStat(BaseModel):
+    day: date
+    activity_count: int
+    distinct_users: int
+
+
+class CycleSummary(BaseModel):
+    cycle_reference: str
+    total_activities: int
+    active_users: int
+    active_days: int
+    average_daily_users: float
+
+
+class ProgramDashboardResponse(BaseModel):
+    program: str
+    members: int
+    participation_rate: float
+    current: CycleSummary
+    previous: CycleSummary
+    activities_change_pct: float | None = None
+    active_users_change_pct: float | None = None
+    daily: list[DailyStat]
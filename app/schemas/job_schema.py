@@ -0,0 +1,26 @@
+import json
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    progress: int
+    progress_detail: str | None = None
+    result: Any = None
+    last_error: str | None = None
+    created_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def parse_result(cls, value: Any) -> Any:
+        return json.loads(value) if isinstance(value, str) else value
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    slack_id: str
+    display_name: str
+    count: int
+
+
+class LeaderboardResponse(BaseModel):
+    program: str
+    cycle_reference: str
+    participants: int
+    entries: list[LeaderboardEntry]
+    me: LeaderboardEntry | None = None
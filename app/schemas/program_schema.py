@@ -1,6 +1,24 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.models.achievement import DEFAULT_GOAL_TIERS
+
+
+class GoalTier(BaseModel):
+    name: str = Field(min_length=1)
+    threshold: int = Field(gt=0)
+
+
+def _default_goal_tiers() -> list[GoalTier]:
+    return [GoalTier(**tier) for tier in DEFAULT_GOAL_TIERS]
+
+
+# GET /programs/{slack_channel}/{name} is matched after these program views,
+# so a program with one of these names could never be fetched by name.
+RESERVED_PROGRAM_NAMES = frozenset(
+    {"activities", "dashboard", "heatmap", "leaderboard", "streak"}
+)
 
 
 class ProgramBase(BaseModel):
@@ -8,6 +26,23 @@ class ProgramBase(BaseModel):
     slack_channel: str
     start_date: datetime
     end_date: datetime | None = None
+    goal_tiers: list[GoalTier] = Field(default_factory=_default_goal_tiers)
+
+    @field_validator("goal_tiers", mode="before")
+    @classmethod
+    def default_goal_tiers(cls, value):
+        return _default_goal_tiers() if value is None else value
+
+    @field_validator("goal_tiers")
+    @classmethod
+    def validate_goal_tiers(cls, value: list[GoalTier]) -> list[GoalTier]:
+        if not value:
+            raise ValueError("A program needs at least one goal tier")
+        if len({tier.name for tier in value}) != len(value):
+            raise ValueError("Goal tier names must be unique")
+        if len({tier.threshold for tier in value}) != len(value):
+            raise ValueError("Goal tier thresholds must be unique")
+        return sorted(value, key=lambda tier: tier.threshold)
 
 
 class ProgramSimple(BaseModel):
@@ -15,15 +50,25 @@ class ProgramSimple(BaseModel):
     slack_channel: str
 
 
-class ProgramCreate(ProgramBase):
+class NameValidation(BaseModel):
+    @field_validator("name", check_fields=False)
+    @classmethod
+    def validate_name(cls, value: str | None) -> str | None:
+        if value in RESERVED_PROGRAM_NAMES:
+            raise ValueError(f"'{value}' is reserved by the program routes")
+        return value
+
+
+class ProgramCreate(ProgramBase, NameValidation):
     pass
 
 
-class ProgramUpdate(ProgramBase):
+class ProgramUpdate(ProgramBase, NameValidation):
     name: str | None = None
     slack_channel: str | None = None
     start_date: datetime | None = None
     end_date: datetime | None = None
+    goal_tiers: list[GoalTier] | None = None
 
     model_config = ConfigDict(extra='forbid')
 
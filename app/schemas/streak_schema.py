@@ -0,0 +1,10 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class StreakResponse(BaseModel):
+    current_length: int
+    longest_length: int
+    current_start: date | None = None
+    last_date: date | None = None
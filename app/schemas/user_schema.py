@@ -17,3 +17,13 @@ class UserResponse(UserBase):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class SlackDirectorySyncResponse(BaseModel):
+    workspaces: int
+    pages: int
+    members_seen: int
+    users_updated: int
+    failed_workspaces: list[str]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,33 +2,33 @@ import logging
 from typing import Annotated
 
 from fastapi import Depends
+from slack_sdk.web.async_client import AsyncWebClient
+from sqlalchemy import Row
 
-from app.core.slack import slack_app
 from app.exceptions.business import (
     DatabaseError,
     EntityNotFoundError,
     ExternalServiceError,
 )
 from app.models.achievement import Achievement
+from app.models.program import Program
 from app.repositories.achievement_repository import AchievementRepository
 from app.repositories.activity_repository import ActivityRepository
 from app.repositories.program_repository import ProgramRepository
-from app.repositories.user_repository import UserRepository
+from app.repositories.slack_installation_repository import SlackInstallationRepository
 from app.schemas.achievement import (
-    AchievementBatchCreate,
     AchievementBatchResponse,
-    AchievementCreate,
-    AchievementCreateResponse,
     NotifyResponse,
 )
 from app.services.utils.reference_date import ReferenceDate
+from app.services.utils.slack_client import find_bot_client
 
-GOAL_ACTIVITIES = 12
 
-
-async def _send_slack_notification(channel: str, message: str) -> None:
+async def _send_slack_notification(
+    client: AsyncWebClient, channel: str, message: str
+) -> None:
     try:
-        await slack_app.client.chat_postMessage(
+        await client.chat_postMessage(
             channel=channel,
             text=message,
         )
@@ -42,8 +42,9 @@ async def _send_slack_notification(channel: str, message: str) -> None:
 def _build_message(
     achievements: list[Achievement], cycle_reference: str
 ) -> tuple[str, list[str]]:
-    slack_mentions = [f"<@{ach.user.slack_id}>" for ach in achievements]
-    user_names = [ach.user.display_name for ach in achievements]
+    users = list({ach.user.id: ach.user for ach in achievements}.values())
+    slack_mentions = [f"<@{user.slack_id}>" for user in users]
+    user_names = [user.display_name for user in users]
     program_name = achievements[0].program.name
 
     mentions = ", ".join(slack_mentions)
@@ -52,94 +53,34 @@ def _build_message(
         f"no ciclo {cycle_reference}!"
     )
 
+    tiers = _group_by_tier(achievements, lambda ach: f"<@{ach.user.slack_id}>")
+    if len(tiers) > 1:
+        message += "".join(
+            f"\n*{tier}*: {', '.join(mentions)}" for tier, mentions in tiers.items()
+        )
+
     return message, user_names
 
 
+def _group_by_tier(achievements: list[Achievement], label) -> dict[str, list[str]]:
+    tiers: dict[str, list[str]] = {}
+    for achievement in achievements:
+        tiers.setdefault(achievement.tier, []).append(label(achievement))
+    return tiers
+
+
 class AchievementService:
     def __init__(
         self,
         achievement_repo: Annotated[AchievementRepository, Depends()],
-        user_repo: Annotated[UserRepository, Depends()],
         program_repo: Annotated[ProgramRepository, Depends()],
         activity_repo: Annotated[ActivityRepository, Depends()],
+        installation_repo: Annotated[SlackInstallationRepository, Depends()],
     ):
         self.achievement_repo = achievement_repo
-        self.user_repo = user_repo
         self.program_repo = program_repo
         self.activity_repo = activity_repo
-
-    async def create(
-        self,
-        achievement_create: AchievementCreate,
-        program_id: int,
-        user_id: int,
-    ) -> AchievementCreateResponse | None:
-        already_exists = await self.achievement_repo.user_has_achievement(
-            user_id=user_id,
-            program_id=program_id,
-            cycle_reference=achievement_create.cycle_reference
-        )
-
-        if already_exists:
-            logging.info(
-                f"Achievement already exists - "
-                f"user_id={user_id}, program_id={program_id}, "
-                f"cycle={achievement_create.cycle_reference}"
-            )
-            return None
-
-        db_achievement = Achievement(
-            user_id=user_id,
-            program_id=program_id,
-            cycle_reference=achievement_create.cycle_reference,
-        )
-        try:
-            created = await self.achievement_repo.create(db_achievement)
-            logging.info(f"Achievement created for user {user_id}")
-            return created
-        except Exception as e:
-            raise DatabaseError() from e
-
-    async def create_batch(
-        self, achievement_batch: AchievementBatchCreate
-    ) -> AchievementBatchResponse:
-        existing_user_ids = await self.achievement_repo.find_existing_user_ids(
-            program_id=achievement_batch.program_id,
-            cycle_reference=achievement_batch.cycle_reference,
-            user_ids=achievement_batch.user_ids,
-        )
-
-        if existing_user_ids:
-            logging.warning(f"Skipped {len(existing_user_ids)} existing users")
-
-        new_user_ids = [
-            uid for uid in achievement_batch.user_ids if uid not in existing_user_ids
-        ]
-
-        if new_user_ids:
-            db_achievements = [
-                Achievement(
-                    user_id=user_id,
-                    program_id=achievement_batch.program_id,
-                    cycle_reference=achievement_batch.cycle_reference,
-                )
-                for user_id in new_user_ids
-            ]
-            try:
-                await self.achievement_repo.create_many(db_achievements)
-            except Exception as e:
-                raise DatabaseError() from e
-
-        users = []
-        if new_user_ids:
-            users = await self.user_repo.find_all_by_ids(new_user_ids)
-
-        return AchievementBatchResponse(
-            total_created=len(new_user_ids),
-            program_name=achievement_batch.program_name,
-            cycle_reference=achievement_batch.cycle_reference,
-            users=[str(user.display_name) for user in users],
-        )
+        self.installation_repo = installation_repo
 
     async def notify_achievements(
         self,
@@ -162,7 +103,8 @@ class AchievementService:
             )
 
         message, user_names = _build_message(pending, cycle_reference)
-        await _send_slack_notification(program.slack_channel, message)
+        client = await find_bot_client(self.installation_repo)
+        await _send_slack_notification(client, program.slack_channel, message)
         await self.achievement_repo.mark_as_notified([ach.id for ach in pending])
 
         return NotifyResponse(
@@ -172,25 +114,73 @@ class AchievementService:
         )
 
     async def close_cycle(
-        self, program_name: str, cycle_reference: str
+        self, program_name: str, cycle_reference: str, reconcile: bool = False
     ) -> AchievementBatchResponse | None:
+        """
+        Achievements are awarded as activities cross each goal tier, so
+        closing a cycle only confirms what was already awarded. `reconcile`
+        recomputes every tier from the month's activities to backfill awards
+        that were never recorded. `total_created` counts only the awards this
+        call inserted; `users` and `tiers` cover every award of the cycle.
+        """
         program = await self.program_repo.find_by_name(program_name)
         if not program:
             raise EntityNotFoundError("Program", program_name)
 
-        ref = ReferenceDate.from_str(cycle_reference)
-        user_ids = await self.activity_repo.find_users_with_completed_program(
-            program.id, ref.year, ref.month, GOAL_ACTIVITIES
-        )
+        created = []
+        if reconcile:
+            created = await self._reconcile_cycle(program, cycle_reference)
 
-        if not user_ids:
+        achievements = await self.achievement_repo.find_by_program_and_cycle(
+            program.id, cycle_reference
+        )
+        if not achievements:
             return None
 
-        batch = AchievementBatchCreate(
-            user_ids=user_ids,
-            program_id=program.id,
+        users = {ach.user.id: str(ach.user.display_name) for ach in achievements}
+        return AchievementBatchResponse(
+            total_created=len(created),
             program_name=program.name,
             cycle_reference=cycle_reference,
+            users=list(users.values()),
+            tiers=_group_by_tier(
+                achievements, lambda ach: str(ach.user.display_name)
+            ),
         )
 
-        return await self.create_batch(batch)
+    async def _reconcile_cycle(
+        self, program: Program, cycle_reference: str
+    ) -> list[Row]:
+        """
+        One aggregate query returns each user's count at or above the lowest
+        threshold; every tier those counts reach is then inserted in a single
+        bulk write that skips what is already awarded. Returns the inserted
+        rows.
+        """
+        ref = ReferenceDate.from_str(cycle_reference)
+        counts = await self.activity_repo.count_by_user_in_cycle(
+            program.id, ref.year, ref.month, program.lowest_goal
+        )
+        rows = [
+            {
+                "user_id": user_id,
+                "program_id": program.id,
+                "cycle_reference": cycle_reference,
+                "tier": tier,
+            }
+            for user_id, count in counts
+            for tier in program.tiers_reached(count)
+        ]
+        if not rows:
+            return []
+
+        try:
+            created = await self.achievement_repo.award_many(rows)
+        except Exception as e:
+            raise DatabaseError() from e
+        if created:
+            logging.warning(
+                f"Reconciled {len(created)} missing achievements "
+                f"for program {program.name} and cycle {cycle_reference}"
+            )
+        return created
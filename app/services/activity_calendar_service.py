@@ -0,0 +1,135 @@
+from datetime import UTC, date, datetime
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.exceptions.business import BusinessRuleViolationError
+from app.repositories.activity_calendar_repository import ActivityCalendarRepository
+from app.repositories.activity_repository import ActivityRepository
+from app.schemas.activity_calendar_schema import HeatmapResponse, TeamHeatmapResponse
+from app.utils.cycle import local_date
+from app.utils.day_bitmap import (
+    active_days,
+    days_active,
+    from_bytes,
+    from_days,
+    longest_gap,
+    range_mask,
+    to_bytes,
+)
+
+
+class ActivityCalendarService:
+    """
+    Keeps one day bitmap per user, program and year in step with activity
+    writes, and answers heatmap and range queries from the bitmaps alone.
+    """
+
+    def __init__(
+        self,
+        calendar_repo: Annotated[ActivityCalendarRepository, Depends()],
+        activity_repo: Annotated[ActivityRepository, Depends()],
+    ):
+        self.calendar_repo = calendar_repo
+        self.activity_repo = activity_repo
+
+    async def record_day(self, user_id: int, program_id: int, day: date) -> None:
+        await self.calendar_repo.set_day(user_id, program_id, day, active=True)
+
+    async def remove_day(self, user_id: int, program_id: int, day: date) -> None:
+        await self.calendar_repo.set_day(user_id, program_id, day, active=False)
+
+    async def move_day(
+        self, user_id: int, program_id: int, old_day: date, new_day: date
+    ) -> None:
+        if old_day == new_day:
+            return
+        await self.remove_day(user_id, program_id, old_day)
+        await self.record_day(user_id, program_id, new_day)
+
+    async def rebuild(self, user_id: int, program_id: int, year: int) -> int:
+        """Recomputes a year's bitmap from the activities table."""
+        days = await self.activity_repo.find_days_between(
+            user_id, program_id, date(year, 1, 1), date(year, 12, 31)
+        )
+        bitmap = from_days(days)
+        await self.calendar_repo.save(user_id, program_id, year, bitmap)
+        return bitmap
+
+    async def heatmap(
+        self,
+        user_id: int,
+        program_id: int,
+        year: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> HeatmapResponse:
+        start, end = self._range(year, start, end)
+        calendar = await self.calendar_repo.find(user_id, program_id, year)
+        mask = range_mask(year, start, end)
+        bitmap = from_bytes(calendar.days if calendar else None) & mask
+
+        return HeatmapResponse(
+            year=year,
+            start=start,
+            end=end,
+            bitmap=to_bytes(bitmap).hex(),
+            days=active_days(bitmap, year),
+            days_active=days_active(bitmap, mask),
+            longest_gap=longest_gap(bitmap, mask),
+        )
+
+    async def team_heatmap(
+        self,
+        program_id: int,
+        year: int,
+        user_ids: list[int] | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> TeamHeatmapResponse:
+        """
+        Days on which every member was active (AND of their bitmaps) and on
+        which at least one was (OR). Without `user_ids`, the team is everyone
+        with a calendar in the program and year.
+        """
+        start, end = self._range(year, start, end)
+        calendars = await self.calendar_repo.find_by_program_and_year(
+            program_id, year, user_ids
+        )
+        mask = range_mask(year, start, end)
+        bitmaps = {
+            calendar.user_id: from_bytes(calendar.days) for calendar in calendars
+        }
+        members = len(user_ids) if user_ids is not None else len(bitmaps)
+
+        any_active = 0
+        for bitmap in bitmaps.values():
+            any_active |= bitmap
+        all_active = mask if members and len(bitmaps) == members else 0
+        for bitmap in bitmaps.values():
+            all_active &= bitmap
+        any_active &= mask
+
+        return TeamHeatmapResponse(
+            year=year,
+            start=start,
+            end=end,
+            members=members,
+            all_active=active_days(all_active, year),
+            any_active=active_days(any_active, year),
+            days_all_active=days_active(all_active, mask),
+            days_any_active=days_active(any_active, mask),
+        )
+
+    def _range(
+        self, year: int, start: date | None, end: date | None
+    ) -> tuple[date, date]:
+        """Defaults to the whole year, up to today for the current year."""
+        today = local_date(datetime.now(UTC))
+        start = start or date(year, 1, 1)
+        end = end or min(date(year, 12, 31), max(today, start))
+        if start.year != year or end.year != year or start > end:
+            raise BusinessRuleViolationError(
+                f"The range must be an ordered pair of dates within {year}."
+            )
+        return start, end
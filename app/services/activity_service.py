@@ -1,32 +1,72 @@
 import logging
-from datetime import datetime
+from datetime import UTC, date, datetime
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import ConcurrentReads, get_concurrent_reads, get_db
+from app.core.job_queue import enqueue_job
+from app.core.write_coalescer import WriteCoalescer, get_activity_write_coalescer
 from app.exceptions.business import (
     BusinessRuleViolationError,
     DatabaseError,
     EntityNotFoundError,
 )
-from app.models.achievement import Achievement
 from app.models.activity import Activity
+from app.models.program import Program
 from app.repositories.achievement_repository import AchievementRepository
 from app.repositories.activity_repository import ActivityRepository
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
+from app.repositories.program_repository import ProgramRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.activity_calendar_schema import HeatmapResponse, TeamHeatmapResponse
 from app.schemas.activity_schema import (
     ActivityCreate,
+    ActivityCycleResponse,
+    ActivityResponse,
     ActivitySummaryResponse,
     ActivityUpdate,
 )
+from app.schemas.streak_schema import StreakResponse
 from app.schemas.user_schema import UserCreate
+from app.services.activity_calendar_service import ActivityCalendarService
+from app.services.display_name_resolver import display_name_resolver
+from app.services.leaderboard_service import leaderboard_cache
 from app.services.program_service import ProgramService
+from app.services.streak_service import StreakService, to_streak_response
 from app.services.user_service import UserService
 from app.services.utils.reference_date import ReferenceDate
+from app.utils.cycle import (
+    as_aware,
+    cycle_key_of,
+    cycle_reference,
+    cycle_reference_of,
+    local_date,
+    to_local,
+)
 from app.utils.date_validator import is_within_allowed_window
 
-GOAL_ACTIVITIES = 12
+AWARD_ACHIEVEMENT_JOB = "award_achievement"
+RECOMPUTE_STREAK_JOB = "recompute_streak"
+REBUILD_CALENDAR_JOB = "rebuild_calendar"
+REBUILD_DAILY_STATS_JOB = "rebuild_daily_stats"
+
+SAME_DAY_CONSTRAINT = "ix_activities_user_program_performed_on"
+MAX_HISTORY_CYCLES = 24
+
+
+def _violated_constraint(error: IntegrityError) -> str | None:
+    """
+    The constraint the driver blames: asyncpg's error is chained under
+    SQLAlchemy's adapter, psycopg exposes it on `diag`. SQLite names none.
+    """
+    for source in (error.orig.__cause__, getattr(error.orig, "diag", None)):
+        name = getattr(source, "constraint_name", None)
+        if name:
+            return name
+    return None
 
 
 class ActivityService:
@@ -37,12 +77,26 @@ class ActivityService:
         program_service: Annotated[ProgramService, Depends()],
         activity_repo: Annotated[ActivityRepository, Depends()],
         achievement_repo: Annotated[AchievementRepository, Depends()],
+        calendar_service: Annotated[ActivityCalendarService, Depends()],
+        streak_service: Annotated[StreakService, Depends()],
+        daily_stats_repo: Annotated[ProgramDailyStatRepository, Depends()],
+        concurrent_reads: Annotated[
+            ConcurrentReads | None, Depends(get_concurrent_reads)
+        ] = None,
+        write_coalescer: Annotated[
+            WriteCoalescer | None, Depends(get_activity_write_coalescer)
+        ] = None,
     ):
         self.db = db
         self.user_service = user_service
         self.program_service = program_service
         self.activity_repo = activity_repo
         self.achievement_repo = achievement_repo
+        self.calendar_service = calendar_service
+        self.streak_service = streak_service
+        self.daily_stats_repo = daily_stats_repo
+        self.concurrent_reads = concurrent_reads
+        self.write_coalescer = write_coalescer
 
     async def create(
         self,
@@ -50,23 +104,17 @@ class ActivityService:
         program_slack_channel: str,
         slack_id: str,
     ) -> ActivitySummaryResponse:
-        user_id = await self._validate_user(slack_id)
-        program_found = await self._validate_program_by_slack_channel(
-            program_slack_channel
+        user_found, programs_found = await self._find_user_and_programs(
+            slack_id, program_slack_channel
+        )
+        user_id = await self._validate_user(slack_id, user_found)
+        program_found = self._validate_program_by_slack_channel(
+            program_slack_channel, programs_found
         )
         performed_at = self._validate_performed_at(
             program_found, activity_create.performed_at
         )
 
-        existing_activity = await self.activity_repo.check_activity_same_day(
-            program_found.id, user_id, performed_at.date()
-        )
-        if existing_activity:
-            raise BusinessRuleViolationError(
-                "An activity is already registered for the "
-                f"user on this date ({performed_at.date()})."
-            )
-
         db_activity = Activity(
             user_id=user_id,
             program_id=program_found.id,
@@ -75,24 +123,47 @@ class ActivityService:
             performed_at=performed_at,
         )
 
+        # A rollback expires the loaded objects, so read these before
+        program_id, performed_on = program_found.id, db_activity.performed_on
+
+        write_started = leaderboard_cache.begin()
         try:
-            await self.activity_repo.create(db_activity)
+            await self._insert_activity(db_activity)
+        except IntegrityError as e:
+            await self._raise_if_same_day_violation(
+                e, user_id, program_id, performed_on
+            )
+            raise DatabaseError() from e
         except Exception as e:
             raise DatabaseError() from e
-
-        total_month = await self.activity_repo.count_monthly(
-            user_id=user_id,
-            year=db_activity.performed_at.year,
-            month=db_activity.performed_at.month,
+        leaderboard_cache.record(
+            program_found.id, db_activity.cycle_key, user_id, 1, write_started
         )
 
-        is_prev = self._is_previous_month(performed_at, datetime.now())
-        if is_prev and (total_month >= GOAL_ACTIVITIES):
-            await self._generate_retroactive_achievement(
-                user_id, program_found.id, program_found, performed_at
-            )
+        total_cycle = await self._count_in_cycle(
+            user_id, program_found, db_activity.performed_at
+        )
+        awarded_tiers = await self._award_if_goal_reached(
+            user_id, program_found, db_activity.performed_at, total_cycle
+        )
+        await self._track_daily_stats(
+            program_found.id, user_id, new_day=db_activity.performed_on
+        )
+        await self._track_calendar(
+            user_id, program_found.id, new_day=db_activity.performed_on
+        )
+        streak = await self._track_streak(
+            user_id, program_found.id, new_day=db_activity.performed_on
+        )
 
-        return ActivitySummaryResponse(id=db_activity.id, count_month=total_month)
+        return ActivitySummaryResponse(
+            id=db_activity.id,
+            count_month=total_cycle,
+            achievement_awarded=bool(awarded_tiers),
+            awarded_tiers=awarded_tiers,
+            current_streak=streak.current_length,
+            longest_streak=streak.longest_length,
+        )
 
     async def update(
         self,
@@ -117,34 +188,85 @@ class ActivityService:
             activity_update.performed_at is not None
             and activity_update.performed_at != db_activity.performed_at
         ):
-            self._validate_performed_at(program_found, activity_update.performed_at)
-            existing_activity = await self.activity_repo.check_activity_same_day(
-                program_found.id, user_id, activity_update.performed_at.date(), id
+            activity_update.performed_at = self._validate_performed_at(
+                program_found, activity_update.performed_at
             )
-            if existing_activity:
-                raise BusinessRuleViolationError(
-                    f"An activity is already registered for the user "
-                    f"on this date ({activity_update.performed_at.date()})."
-                )
 
+        previous_performed_at = db_activity.performed_at
+        previous_performed_on = db_activity.performed_on
+        previous_cycle_key = db_activity.cycle_key
         update_data = activity_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_activity, key, value)
+        # Read before committing: a rollback expires the loaded objects
+        program_id, performed_on = db_activity.program_id, db_activity.performed_on
 
+        write_started = leaderboard_cache.begin()
         try:
             await self.db.commit()
             await self.db.refresh(db_activity)
+        except IntegrityError as e:
+            await self.db.rollback()
+            await self._raise_if_same_day_violation(
+                e, user_id, program_id, performed_on, exclude_id=id
+            )
+            raise DatabaseError() from e
         except Exception as e:
             await self.db.rollback()
             raise DatabaseError() from e
 
-        total_month = await self.activity_repo.count_monthly(
-            user_id=user_id,
-            year=db_activity.performed_at.year,
-            month=db_activity.performed_at.month,
+        if previous_cycle_key != db_activity.cycle_key:
+            leaderboard_cache.record(
+                program_found.id, previous_cycle_key, user_id, -1, write_started
+            )
+            leaderboard_cache.record(
+                program_found.id, db_activity.cycle_key, user_id, 1, write_started
+            )
+
+        total_cycle = await self._count_in_cycle(
+            user_id, program_found, db_activity.performed_at
         )
+        awarded_tiers = []
+        if cycle_reference_of(previous_performed_at) != cycle_reference_of(
+            db_activity.performed_at
+        ):
+            await self._revoke_if_below_goal(
+                user_id, program_found, previous_performed_at
+            )
+            awarded_tiers = await self._award_if_goal_reached(
+                user_id, program_found, db_activity.performed_at, total_cycle
+            )
 
-        return ActivitySummaryResponse(id=db_activity.id, count_month=total_month)
+        if previous_performed_on != db_activity.performed_on:
+            await self._track_daily_stats(
+                program_found.id,
+                user_id,
+                old_day=previous_performed_on,
+                new_day=db_activity.performed_on,
+            )
+            await self._track_calendar(
+                user_id,
+                program_found.id,
+                old_day=previous_performed_on,
+                new_day=db_activity.performed_on,
+            )
+            streak = await self._track_streak(
+                user_id,
+                program_found.id,
+                old_day=previous_performed_on,
+                new_day=db_activity.performed_on,
+            )
+        else:
+            streak = await self.streak_service.find(user_id, program_found.id)
+
+        return ActivitySummaryResponse(
+            id=db_activity.id,
+            count_month=total_cycle,
+            achievement_awarded=bool(awarded_tiers),
+            awarded_tiers=awarded_tiers,
+            current_streak=streak.current_length,
+            longest_streak=streak.longest_length,
+        )
 
     async def delete(self, id: int, slack_id: str) -> None:
         activity = await self.activity_repo.find_by_id_and_slack_id(id, slack_id)
@@ -156,6 +278,7 @@ class ActivityService:
                 "Activities can only be deleted within the current or previous month."
             )
 
+        write_started = leaderboard_cache.begin()
         try:
             await self.db.delete(activity)
             await self.db.commit()
@@ -163,6 +286,28 @@ class ActivityService:
             await self.db.rollback()
             raise DatabaseError() from e
 
+        leaderboard_cache.record(
+            activity.program_id,
+            activity.cycle_key,
+            activity.user_id,
+            -1,
+            write_started,
+        )
+        program_found = await self.program_service.find_by_id(activity.program_id)
+        if program_found:
+            await self._revoke_if_below_goal(
+                activity.user_id, program_found, activity.performed_at
+            )
+        await self._track_daily_stats(
+            activity.program_id, activity.user_id, old_day=activity.performed_on
+        )
+        await self._track_calendar(
+            activity.user_id, activity.program_id, old_day=activity.performed_on
+        )
+        await self._track_streak(
+            activity.user_id, activity.program_id, old_day=activity.performed_on
+        )
+
     async def find_by_id(self, id: int, slack_id: str) -> Activity:
         activity = await self.activity_repo.find_by_id_and_slack_id(id, slack_id)
         if not activity:
@@ -191,36 +336,180 @@ class ActivityService:
             user_found.id, program_slack_channel, ref.year, ref.month
         )
 
-    async def find_all_user_by_program_completed(
-        self, program_name: str, cycle_reference: str
-    ) -> list[int]:
-        program_found = await self.program_service.find_by_name(program_name)
-        if not program_found:
-            raise EntityNotFoundError("Program", program_name)
+    async def find_history_by_user(
+        self, slack_id: str, from_cycle: str, to_cycle: str | None = None
+    ) -> list[ActivityCycleResponse]:
+        user_found = await self.user_service.find_by_slack_id(slack_id)
+        if not user_found:
+            raise EntityNotFoundError("User", slack_id)
+
+        return await self._find_history(user_found.id, from_cycle, to_cycle)
+
+    async def find_history_by_user_and_program(
+        self,
+        program_slack_channel: str,
+        slack_id: str,
+        from_cycle: str,
+        to_cycle: str | None = None,
+    ) -> list[ActivityCycleResponse]:
+        user_found = await self.user_service.find_by_slack_id(slack_id)
+        if not user_found:
+            raise EntityNotFoundError("User", slack_id)
+
+        return await self._find_history(
+            user_found.id, from_cycle, to_cycle, program_slack_channel
+        )
+
+    async def _find_history(
+        self,
+        user_id: int,
+        from_cycle: str,
+        to_cycle: str | None,
+        slack_channel: str | None = None,
+    ) -> list[ActivityCycleResponse]:
+        """
+        Activities from `from_cycle` to `to_cycle` (defaults to the current
+        cycle), grouped by cycle, oldest first. Cycles without activities are
+        listed with a zero count.
+        """
+        start_key = ReferenceDate.from_str(from_cycle).cycle_key
+        end_key = (
+            ReferenceDate.from_str(to_cycle).cycle_key
+            if to_cycle
+            else cycle_key_of(datetime.now(UTC))
+        )
+        if start_key > end_key:
+            raise BusinessRuleViolationError("'from' must not be after 'to'.")
+        if end_key - start_key >= MAX_HISTORY_CYCLES:
+            raise BusinessRuleViolationError(
+                f"The range must span at most {MAX_HISTORY_CYCLES} cycles."
+            )
 
-        ref = ReferenceDate.from_str(cycle_reference)
-        return await self.activity_repo.find_users_with_completed_program(
-            program_found.id, ref.year, ref.month, GOAL_ACTIVITIES
+        rows = await self.activity_repo.find_by_user_id_and_cycle_range(
+            user_id, start_key, end_key, slack_channel
         )
+        groups = {
+            key: ActivityCycleResponse(
+                cycle_reference=cycle_reference(key), count=0, activities=[]
+            )
+            for key in range(start_key, end_key + 1)
+        }
+        for activity, count in rows:
+            group = groups[activity.cycle_key]
+            group.count = count
+            group.activities.append(
+                ActivityResponse.model_validate(activity, from_attributes=True)
+            )
+        return list(groups.values())
 
-    async def _validate_user(self, slack_id: str) -> int:
+    async def find_streak(
+        self, program_slack_channel: str, slack_id: str
+    ) -> StreakResponse:
+        user_found = await self.user_service.find_by_slack_id(slack_id)
+        if not user_found:
+            raise EntityNotFoundError("User", slack_id)
+
+        program_found = await self._find_program_by_slack_channel(program_slack_channel)
+        return await self.streak_service.find(user_found.id, program_found.id)
+
+    async def find_heatmap(
+        self,
+        program_slack_channel: str,
+        slack_id: str,
+        year: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> HeatmapResponse:
         user_found = await self.user_service.find_by_slack_id(slack_id)
+        if not user_found:
+            raise EntityNotFoundError("User", slack_id)
+
+        program_found = await self._find_program_by_slack_channel(program_slack_channel)
+        return await self.calendar_service.heatmap(
+            user_found.id, program_found.id, year or self._current_year(), start, end
+        )
+
+    async def find_team_heatmap(
+        self,
+        program_slack_channel: str,
+        year: int | None = None,
+        slack_ids: list[str] | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> TeamHeatmapResponse:
+        program_found = await self._find_program_by_slack_channel(program_slack_channel)
+
+        user_ids = None
+        if slack_ids:
+            users_found = await self.user_service.find_all_by_slack_ids(slack_ids)
+            missing = set(slack_ids) - {user.slack_id for user in users_found}
+            if missing:
+                raise EntityNotFoundError("User", ", ".join(sorted(missing)))
+            user_ids = [user.id for user in users_found]
+
+        return await self.calendar_service.team_heatmap(
+            program_found.id, year or self._current_year(), user_ids, start, end
+        )
+
+    async def _find_user_and_programs(self, slack_id: str, program_slack_channel: str):
+        if self.concurrent_reads is None:
+            user_found = await self.user_service.find_by_slack_id(slack_id)
+            programs_found = await self.program_service.find_by_slack_channel(
+                program_slack_channel
+            )
+            return user_found, programs_found
+
+        return await self.concurrent_reads.gather(
+            lambda session: UserRepository(session).find_by_slack_id(slack_id),
+            lambda session: ProgramRepository(session).find_by_slack_channel(
+                program_slack_channel
+            ),
+        )
+
+    async def _insert_activity(self, db_activity: Activity) -> None:
+        if self.write_coalescer is None:
+            await self.activity_repo.create(db_activity)
+            return
+
+        db_activity.id = await self.write_coalescer.submit(
+            {
+                "user_id": db_activity.user_id,
+                "program_id": db_activity.program_id,
+                "description": db_activity.description,
+                "evidence_url": db_activity.evidence_url,
+                "performed_at": db_activity.performed_at,
+                "performed_on": db_activity.performed_on,
+                "cycle_key": db_activity.cycle_key,
+            }
+        )
+
+    async def _validate_user(self, slack_id: str, user_found) -> int:
         if user_found:
             return user_found.id
-        else:
-            try:
-                display_name = await self.user_service.get_slack_display_name(slack_id)
-            except Exception:
-                display_name = slack_id
-            new_user = await self.user_service.create(
-                UserCreate(slack_id=slack_id, display_name=display_name)
-            )
-            return new_user.id
 
-    async def _validate_program_by_slack_channel(self, program_slack_channel: str):
-        program_found = await self.program_service.find_by_slack_channel(
+        # The Slack id is a placeholder until the real name is resolved
+        new_user = await self.user_service.get_or_create(
+            UserCreate(slack_id=slack_id, display_name=slack_id)
+        )
+        display_name_resolver.schedule(slack_id)
+        return new_user.id
+
+    def _current_year(self) -> int:
+        return local_date(datetime.now(UTC)).year
+
+    async def _find_program_by_slack_channel(
+        self, program_slack_channel: str
+    ) -> Program:
+        programs_found = await self.program_service.find_by_slack_channel(
             program_slack_channel
         )
+        return self._validate_program_by_slack_channel(
+            program_slack_channel, programs_found
+        )
+
+    def _validate_program_by_slack_channel(
+        self, program_slack_channel: str, program_found: list
+    ):
         if not program_found:
             raise EntityNotFoundError("Program", program_slack_channel)
 
@@ -237,66 +526,208 @@ class ActivityService:
     def _validate_performed_at(
         self, program_found, performed_at: datetime | None
     ) -> datetime:
-        if not performed_at:
-            performed_at = datetime.now()
+        """
+        Defaults to now and returns an aware datetime. Naive input, like the
+        program's naive dates, is local time, as in to_local.
+        """
+        performed_at = as_aware(performed_at) if performed_at else datetime.now(UTC)
 
-        if performed_at > datetime.now():
+        if performed_at > datetime.now(UTC):
             raise BusinessRuleViolationError("Activity date cannot be in the future")
 
-        start_date = program_found.start_date
-        if performed_at.tzinfo is None and start_date.tzinfo is not None:
-            performed_at = performed_at.replace(tzinfo=start_date.tzinfo)
-        elif performed_at.tzinfo is not None and start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=performed_at.tzinfo)
-
-        if performed_at < start_date:
+        if performed_at < as_aware(program_found.start_date) or (
+            program_found.end_date and performed_at > as_aware(program_found.end_date)
+        ):
             raise BusinessRuleViolationError(
                 "Activity date is outside the program date range"
             )
 
-        if program_found.end_date:
-            end_date = program_found.end_date
-            if performed_at.tzinfo is None and end_date.tzinfo is not None:
-                performed_at = performed_at.replace(tzinfo=end_date.tzinfo)
-            elif performed_at.tzinfo is not None and end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=performed_at.tzinfo)
-
-            if performed_at > end_date:
-                raise BusinessRuleViolationError(
-                    "Activity date is outside the program date range"
-                )
-
         return performed_at
 
-    async def _generate_retroactive_achievement(
-        self, user_id: int, program_id: int, program, performed_at: datetime
+    async def _raise_if_same_day_violation(
+        self,
+        error: IntegrityError,
+        user_id: int,
+        program_id: int,
+        performed_on: date,
+        exclude_id: int | None = None,
     ) -> None:
-        try:
-            cycle_reference = f"{performed_at.year}-{performed_at.month:02d}"
+        constraint = _violated_constraint(error)
+        if constraint is None:
+            # No constraint name to go by: look for the activity on that day
+            violated = await self.activity_repo.exists_on_day(
+                user_id, program_id, performed_on, exclude_id=exclude_id
+            )
+        else:
+            violated = constraint == SAME_DAY_CONSTRAINT
+        if violated:
+            raise BusinessRuleViolationError(
+                "An activity is already registered for the "
+                f"user on this date ({performed_on})."
+            ) from None
+
+    async def _count_in_cycle(
+        self, user_id: int, program: Program, performed_at: datetime
+    ) -> int:
+        local = to_local(performed_at)
+        return await self.activity_repo.count_in_cycle(
+            user_id, program.id, local.year, local.month
+        )
 
-            already_exists = await self.achievement_repo.user_has_achievement(
-                user_id=user_id,
-                program_id=program_id,
-                cycle_reference=cycle_reference,
+    async def _award_if_goal_reached(
+        self, user_id: int, program: Program, performed_at: datetime, total: int
+    ) -> list[str]:
+        """
+        Awards each goal tier of the cycle as soon as the user's activity
+        count in the program, `total`, reaches its threshold. Returns the
+        tiers this call awarded. A failed award is retried by the job worker
+        instead of being lost.
+        """
+        tiers = program.tiers_reached(total)
+        if not tiers:
+            return []
+
+        cycle_reference = cycle_reference_of(performed_at)
+        try:
+            return await self.achievement_repo.award(
+                user_id, program.id, cycle_reference, tiers
+            )
+        except Exception as e:
+            logging.warning(
+                f"Failed to award {tiers} to user {user_id} "
+                f"for program {program.name} and cycle {cycle_reference}, "
+                f"retrying in the background: {e}"
             )
-            if already_exists:
-                return
+            await self._enqueue_award(user_id, program.id, cycle_reference, tiers)
+            return []
 
-            db_achievement = Achievement(
-                user_id=user_id,
-                program_id=program_id,
-                cycle_reference=cycle_reference,
+    async def _revoke_if_below_goal(
+        self, user_id: int, program: Program, performed_at: datetime
+    ) -> None:
+        """Takes back unannounced tiers whose threshold is no longer met."""
+        total = await self._count_in_cycle(user_id, program, performed_at)
+        tiers = program.tiers_missed(total)
+        if not tiers:
+            return
+
+        cycle_reference = cycle_reference_of(performed_at)
+        try:
+            await self.achievement_repo.revoke_unnotified(
+                user_id, program.id, cycle_reference, tiers
             )
-            await self.achievement_repo.create(db_achievement)
         except Exception as e:
             logging.error(
-                f"Failed to create retroactive achievement for user {user_id} "
+                f"Failed to revoke {tiers} of user {user_id} "
                 f"for program {program.name} and cycle {cycle_reference}: {e}"
             )
 
-    def _is_previous_month(
-        self, activity_date: datetime, current_date: datetime
-    ) -> bool:
-        return (activity_date.year * 12 + activity_date.month) == (
-            current_date.year * 12 + current_date.month - 1
+    async def _track_streak(
+        self,
+        user_id: int,
+        program_id: int,
+        old_day: date | None = None,
+        new_day: date | None = None,
+    ) -> StreakResponse:
+        """
+        Moves the user's streak state along with the activity day that was
+        added, moved or removed. A failed update is repaired by a background
+        recompute instead of leaving the state stale.
+        """
+        try:
+            if old_day is None:
+                streak = await self.streak_service.record_day(
+                    user_id, program_id, new_day
+                )
+            elif new_day is None:
+                streak = await self.streak_service.remove_day(
+                    user_id, program_id, old_day
+                )
+            else:
+                streak = await self.streak_service.move_day(
+                    user_id, program_id, old_day, new_day
+                )
+        except Exception as e:
+            logging.warning(
+                f"Failed to update the streak of user {user_id} "
+                f"for program {program_id}, recomputing in the background: {e}"
+            )
+            await self._enqueue(
+                RECOMPUTE_STREAK_JOB, {"user_id": user_id, "program_id": program_id}
+            )
+            return to_streak_response(None, local_date(datetime.now(UTC)))
+
+        return to_streak_response(streak, local_date(datetime.now(UTC)))
+
+    async def _track_daily_stats(
+        self,
+        program_id: int,
+        user_id: int,
+        old_day: date | None = None,
+        new_day: date | None = None,
+    ) -> None:
+        """Moves one activity between the program's rollup rows."""
+        for day, delta in ((old_day, -1), (new_day, 1)):
+            if day is None:
+                continue
+            try:
+                await self.daily_stats_repo.increment(program_id, user_id, day, delta)
+            except Exception as e:
+                logging.warning(
+                    f"Failed to update the daily stats of program {program_id} "
+                    f"for {day}, rebuilding in the background: {e}"
+                )
+                await self._enqueue(
+                    REBUILD_DAILY_STATS_JOB,
+                    {
+                        "program_id": program_id,
+                        "start": day.isoformat(),
+                        "end": day.isoformat(),
+                    },
+                )
+
+    async def _track_calendar(
+        self,
+        user_id: int,
+        program_id: int,
+        old_day: date | None = None,
+        new_day: date | None = None,
+    ) -> None:
+        """Mirrors the day change into the heatmap bitmaps."""
+        try:
+            if old_day is None:
+                await self.calendar_service.record_day(user_id, program_id, new_day)
+            elif new_day is None:
+                await self.calendar_service.remove_day(user_id, program_id, old_day)
+            else:
+                await self.calendar_service.move_day(
+                    user_id, program_id, old_day, new_day
+                )
+        except Exception as e:
+            logging.warning(
+                f"Failed to update the activity calendar of user {user_id} "
+                f"for program {program_id}, rebuilding in the background: {e}"
+            )
+            for year in sorted({day.year for day in (old_day, new_day) if day}):
+                await self._enqueue(
+                    REBUILD_CALENDAR_JOB,
+                    {"user_id": user_id, "program_id": program_id, "year": year},
+                )
+
+    async def _enqueue_award(
+        self, user_id: int, program_id: int, cycle_reference: str, tiers: list[str]
+    ) -> None:
+        await self._enqueue(
+            AWARD_ACHIEVEMENT_JOB,
+            {
+                "user_id": user_id,
+                "program_id": program_id,
+                "cycle_reference": cycle_reference,
+                "tiers": tiers,
+            },
         )
+
+    async def _enqueue(self, kind: str, payload: dict) -> None:
+        try:
+            await enqueue_job(self.db, kind, payload)
+        except Exception as e:
+            logging.error(f"Failed to enqueue {kind} job with {payload}: {e}")
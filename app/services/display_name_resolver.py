@@ -0,0 +1,59 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import async_session
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.user_repository import UserRepository
+from app.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+
+class DisplayNameResolver:
+    """
+    Resolves Slack display names off the request path. Users are created with
+    their Slack id as a placeholder name and the real one is written back by a
+    background task. Concurrent requests for the same id share one task.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def schedule(self, slack_id: str) -> asyncio.Task:
+        task = self._pending.get(slack_id)
+        if task is not None and not task.done():
+            return task
+
+        task = asyncio.create_task(self._resolve(slack_id))
+        self._pending[slack_id] = task
+        task.add_done_callback(lambda _: self._forget(slack_id, task))
+        return task
+
+    async def close(self) -> None:
+        pending = list(self._pending.values())
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _forget(self, slack_id: str, task: asyncio.Task) -> None:
+        if self._pending.get(slack_id) is task:
+            del self._pending[slack_id]
+
+    async def _resolve(self, slack_id: str) -> None:
+        try:
+            async with self.session_factory() as session:
+                user_repo = UserRepository(session)
+                user_service = UserService(
+                    user_repo, SlackInstallationRepository(session)
+                )
+                display_name = await user_service.get_slack_display_name(slack_id)
+                await user_repo.update_display_name(
+                    slack_id, display_name, placeholder=slack_id
+                )
+        except Exception as e:
+            logger.warning("Could not resolve display name for %s: %s", slack_id, e)
+
+
+display_name_resolver = DisplayNameResolver(async_session)
@@ -0,0 +1,93 @@
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.config import settings
+from app.exceptions.business import BusinessRuleViolationError, RequestInProgressError
+from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+
+MAX_KEY_LENGTH = 255
+
+
+@dataclass
+class StoredResponse:
+    status_code: int
+    body: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class IdempotencyService:
+    def __init__(
+        self,
+        idempotency_repo: Annotated[IdempotencyKeyRepository, Depends()],
+        ttl_seconds: int = settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+        lock_seconds: int = settings.IDEMPOTENCY_KEY_LOCK_SECONDS,
+    ):
+        self.idempotency_repo = idempotency_repo
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+
+    async def begin(
+        self, scope: str, key: str, request_hash: str
+    ) -> StoredResponse | None:
+        """
+        Claims the key within `scope` for a new request. Returns the stored
+        response when the same request already completed under this key, so it
+        can be replayed. A pending key whose lock deadline passed, e.g. because
+        the process handling it died, is taken over instead of blocking retries
+        until the TTL expires.
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise BusinessRuleViolationError(
+                f"Idempotency-Key must have between 1 and {MAX_KEY_LENGTH} characters"
+            )
+
+        now = datetime.now(UTC)
+        await self.idempotency_repo.delete_by_key_if_created_before(
+            scope, key, now - timedelta(seconds=self.ttl_seconds)
+        )
+        locked_until = now + timedelta(seconds=self.lock_seconds)
+        if await self.idempotency_repo.claim(
+            scope, key, request_hash, now, locked_until
+        ):
+            return None
+
+        record = await self.idempotency_repo.find_by_key(scope, key)
+        if record is None:
+            raise RequestInProgressError(
+                "A request with this Idempotency-Key is being processed"
+            )
+        if record.request_hash != request_hash:
+            raise BusinessRuleViolationError(
+                "Idempotency-Key was already used for a different request"
+            )
+        if record.status_code is None:
+            if await self.idempotency_repo.take_over(scope, key, now, locked_until):
+                return None
+            raise RequestInProgressError(
+                "A request with this Idempotency-Key is being processed"
+            )
+        return StoredResponse(
+            status_code=record.status_code,
+            body=record.response_body or "",
+            headers=json.loads(record.response_headers or "{}"),
+        )
+
+    async def complete(self, scope: str, key: str, response: StoredResponse) -> None:
+        await self.idempotency_repo.save_response(
+            scope,
+            key,
+            response.status_code,
+            response.body,
+            json.dumps(response.headers),
+        )
+
+    async def abandon(self, scope: str, key: str) -> None:
+        await self.idempotency_repo.delete_by_key(scope, key)
+
+    async def purge_expired(self) -> int:
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.ttl_seconds)
+        return await self.idempotency_repo.purge_created_before(cutoff)
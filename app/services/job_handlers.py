@@ -0,0 +1,128 @@
+from datetime import date
+from typing import Any
+
+from app.core.database import async_session
+from app.core.job_queue import JobContext, JobHandler, JobWorker
+from app.models.achievement import DEFAULT_TIER
+from app.repositories.achievement_repository import AchievementRepository
+from app.repositories.activity_calendar_repository import ActivityCalendarRepository
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
+from app.repositories.program_repository import ProgramRepository
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.streak_repository import StreakRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.user_schema import SlackDirectorySyncResponse
+from app.services.achievement_service import AchievementService
+from app.services.activity_calendar_service import ActivityCalendarService
+from app.services.activity_service import (
+    AWARD_ACHIEVEMENT_JOB,
+    REBUILD_CALENDAR_JOB,
+    REBUILD_DAILY_STATS_JOB,
+    RECOMPUTE_STREAK_JOB,
+)
+from app.services.program_dashboard_service import ProgramDashboardService
+from app.services.program_service import ProgramService
+from app.services.slack_directory_sync_service import SlackDirectorySyncService
+from app.services.streak_service import StreakService
+
+CLOSE_CYCLE_JOB = "close_cycle"
+NOTIFY_ACHIEVEMENTS_JOB = "notify_achievements"
+SLACK_DIRECTORY_SYNC_JOB = "slack_directory_sync"
+
+
+def _achievement_service(context: JobContext) -> AchievementService:
+    session = context.session
+    return AchievementService(
+        AchievementRepository(session),
+        ProgramRepository(session),
+        ActivityRepository(session),
+        SlackInstallationRepository(session),
+    )
+
+
+async def close_cycle(context: JobContext) -> dict[str, Any] | None:
+    closed = await _achievement_service(context).close_cycle(
+        context.payload["program_name"],
+        context.payload["cycle_reference"],
+        context.payload.get("reconcile", False),
+    )
+    return closed.model_dump() if closed else None
+
+
+async def notify_achievements(context: JobContext) -> dict[str, Any]:
+    notified = await _achievement_service(context).notify_achievements(
+        context.payload["program_name"], context.payload["cycle_reference"]
+    )
+    return notified.model_dump()
+
+
+async def award_achievement(context: JobContext) -> dict[str, Any]:
+    created = await AchievementRepository(context.session).award(
+        context.payload["user_id"],
+        context.payload["program_id"],
+        context.payload["cycle_reference"],
+        context.payload.get("tiers", [DEFAULT_TIER]),
+    )
+    return {"created": created}
+
+
+async def recompute_streak(context: JobContext) -> dict[str, Any]:
+    session = context.session
+    streak = await StreakService(
+        StreakRepository(session), ActivityRepository(session)
+    ).recompute(context.payload["user_id"], context.payload["program_id"])
+    return {
+        "current_length": streak.current_length if streak else 0,
+        "longest_length": streak.longest_length if streak else 0,
+    }
+
+
+async def rebuild_calendar(context: JobContext) -> dict[str, Any]:
+    session = context.session
+    bitmap = await ActivityCalendarService(
+        ActivityCalendarRepository(session), ActivityRepository(session)
+    ).rebuild(
+        context.payload["user_id"],
+        context.payload["program_id"],
+        context.payload["year"],
+    )
+    return {"days_active": bitmap.bit_count()}
+
+
+async def rebuild_daily_stats(context: JobContext) -> dict[str, Any]:
+    session = context.session
+    program_service = ProgramService(ProgramRepository(session))
+    service = ProgramDashboardService(
+        ProgramDailyStatRepository(session), program_service
+    )
+    written = await service.rebuild(
+        context.payload["program_id"],
+        date.fromisoformat(context.payload["start"]),
+        date.fromisoformat(context.payload["end"]),
+        on_progress=context.report_progress,
+    )
+    return {"days": written}
+
+
+async def slack_directory_sync(context: JobContext) -> dict[str, Any]:
+    session = context.session
+    report = await SlackDirectorySyncService(
+        UserRepository(session), SlackInstallationRepository(session)
+    ).sync()
+    return SlackDirectorySyncResponse.model_validate(report).model_dump()
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    CLOSE_CYCLE_JOB: close_cycle,
+    NOTIFY_ACHIEVEMENTS_JOB: notify_achievements,
+    AWARD_ACHIEVEMENT_JOB: award_achievement,
+    RECOMPUTE_STREAK_JOB: recompute_streak,
+    REBUILD_CALENDAR_JOB: rebuild_calendar,
+    REBUILD_DAILY_STATS_JOB: rebuild_daily_stats,
+    SLACK_DIRECTORY_SYNC_JOB: slack_directory_sync,
+}
+
+
+def build_job_worker() -> JobWorker:
+    return JobWorker(async_session, JOB_HANDLERS)
@@ -0,0 +1,22 @@
+from typing import Annotated, Any
+
+from fastapi import Depends
+
+from app.core.job_queue import enqueue_job
+from app.exceptions.business import EntityNotFoundError
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+
+
+class JobService:
+    def __init__(self, job_repo: Annotated[JobRepository, Depends()]):
+        self.job_repo = job_repo
+
+    async def enqueue(self, kind: str, payload: dict[str, Any]) -> Job:
+        return await enqueue_job(self.job_repo.session, kind, payload)
+
+    async def find_by_id(self, job_id: int) -> Job:
+        job = await self.job_repo.get_by_id(job_id)
+        if not job:
+            raise EntityNotFoundError("Job", job_id)
+        return job
@@ -0,0 +1,233 @@
+import itertools
+import logging
+import time
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.program_repository import ProgramRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.leaderboard_schema import LeaderboardEntry, LeaderboardResponse
+from app.services.program_service import ProgramService
+from app.services.utils.reference_date import ReferenceDate
+from app.utils.cycle import cycle_key, cycle_reference_of, to_local
+
+logger = logging.getLogger(__name__)
+
+
+class CycleLeaderboard:
+    """
+    Activity counts of one program cycle, with users bucketed by count.
+    There is at most one activity per user and local day, so a count never
+    exceeds the days in the cycle and ranking walks at most ~31 buckets,
+    however many users take part.
+    """
+
+    def __init__(self, counts: Iterable[tuple[int, int]] = ()):
+        self._counts: dict[int, int] = {}
+        self._buckets: list[set[int]] = [set()]
+        for user_id, count in counts:
+            self.add(user_id, count)
+
+    @property
+    def participants(self) -> int:
+        return len(self._counts)
+
+    def add(self, user_id: int, delta: int) -> None:
+        previous = self._counts.pop(user_id, 0)
+        self._buckets[previous].discard(user_id)
+        count = max(previous + delta, 0)
+        if count == 0:
+            return
+
+        while len(self._buckets) <= count:
+            self._buckets.append(set())
+        self._buckets[count].add(user_id)
+        self._counts[user_id] = count
+
+    def count_of(self, user_id: int) -> int:
+        return self._counts.get(user_id, 0)
+
+    def rank_of(self, user_id: int) -> int | None:
+        """Competition ranking: users with the same count share a rank."""
+        count = self._counts.get(user_id)
+        if count is None:
+            return None
+        return 1 + sum(len(bucket) for bucket in self._buckets[count + 1 :])
+
+    def top(self, limit: int) -> list[tuple[int, int, int]]:
+        """(rank, user_id, count) of the first `limit` users."""
+        entries = []
+        rank = 1
+        for count in range(len(self._buckets) - 1, 0, -1):
+            bucket = self._buckets[count]
+            for user_id in sorted(bucket)[: limit - len(entries)]:
+                entries.append((rank, user_id, count))
+            if len(entries) >= limit:
+                break
+            rank += len(bucket)
+        return entries
+
+
+class LeaderboardCache:
+    """
+    Leaderboards of this process keyed by (program_id, cycle_key). Activity
+    writes adjust boards that are loaded; writes made by other processes
+    are picked up when a board expires after LEADERBOARD_TTL_SECONDS.
+
+    Loads and writes take a tick from `begin()` before touching the database.
+    A write only adjusts a board stored before the write began; a board
+    stored since may already count the write, so it is dropped instead. A
+    load does not store its board if a write to that cycle was recorded
+    after the load began.
+    """
+
+    def __init__(self):
+        self._boards: dict[tuple[int, int], tuple[CycleLeaderboard, float, int]] = {}
+        self._recorded: dict[tuple[int, int], int] = {}
+        self._clock = itertools.count(1)
+
+    def begin(self) -> int:
+        return next(self._clock)
+
+    def get(self, program_id: int, key: int) -> CycleLeaderboard | None:
+        cached = self._boards.get((program_id, key))
+        if cached is None:
+            return None
+        board, loaded_at, _ = cached
+        ttl = settings.LEADERBOARD_TTL_SECONDS
+        if ttl > 0 and time.monotonic() - loaded_at > ttl:
+            del self._boards[(program_id, key)]
+            return None
+        return board
+
+    def put(
+        self,
+        program_id: int,
+        key: int,
+        board: CycleLeaderboard,
+        started: int | None = None,
+    ) -> None:
+        if started is not None and self._recorded.get((program_id, key), 0) > started:
+            return
+        self._boards[(program_id, key)] = (board, time.monotonic(), self.begin())
+
+    def record(
+        self, program_id: int, key: int, user_id: int, delta: int, started: int
+    ) -> None:
+        self._recorded[(program_id, key)] = self.begin()
+        cached = self._boards.get((program_id, key))
+        if cached is None:
+            return
+        board, _, stored = cached
+        if stored > started:
+            del self._boards[(program_id, key)]
+        else:
+            board.add(user_id, delta)
+
+    def clear(self) -> None:
+        self._boards.clear()
+        self._recorded.clear()
+
+
+leaderboard_cache = LeaderboardCache()
+
+
+class LeaderboardService:
+    def __init__(
+        self,
+        activity_repo: Annotated[ActivityRepository, Depends()],
+        user_repo: Annotated[UserRepository, Depends()],
+        program_service: Annotated[ProgramService, Depends()],
+    ):
+        self.activity_repo = activity_repo
+        self.user_repo = user_repo
+        self.program_service = program_service
+
+    async def find(
+        self,
+        program_slack_channel: str,
+        cycle_reference: str | None = None,
+        limit: int | None = None,
+        slack_id: str | None = None,
+    ) -> LeaderboardResponse:
+        program = await self.program_service.find_one_by_slack_channel(
+            program_slack_channel
+        )
+        ref = ReferenceDate.from_str(
+            cycle_reference or cycle_reference_of(datetime.now(UTC))
+        )
+        board = await self.load(program.id, ref.year, ref.month)
+
+        top = board.top(limit or settings.LEADERBOARD_SIZE)
+        users = await self.user_repo.find_all_by_ids([user_id for _, user_id, _ in top])
+        users_by_id = {user.id: user for user in users}
+        entries = [
+            LeaderboardEntry(
+                rank=rank,
+                slack_id=users_by_id[user_id].slack_id,
+                display_name=users_by_id[user_id].display_name,
+                count=count,
+            )
+            for rank, user_id, count in top
+            if user_id in users_by_id
+        ]
+
+        me = None
+        if slack_id:
+            user = await self.user_repo.find_by_slack_id(slack_id)
+            rank = board.rank_of(user.id) if user else None
+            if rank is not None:
+                me = LeaderboardEntry(
+                    rank=rank,
+                    slack_id=user.slack_id,
+                    display_name=user.display_name,
+                    count=board.count_of(user.id),
+                )
+
+        return LeaderboardResponse(
+            program=program.name,
+            cycle_reference=f"{ref.year}-{ref.month:02d}",
+            participants=board.participants,
+            entries=entries,
+            me=me,
+        )
+
+    async def load(self, program_id: int, year: int, month: int) -> CycleLeaderboard:
+        """The cached board, or one aggregated from activities when cold."""
+        key = cycle_key(year, month)
+        board = leaderboard_cache.get(program_id, key)
+        if board is None:
+            started = leaderboard_cache.begin()
+            counts = await self.activity_repo.count_by_user_in_cycle(
+                program_id, year, month, min_count=1
+            )
+            board = CycleLeaderboard(counts)
+            leaderboard_cache.put(program_id, key, board, started)
+        return board
+
+
+async def warm_leaderboards() -> None:
+    """Loads the current and previous cycle of every program still running."""
+    today = to_local(datetime.now(UTC)).date()
+    previous = date(today.year - (today.month == 1), (today.month - 2) % 12 + 1, 1)
+    try:
+        async with async_session() as session:
+            programs = await ProgramRepository(session).get_all()
+            service = LeaderboardService(
+                ActivityRepository(session),
+                UserRepository(session),
+                ProgramService(ProgramRepository(session)),
+            )
+            for program in programs:
+                if program.end_date and to_local(program.end_date).date() < previous:
+                    continue
+                for cycle in (previous, today):
+                    await service.load(program.id, cycle.year, cycle.month)
+    except Exception as e:
+        logger.warning("Could not warm the leaderboards: %s", e)
@@ -0,0 +1,164 @@
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.models.program_daily_stat import ProgramDailyStat
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
+from app.schemas.dashboard_schema import (
+    CycleSummary,
+    DailyStat,
+    ProgramDashboardResponse,
+)
+from app.services.program_service import ProgramService
+from app.services.utils.reference_date import ReferenceDate
+from app.utils.cycle import cycle_key, cycle_reference_of, local_date
+
+REBUILD_CHUNK_DAYS = 31
+
+
+def _cycle_bounds(year: int, month: int) -> tuple[date, date]:
+    first_day = date(year, month, 1)
+    next_month = (first_day + timedelta(days=31)).replace(day=1)
+    return first_day, next_month - timedelta(days=1)
+
+
+def _change_pct(current: int, previous: int) -> float | None:
+    if not previous:
+        return None
+    return round((current - previous) / previous * 100, 1)
+
+
+class ProgramDashboardService:
+    """
+    Program dashboards read from the program_daily_stats and
+    program_cycle_users rollups, which activity writes keep current.
+    """
+
+    def __init__(
+        self,
+        stats_repo: Annotated[ProgramDailyStatRepository, Depends()],
+        program_service: Annotated[ProgramService, Depends()],
+    ):
+        self.stats_repo = stats_repo
+        self.program_service = program_service
+
+    async def rebuild(
+        self,
+        program_id: int,
+        start: date,
+        end: date,
+        on_progress: Callable[[int, str | None], Awaitable[None]] | None = None,
+    ) -> int:
+        """
+        Recomputes the daily rollup of [start, end] from activities, one
+        transaction per REBUILD_CHUNK_DAYS days, then the per-user counts of
+        every cycle the range touches, one transaction per cycle. Returns the
+        days written.
+        """
+        total_days = (end - start).days + 1
+        written = 0
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=REBUILD_CHUNK_DAYS - 1), end)
+            written += await self.stats_repo.rebuild_between(
+                program_id, chunk_start, chunk_end
+            )
+            if on_progress:
+                done = (chunk_end - start).days + 1
+                await on_progress(done * 100 // total_days, f"{done}/{total_days} days")
+            chunk_start = chunk_end + timedelta(days=1)
+
+        for key in range(
+            cycle_key(start.year, start.month), cycle_key(end.year, end.month) + 1
+        ):
+            await self.stats_repo.rebuild_cycle(program_id, key)
+        return written
+
+    async def find(
+        self, program_slack_channel: str, cycle_reference: str | None = None
+    ) -> ProgramDashboardResponse:
+        program = await self.program_service.find_one_by_slack_channel(
+            program_slack_channel
+        )
+        today = local_date(datetime.now(UTC))
+        ref = ReferenceDate.from_str(
+            cycle_reference or cycle_reference_of(datetime.now(UTC))
+        )
+        first_day, last_day = _cycle_bounds(ref.year, ref.month)
+        until = min(last_day, max(today, first_day))
+        previous_last_day = first_day - timedelta(days=1)
+        previous_first_day = previous_last_day.replace(day=1)
+
+        stats = await self.stats_repo.find_between(
+            program.id, previous_first_day, last_day
+        )
+        current = await self._summarize(
+            program.id,
+            [stat for stat in stats if stat.day >= first_day],
+            first_day,
+            until,
+        )
+        previous = await self._summarize(
+            program.id,
+            [stat for stat in stats if stat.day < first_day],
+            previous_first_day,
+            previous_last_day,
+        )
+        members = await self.stats_repo.count_members(program.id)
+
+        by_day = {stat.day: stat for stat in stats}
+        daily = []
+        day = first_day
+        while day <= until:
+            stat = by_day.get(day)
+            daily.append(
+                DailyStat(
+                    day=day,
+                    activity_count=stat.activity_count if stat else 0,
+                    distinct_users=stat.distinct_users if stat else 0,
+                )
+            )
+            day += timedelta(days=1)
+
+        return ProgramDashboardResponse(
+            program=program.name,
+            members=members,
+            participation_rate=(
+                round(current.active_users / members, 4) if members else 0.0
+            ),
+            current=current,
+            previous=previous,
+            activities_change_pct=_change_pct(
+                current.total_activities, previous.total_activities
+            ),
+            active_users_change_pct=_change_pct(
+                current.active_users, previous.active_users
+            ),
+            daily=daily,
+        )
+
+    async def _summarize(
+        self,
+        program_id: int,
+        stats: list[ProgramDailyStat],
+        first_day: date,
+        last_day: date,
+    ) -> CycleSummary:
+        """
+        Users active across the cycle can't be summed from daily distinct
+        counts, so they come from the cycle's per-user rollup instead.
+        """
+        active_users = await self.stats_repo.count_active_users(
+            program_id, cycle_key(first_day.year, first_day.month)
+        )
+        days = (last_day - first_day).days + 1
+        daily_users = sum(stat.distinct_users for stat in stats)
+        return CycleSummary(
+            cycle_reference=f"{first_day.year}-{first_day.month:02d}",
+            total_activities=sum(stat.activity_count for stat in stats),
+            active_users=active_users,
+            active_days=sum(1 for stat in stats if stat.activity_count > 0),
+            average_daily_users=round(daily_users / days, 2),
+        )
@@ -33,6 +33,7 @@ class ProgramService:
                 hour=0, minute=0, second=1, microsecond=0
             ),
             end_date=program.end_date,
+            goal_tiers=[tier.model_dump() for tier in program.goal_tiers],
         )
 
         try:
@@ -82,5 +83,16 @@ class ProgramService:
     async def find_by_slack_channel(self, slack_channel: str) -> list[Program]:
         return await self.program_repo.find_by_slack_channel(slack_channel)
 
+    async def find_one_by_slack_channel(self, slack_channel: str) -> Program:
+        programs = await self.program_repo.find_by_slack_channel(slack_channel)
+        if not programs:
+            raise EntityNotFoundError("Program", slack_channel)
+        if len(programs) > 1:
+            raise BusinessRuleViolationError(
+                f"There are {len(programs)} programs "
+                f"linked to the channel '{slack_channel}'."
+            )
+        return programs[0]
+
     async def find_by_name(self, name: str) -> Program:
         return await self.program_repo.find_by_name(name)
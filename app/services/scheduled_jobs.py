@@ -0,0 +1,129 @@
+import logging
+from datetime import UTC, date, datetime, timedelta
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.scheduler import Scheduler, daily_at, every, monthly_at
+from app.models.program import Program
+from app.repositories.achievement_repository import AchievementRepository
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from app.repositories.job_run_repository import JobRunRepository
+from app.repositories.program_repository import ProgramRepository
+from app.repositories.slack_event_repository import SlackEventRepository
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.slack_state_repository import SlackStateRepository
+from app.services.achievement_service import AchievementService
+from app.services.idempotency_service import IdempotencyService
+from app.services.slack_directory_sync_service import run_directory_sync
+from app.utils.cycle import LOCAL_TIMEZONE, local_date
+
+logger = logging.getLogger(__name__)
+
+
+def previous_cycle_reference(now: datetime) -> str:
+    first_of_month = now.astimezone(LOCAL_TIMEZONE).date().replace(day=1)
+    last_month = first_of_month - timedelta(days=1)
+    return f"{last_month.year}-{last_month.month:02d}"
+
+
+def _ran_during(program: Program, first_day: date, last_day: date) -> bool:
+    if local_date(program.start_date) > last_day:
+        return False
+    return program.end_date is None or local_date(program.end_date) >= first_day
+
+
+async def close_previous_cycle(now: datetime | None = None) -> dict[str, int]:
+    """
+    Closes the cycle of the month before `now` for every program that ran
+    during it and posts the achievements to each program's channel. The
+    scheduler passes the time the run was scheduled for, so a close caught up
+    on after downtime still closes the month it was meant to. The close reconciles, so
+    goals reached without a recorded award (failed award jobs, activities
+    from before awards were made on write) are awarded too.
+    """
+    cycle_reference = previous_cycle_reference(now or datetime.now(UTC))
+    year, month = map(int, cycle_reference.split("-"))
+    first_day = date(year, month, 1)
+    last_day = (first_day + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+
+    summary = {"programs": 0, "achievements": 0, "notified": 0, "failed": 0}
+    async with async_session() as session:
+        program_repo = ProgramRepository(session)
+        service = AchievementService(
+            AchievementRepository(session),
+            program_repo,
+            ActivityRepository(session),
+            SlackInstallationRepository(session),
+        )
+        for program in await program_repo.get_all():
+            if not _ran_during(program, first_day, last_day):
+                continue
+            summary["programs"] += 1
+            try:
+                closed = await service.close_cycle(
+                    program.name, cycle_reference, reconcile=True
+                )
+                if closed:
+                    summary["achievements"] += closed.total_created
+                notified = await service.notify_achievements(
+                    program.name, cycle_reference
+                )
+                summary["notified"] += notified.total_notified
+            except Exception as e:
+                # One program failing must not stop the others from closing
+                logger.error(
+                    "Failed to close cycle %s of %s: %s",
+                    cycle_reference,
+                    program.name,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                summary["failed"] += 1
+    return summary
+
+
+async def purge_expired_records() -> dict[str, int]:
+    now = datetime.now(UTC)
+    async with async_session() as session:
+        return {
+            "idempotency_keys": await IdempotencyService(
+                IdempotencyKeyRepository(session)
+            ).purge_expired(),
+            "slack_events": await SlackEventRepository(session).purge_received_before(
+                now - timedelta(seconds=settings.SLACK_EVENT_DEDUP_RETENTION_SECONDS)
+            ),
+            "slack_states": await SlackStateRepository(session).purge_expired(now),
+            "job_runs": await JobRunRepository(session).purge_started_before(
+                now - timedelta(days=settings.SCHEDULER_RUN_RETENTION_DAYS)
+            ),
+        }
+
+
+async def sync_slack_directory() -> dict[str, int]:
+    report = await run_directory_sync()
+    return {
+        "workspaces": report.workspaces,
+        "members_seen": report.members_seen,
+        "users_updated": report.users_updated,
+        "failed_workspaces": len(report.failed_workspaces),
+    }
+
+
+def build_scheduler() -> Scheduler:
+    scheduler = Scheduler(async_session)
+    scheduler.add(
+        "close-previous-cycle",
+        monthly_at(1, 0, 10),
+        close_previous_cycle,
+        catch_up=True,
+    )
+    scheduler.add("purge-expired-records", daily_at(3, 0), purge_expired_records)
+    if settings.SLACK_DIRECTORY_SYNC_INTERVAL_SECONDS > 0:
+        scheduler.add(
+            "slack-directory-sync",
+            every(settings.SLACK_DIRECTORY_SYNC_INTERVAL_SECONDS),
+            sync_slack_directory,
+        )
+    return scheduler
@@ -0,0 +1,110 @@
+import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Annotated
+
+from fastapi import Depends
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.core.database import async_session
+from app.core.slack_clients import slack_client_pool
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.user_repository import UserRepository
+from app.services.user_service import extract_display_name
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 200
+
+
+@dataclass
+class DirectorySyncReport:
+    workspaces: int = 0
+    pages: int = 0
+    members_seen: int = 0
+    users_updated: int = 0
+    failed_workspaces: list[str] = field(default_factory=list)
+
+
+class SlackDirectorySyncService:
+    """
+    Refreshes users.display_name from a paginated users.list sweep of every
+    installed workspace, updating only the names that changed.
+    """
+
+    def __init__(
+        self,
+        user_repo: Annotated[UserRepository, Depends()],
+        installation_repo: Annotated[SlackInstallationRepository, Depends()],
+    ):
+        self.user_repo = user_repo
+        self.installation_repo = installation_repo
+
+    def client_factory(self, token: str) -> AsyncWebClient:
+        return slack_client_pool.get(token)
+
+    async def sync(
+        self,
+        on_progress: Callable[[DirectorySyncReport], None] | None = None,
+    ) -> DirectorySyncReport:
+        report = DirectorySyncReport()
+        installations = await self.installation_repo.get_all()
+
+        for installation in installations:
+            workspace = installation.team_id or installation.enterprise_id
+            report.workspaces += 1
+            client = self.client_factory(installation.bot_token)
+            try:
+                async for members in self._list_members(client):
+                    report.pages += 1
+                    report.members_seen += len(members)
+                    report.users_updated += await self._apply_page(members)
+                    if on_progress:
+                        on_progress(report)
+            except Exception as e:
+                logger.error("Slack directory sync failed for %s: %s", workspace, e)
+                report.failed_workspaces.append(workspace)
+
+        logger.info(
+            "Slack directory sync finished: %s workspaces, %s members, %s updated",
+            report.workspaces,
+            report.members_seen,
+            report.users_updated,
+        )
+        return report
+
+    async def _list_members(self, client: AsyncWebClient) -> AsyncIterator[list]:
+        cursor = None
+        while True:
+            response = await client.users_list(cursor=cursor, limit=PAGE_SIZE)
+            yield response.get("members", [])
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return
+
+    async def _apply_page(self, members: list[dict]) -> int:
+        names = {
+            member["id"]: extract_display_name(member)
+            for member in members
+            if not member.get("deleted") and not member.get("is_bot")
+        }
+        names = {slack_id: name for slack_id, name in names.items() if name}
+        if not names:
+            return 0
+
+        users = await self.user_repo.find_all_by_slack_ids(list(names))
+        changed = [
+            {"id": user.id, "display_name": names[user.slack_id]}
+            for user in users
+            if user.display_name != names[user.slack_id]
+        ]
+        await self.user_repo.bulk_update(changed)
+        return len(changed)
+
+
+async def run_directory_sync() -> DirectorySyncReport:
+    async with async_session() as session:
+        service = SlackDirectorySyncService(
+            UserRepository(session), SlackInstallationRepository(session)
+        )
+        return await service.sync()
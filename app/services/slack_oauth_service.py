@@ -106,11 +106,13 @@ class SlackOAuthService:
         return state
 
     async def consume_state(self, state: str) -> bool:
-        db_state = await self.state_repo.find_by_state(state)
-        if db_state:
-            is_valid = db_state.expire_at > datetime.now(UTC)
-            logger.info("Consuming Slack OAuth state: %s. Valid: %s", state, is_valid)
-            await self.state_repo.delete_by_state(state)
-            return is_valid
-        logger.warning("Attempted to consume non-existent Slack OAuth state: %s", state)
-        return False
+        is_valid = await self.state_repo.consume(state, datetime.now(UTC))
+        if not is_valid:
+            logger.warning("Rejected unknown or expired Slack OAuth state: %s", state)
+        return is_valid
+
+    async def mark_state_spent(self, state: str, expire_at: datetime) -> bool:
+        return await self.state_repo.mark_spent(state, expire_at)
+
+    async def purge_expired_states(self) -> int:
+        return await self.state_repo.purge_expired(datetime.now(UTC))
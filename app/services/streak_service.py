@@ -0,0 +1,195 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.models.streak import Streak
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.streak_repository import StreakRepository
+from app.schemas.streak_schema import StreakResponse
+from app.utils.cycle import local_date
+
+ONE_DAY = timedelta(days=1)
+
+
+def _run_around(days: set[date], day: date) -> tuple[int, int]:
+    """How many consecutive days of `days` sit right before and after `day`."""
+    before = 0
+    while day - ONE_DAY * (before + 1) in days:
+        before += 1
+    after = 0
+    while day + ONE_DAY * (after + 1) in days:
+        after += 1
+    return before, after
+
+
+def to_streak_response(streak: Streak | None, today: date) -> StreakResponse:
+    """A run that ended before yesterday no longer counts as current."""
+    if streak is None:
+        return StreakResponse(current_length=0, longest_length=0)
+    alive = streak.last_date >= today - ONE_DAY
+    return StreakResponse(
+        current_length=streak.current_length if alive else 0,
+        longest_length=streak.longest_length,
+        current_start=streak.current_start if alive else None,
+        last_date=streak.last_date,
+    )
+
+
+class StreakService:
+    """
+    Keeps the streaks table in step with a user's activity days in a program.
+
+    Appending the next day, or starting a new run after a gap, only needs
+    the stored state. An out-of-order day can only join the runs right
+    before and after it, and each of those is at most `longest_length`
+    long, so only that window of days is read. Removing a day from a
+    longest run is the one case that rescans the user's history in the
+    program, since the next longest run is not stored.
+    """
+
+    def __init__(
+        self,
+        streak_repo: Annotated[StreakRepository, Depends()],
+        activity_repo: Annotated[ActivityRepository, Depends()],
+    ):
+        self.streak_repo = streak_repo
+        self.activity_repo = activity_repo
+
+    async def find(
+        self, user_id: int, program_id: int, today: date | None = None
+    ) -> StreakResponse:
+        streak = await self.streak_repo.find(user_id, program_id)
+        return to_streak_response(streak, today or local_date(datetime.now(UTC)))
+
+    async def record_day(self, user_id: int, program_id: int, day: date) -> Streak:
+        streak = await self.streak_repo.find(user_id, program_id)
+        if streak is None:
+            return await self.recompute(user_id, program_id)
+
+        if day == streak.last_date + ONE_DAY:
+            return await self._save(
+                streak,
+                streak.current_start,
+                day,
+                max(streak.longest_length, streak.current_length + 1),
+            )
+        if day > streak.last_date:
+            return await self._save(streak, day, day, max(streak.longest_length, 1))
+
+        # Backfill: the new day may bridge the runs around it
+        days = await self._days_around(streak, day)
+        before, after = _run_around(days, day)
+        run_start, run_end = day - ONE_DAY * before, day + ONE_DAY * after
+        current_start = streak.current_start
+        if run_end >= streak.last_date:
+            current_start = run_start
+        return await self._save(
+            streak,
+            current_start,
+            streak.last_date,
+            max(streak.longest_length, before + 1 + after),
+        )
+
+    async def remove_day(
+        self,
+        user_id: int,
+        program_id: int,
+        day: date,
+        ignore: date | None = None,
+    ) -> Streak | None:
+        """
+        Updates the state after `day` lost its activity. `ignore` hides a day
+        that is already stored but not yet accounted for, when an update
+        moves an activity from `day` to `ignore`.
+        """
+        streak = await self.streak_repo.find(user_id, program_id)
+        if streak is None:
+            return await self.recompute(user_id, program_id, ignore)
+
+        days = await self._days_around(streak, day)
+        days.discard(day)
+        days.discard(ignore)
+        before, after = _run_around(days, day)
+        if before + 1 + after >= streak.longest_length:
+            return await self.recompute(user_id, program_id, ignore)
+
+        if not streak.current_start <= day <= streak.last_date:
+            return streak
+        if after:
+            return await self._save(
+                streak, day + ONE_DAY, streak.last_date, streak.longest_length
+            )
+        if before:
+            return await self._save(
+                streak, streak.current_start, day - ONE_DAY, streak.longest_length
+            )
+
+        previous = await self._last_day_before(user_id, program_id, day, ignore)
+        if previous is None:
+            await self.streak_repo.delete_for(user_id, program_id)
+            return None
+        days = await self._days_around(streak, previous)
+        days.discard(ignore)
+        before, _ = _run_around(days, previous)
+        return await self._save(
+            streak, previous - ONE_DAY * before, previous, streak.longest_length
+        )
+
+    async def move_day(
+        self, user_id: int, program_id: int, old_day: date, new_day: date
+    ) -> Streak | None:
+        if old_day == new_day:
+            return await self.streak_repo.find(user_id, program_id)
+        await self.remove_day(user_id, program_id, old_day, ignore=new_day)
+        return await self.record_day(user_id, program_id, new_day)
+
+    async def recompute(
+        self, user_id: int, program_id: int, ignore: date | None = None
+    ) -> Streak | None:
+        days = [
+            day
+            for day in await self.activity_repo.find_all_days(user_id, program_id)
+            if day != ignore
+        ]
+        if not days:
+            await self.streak_repo.delete_for(user_id, program_id)
+            return None
+
+        longest = run = 1
+        current_start = days[0]
+        for previous, day in zip(days, days[1:], strict=False):
+            if day == previous + ONE_DAY:
+                run += 1
+            else:
+                run = 1
+                current_start = day
+            longest = max(longest, run)
+        return await self.streak_repo.save(
+            user_id, program_id, current_start, days[-1], longest
+        )
+
+    async def _days_around(self, streak: Streak, day: date) -> set[date]:
+        span = ONE_DAY * (streak.longest_length + 1)
+        return await self.activity_repo.find_days_between(
+            streak.user_id, streak.program_id, day - span, day + span
+        )
+
+    async def _last_day_before(
+        self, user_id: int, program_id: int, day: date, ignore: date | None
+    ) -> date | None:
+        previous = await self.activity_repo.find_last_day_before(
+            user_id, program_id, day
+        )
+        if previous is not None and previous == ignore:
+            previous = await self.activity_repo.find_last_day_before(
+                user_id, program_id, previous
+            )
+        return previous
+
+    async def _save(
+        self, streak: Streak, current_start: date, last_date: date, longest: int
+    ) -> Streak:
+        return await self.streak_repo.save(
+            streak.user_id, streak.program_id, current_start, last_date, longest
+        )
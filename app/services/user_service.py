@@ -2,26 +2,38 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from app.core.slack import slack_app
 from app.exceptions.business import (
     DatabaseError,
     DuplicateEntityError,
     ExternalServiceError,
 )
 from app.models.user import User
+from app.repositories.slack_installation_repository import SlackInstallationRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate
+from app.services.utils.slack_client import find_bot_client
+
+
+def extract_display_name(user_info: dict) -> str | None:
+    return (
+        user_info.get("profile", {}).get("display_name")
+        or user_info.get("real_name")
+        or user_info.get("name")
+    )
 
 
 class UserService:
     def __init__(
         self,
         user_repo: Annotated[UserRepository, Depends()],
+        installation_repo: Annotated[SlackInstallationRepository, Depends()],
     ):
         self.user_repo = user_repo
+        self.installation_repo = installation_repo
 
     async def get_slack_display_name(self, slack_id: str) -> str:
-        response = await slack_app.client.users_info(user=slack_id)
+        client = await find_bot_client(self.installation_repo)
+        response = await client.users_info(user=slack_id)
 
         if not response["ok"]:
             error = response.get("error", "unknown_error")
@@ -30,12 +42,7 @@ class UserService:
                 message=f"Failed to fetch user: {error}"
             )
 
-        user_info = response["user"]
-        display_name = (
-            user_info.get("profile", {}).get("display_name")
-            or user_info.get("real_name")
-            or user_info.get("name")
-        )
+        display_name = extract_display_name(response["user"])
 
         if not display_name:
             raise ExternalServiceError(
@@ -57,8 +64,19 @@ class UserService:
         except Exception as e:
             raise DatabaseError() from e
 
+    async def get_or_create(self, user: UserCreate) -> User:
+        try:
+            return await self.user_repo.get_or_create(
+                slack_id=user.slack_id, display_name=user.display_name
+            )
+        except Exception as e:
+            raise DatabaseError() from e
+
     async def find_all(self):
         return await self.user_repo.get_all()
 
     async def find_by_slack_id(self, slack_id: str):
         return await self.user_repo.find_by_slack_id(slack_id)
+
+    async def find_all_by_slack_ids(self, slack_ids: list[str]) -> list[User]:
+        return await self.user_repo.find_all_by_slack_ids(slack_ids)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from app.exceptions.business import BusinessRuleViolationError
+from app.utils.cycle import cycle_key
 
 
 @dataclass
@@ -8,6 +9,10 @@ class ReferenceDate:
     year: int
     month: int
 
+    @property
+    def cycle_key(self) -> int:
+        return cycle_key(self.year, self.month)
+
     @classmethod
     def from_str(cls, date_str: str) -> "ReferenceDate":
         try:
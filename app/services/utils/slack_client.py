@@ -0,0 +1,20 @@
+from slack_sdk.web.async_client import AsyncWebClient
+
+from app.core.slack_clients import slack_client_pool
+from app.exceptions.business import ExternalServiceError
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+
+
+async def find_bot_client(
+    installation_repo: SlackInstallationRepository,
+) -> AsyncWebClient:
+    """
+    Pooled client for the installed bot. Calls made outside a Slack request
+    have no token in context, so they use the most recent installation.
+    """
+    installation = await installation_repo.find_latest()
+    if installation is None:
+        raise ExternalServiceError(
+            service="Slack", message="The app is not installed in any workspace"
+        )
+    return slack_client_pool.get(installation.bot_token)
@@ -0,0 +1,44 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+LOCAL_TIMEZONE = ZoneInfo("America/Sao_Paulo")
+
+
+def to_local(value: datetime) -> datetime:
+    """
+    Converts an aware datetime to the program's local time zone.
+    Naive datetimes are already considered local.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(LOCAL_TIMEZONE)
+
+
+def as_aware(value: datetime) -> datetime:
+    """Attaches the local time zone to naive datetimes, which are local."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=LOCAL_TIMEZONE)
+    return value
+
+
+def local_date(value: datetime) -> date:
+    return to_local(value).date()
+
+
+def cycle_key(year: int, month: int) -> int:
+    return year * 12 + month
+
+
+def cycle_reference(key: int) -> str:
+    year, month = divmod(key - 1, 12)
+    return f"{year}-{month + 1:02d}"
+
+
+def cycle_key_of(value: datetime) -> int:
+    local = to_local(value)
+    return cycle_key(local.year, local.month)
+
+
+def cycle_reference_of(value: datetime) -> str:
+    local = to_local(value)
+    return f"{local.year}-{local.month:02d}"
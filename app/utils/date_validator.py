@@ -1,14 +1,15 @@
 from datetime import datetime
 
+from app.utils.cycle import LOCAL_TIMEZONE, as_aware, to_local
+
 
 def is_within_allowed_window(date_to_check: datetime) -> bool:
-    if date_to_check.tzinfo:
-        now = datetime.now(date_to_check.tzinfo)
-    else:
-        now = datetime.now()
+    """Whether the date falls in the current or previous local month."""
+    now = datetime.now(LOCAL_TIMEZONE)
+    local = to_local(as_aware(date_to_check))
 
     current_month_total = (now.year * 12) + now.month
-    check_month_total = (date_to_check.year * 12) + date_to_check.month
+    check_month_total = (local.year * 12) + local.month
 
     diff = current_month_total - check_month_total
 
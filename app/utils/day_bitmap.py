@@ -0,0 +1,75 @@
+from calendar import isleap
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+# Bit i of a year's bitmap is the local day with ordinal i + 1 in that year
+YEAR_BITS = 366
+BITMAP_BYTES = (YEAR_BITS + 7) // 8
+
+
+def days_in_year(year: int) -> int:
+    return 366 if isleap(year) else 365
+
+
+def day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def day_of(year: int, index: int) -> date:
+    return date(year, 1, 1) + timedelta(days=index)
+
+
+def to_bytes(bitmap: int) -> bytes:
+    return bitmap.to_bytes(BITMAP_BYTES, "little")
+
+
+def from_bytes(data: bytes | None) -> int:
+    return int.from_bytes(data, "little") if data else 0
+
+
+def from_days(days: Iterable[date]) -> int:
+    bitmap = 0
+    for day in days:
+        bitmap |= 1 << day_index(day)
+    return bitmap
+
+
+def with_day(bitmap: int, day: date, active: bool = True) -> int:
+    bit = 1 << day_index(day)
+    return bitmap | bit if active else bitmap & ~bit
+
+
+def range_mask(year: int, start: date | None = None, end: date | None = None) -> int:
+    """Bits of the days in [start, end], clamped to `year`."""
+    first = day_index(start) if start and start.year == year else 0
+    last = day_index(end) if end and end.year == year else days_in_year(year) - 1
+    if (start and start.year > year) or (end and end.year < year) or first > last:
+        return 0
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+def days_active(bitmap: int, mask: int) -> int:
+    return (bitmap & mask).bit_count()
+
+
+def longest_run(bitmap: int) -> int:
+    """Length of the longest run of consecutive set bits."""
+    length = 0
+    while bitmap:
+        bitmap &= bitmap >> 1
+        length += 1
+    return length
+
+
+def longest_gap(bitmap: int, mask: int) -> int:
+    """Longest run of inactive days within `mask`."""
+    return longest_run(~bitmap & mask)
+
+
+def active_days(bitmap: int, year: int) -> list[date]:
+    days = []
+    while bitmap:
+        lowest = bitmap & -bitmap
+        days.append(day_of(year, lowest.bit_length() - 1))
+        bitmap ^= lowest
+    return days
@@ -1,8 +1,10 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
 
+from app.utils.cycle import cycle_key_of, cycle_reference
+
 
 @pytest.mark.asyncio
 async def test_create_and_retrieve_activity(async_client: AsyncClient):
@@ -43,3 +45,144 @@ async def test_create_and_retrieve_activity(async_client: AsyncClient):
     assert activity_detail["description"] == "Integration Run 5k"
     assert activity_detail["user"]["slack_id"] == "U_TEST_001"
     assert activity_detail["program"]["slack_channel"] == "C_TEST_001"
+    assert activity_summary["current_streak"] == 1
+
+    # 4. Retrieve the streak
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/streak", headers=headers
+    )
+    assert response.status_code == 200
+    streak = response.json()
+    assert streak["current_length"] == 1
+    assert streak["longest_length"] == 1
+
+    # 5. Retrieve the heatmap
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/heatmap", headers=headers
+    )
+    assert response.status_code == 200
+    heatmap = response.json()
+    assert heatmap["days_active"] == 1
+    assert len(heatmap["days"]) == 1
+
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/heatmap/team",
+        params={"slack_id": ["U_TEST_001"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["days_all_active"] == 1
+
+    # 6. Retrieve the leaderboard
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/leaderboard", headers=headers
+    )
+    assert response.status_code == 200
+    leaderboard = response.json()
+    assert leaderboard["participants"] == 1
+    assert leaderboard["me"]["rank"] == 1
+    assert leaderboard["entries"][0]["slack_id"] == "U_TEST_001"
+
+    # 7. Retrieve the program dashboard
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/dashboard"
+    )
+    assert response.status_code == 200
+    dashboard = response.json()
+    assert dashboard["members"] == 1
+    assert dashboard["participation_rate"] == 1.0
+    assert dashboard["current"]["total_activities"] == 1
+    assert dashboard["daily"][-1]["activity_count"] == 1
+
+    # 8. Retrieve the activity history by cycle range
+    current_key = cycle_key_of(datetime.now(UTC))
+    response = await async_client.get(
+        f"/programs/{program_data['slack_channel']}/activities/history",
+        params={"from": cycle_reference(current_key - 1)},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    history = response.json()
+    assert [group["count"] for group in history] == [0, 1]
+    assert history[1]["cycle_reference"] == cycle_reference(current_key)
+    assert history[1]["activities"][0]["id"] == activity_id
+
+    response = await async_client.get(
+        "/activities",
+        params={"reference_date": cycle_reference(current_key)},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [activity["id"] for activity in response.json()] == [activity_id]
+
+    response = await async_client.get(
+        "/activities/history",
+        params={"reference_date": cycle_reference(current_key)},
+        headers=headers,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_activity_twice_on_same_day_is_rejected(
+    async_client: AsyncClient,
+):
+    program_payload = {
+        "name": "Same Day Challenge",
+        "slack_channel": "C_SAME_DAY_001",
+        "start_date": datetime(2020, 1, 1, tzinfo=UTC).isoformat(),
+    }
+    response = await async_client.post("/programs", json=program_payload)
+    assert response.status_code == 201
+
+    headers = {"x-slack-user-id": "U_SAME_DAY_001"}
+    url = "/programs/C_SAME_DAY_001/activities"
+
+    first = await async_client.post(
+        url, json={"description": "Morning run"}, headers=headers
+    )
+    assert first.status_code == 201
+
+    second = await async_client.post(
+        url, json={"description": "Evening run"}, headers=headers
+    )
+    assert second.status_code == 422
+    assert "already registered" in second.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_move_activity_onto_a_taken_day_is_rejected(
+    async_client: AsyncClient,
+):
+    program_payload = {
+        "name": "Move Day Challenge",
+        "slack_channel": "C_MOVE_DAY_001",
+        "start_date": datetime(2020, 1, 1, tzinfo=UTC).isoformat(),
+    }
+    response = await async_client.post("/programs", json=program_payload)
+    assert response.status_code == 201
+
+    headers = {"x-slack-user-id": "U_MOVE_DAY_001"}
+    url = "/programs/C_MOVE_DAY_001/activities"
+    today = datetime.now(UTC)
+    yesterday = today - timedelta(days=1)
+
+    first = await async_client.post(
+        url,
+        json={"description": "Run", "performed_at": today.isoformat()},
+        headers=headers,
+    )
+    assert first.status_code == 201
+    second = await async_client.post(
+        url,
+        json={"description": "Ride", "performed_at": yesterday.isoformat()},
+        headers=headers,
+    )
+    assert second.status_code == 201
+
+    response = await async_client.patch(
+        f"/activities/{second.json()['id']}",
+        json={"performed_at": today.isoformat()},
+        headers=headers,
+    )
+    assert response.status_code == 422
+    assert "already registered" in response.json()["detail"]
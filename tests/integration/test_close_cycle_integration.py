@@ -55,6 +55,59 @@ async def test_close_cycle_success(async_client: AsyncClient):
     assert close_resp.status_code == 200
     close_data = close_resp.json()
 
-    assert close_data["total_created"] == 1
+    # Awarded when the goal was reached, so the close creates nothing new.
+    assert close_data["total_created"] == 0
     assert close_data["program_name"] == "Cycle Challenge"
     assert "User Cycle" in close_data["users"]
+
+
+@pytest.mark.asyncio
+async def test_goal_achievement_is_awarded_and_revoked_in_real_time(
+    async_client: AsyncClient,
+):
+    user_payload = {"slack_id": "U_GOAL_001", "display_name": "User Goal"}
+    assert (await async_client.post("/users", json=user_payload)).status_code == 200
+
+    now = datetime.now(UTC)
+    program_payload = {
+        "name": "Goal Challenge",
+        "slack_channel": "C_GOAL_001",
+        "start_date": datetime(now.year, now.month, 1, tzinfo=UTC).isoformat(),
+    }
+    assert (
+        await async_client.post("/programs", json=program_payload)
+    ).status_code == 201
+
+    headers = {"x-slack-user-id": "U_GOAL_001"}
+    responses = []
+    for day in range(1, 13):
+        performed_at = datetime(now.year, now.month, day, 12, tzinfo=UTC)
+        resp = await async_client.post(
+            "/programs/C_GOAL_001/activities",
+            json={
+                "description": f"Run {day}",
+                "performed_at": performed_at.isoformat(),
+            },
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        responses.append(resp.json())
+
+    assert [r["achievement_awarded"] for r in responses] == [False] * 11 + [True]
+
+    cycle_ref = f"{now.year}-{now.month:02d}"
+    close_resp = await async_client.post(
+        f"/programs/Goal Challenge/close-cycle/{cycle_ref}"
+    )
+    assert close_resp.json()["users"] == ["User Goal"]
+
+    delete_resp = await async_client.delete(
+        f"/activities/{responses[0]['id']}", headers=headers
+    )
+    assert delete_resp.status_code == 204
+
+    close_resp = await async_client.post(
+        f"/programs/Goal Challenge/close-cycle/{cycle_ref}"
+    )
+    assert close_resp.status_code == 200
+    assert close_resp.json() is None
@@ -10,3 +10,13 @@ async def test_health_check(async_client: AsyncClient):
         "status": "healthy",
         "message": "Sports Program API is running!",
     }
+
+
+@pytest.mark.asyncio
+async def test_slack_listeners_health(async_client: AsyncClient):
+    response = await async_client.get("/health/slack-listeners")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["running"] == 0
+    assert body["queued"] == 0
+    assert body["max_concurrency"] > 0
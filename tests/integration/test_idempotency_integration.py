@@ -0,0 +1,102 @@
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_retried_activity_creation_replays_stored_response(
+    async_client: AsyncClient,
+):
+    program_payload = {
+        "name": "Idempotency Challenge",
+        "slack_channel": "C_IDEMPOTENCY_001",
+        "start_date": datetime.now(UTC).isoformat(),
+    }
+    headers = {"Idempotency-Key": "create-program-001"}
+    first = await async_client.post("/programs", json=program_payload, headers=headers)
+    retry = await async_client.post("/programs", json=program_payload, headers=headers)
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+
+    activity_headers = {
+        "x-slack-user-id": "U_IDEMPOTENCY_001",
+        "Idempotency-Key": "create-activity-001",
+    }
+    activity_payload = {"description": "Idempotent run"}
+    first = await async_client.post(
+        "/programs/C_IDEMPOTENCY_001/activities",
+        json=activity_payload,
+        headers=activity_headers,
+    )
+    retry = await async_client.post(
+        "/programs/C_IDEMPOTENCY_001/activities",
+        json=activity_payload,
+        headers=activity_headers,
+    )
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["location"] == first.headers["location"]
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_reused_with_different_payload_is_rejected(
+    async_client: AsyncClient,
+):
+    headers = {"Idempotency-Key": "create-program-002"}
+    payload = {
+        "name": "Idempotency Mismatch",
+        "slack_channel": "C_IDEMPOTENCY_002",
+        "start_date": datetime.now(UTC).isoformat(),
+    }
+    first = await async_client.post("/programs", json=payload, headers=headers)
+    other = await async_client.post(
+        "/programs", json={**payload, "name": "Other Program"}, headers=headers
+    )
+
+    assert first.status_code == 201
+    assert other.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_idempotency_key(async_client: AsyncClient):
+    headers = {"Idempotency-Key": "close-cycle-001"}
+
+    first = await async_client.post(
+        "/programs/Missing Program/close-cycle/2026-01", headers=headers
+    )
+    retry = await async_client.post(
+        "/programs/Missing Program/close-cycle/2026-01", headers=headers
+    )
+
+    assert first.status_code == 404
+    assert retry.status_code == 404
+    assert "idempotent-replayed" not in retry.headers
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_is_scoped_to_the_endpoint(async_client: AsyncClient):
+    headers = {"Idempotency-Key": "shared-key-001"}
+    program = await async_client.post(
+        "/programs",
+        json={
+            "name": "Idempotency Scope",
+            "slack_channel": "C_IDEMPOTENCY_003",
+            "start_date": datetime.now(UTC).isoformat(),
+        },
+        headers=headers,
+    )
+    activity = await async_client.post(
+        "/programs/C_IDEMPOTENCY_003/activities",
+        json={"description": "Scoped run"},
+        headers={**headers, "x-slack-user-id": "U_IDEMPOTENCY_003"},
+    )
+
+    assert program.status_code == 201
+    assert activity.status_code == 201
+    assert "idempotent-replayed" not in activity.headers
@@ -0,0 +1,80 @@
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.job_handlers import build_job_worker
+
+
+@pytest.mark.asyncio
+async def test_close_cycle_respond_async_runs_as_job(async_client: AsyncClient):
+    user_payload = {"slack_id": "U_JOBS_001", "display_name": "User Jobs"}
+    assert (await async_client.post("/users", json=user_payload)).status_code == 200
+
+    now = datetime.now(UTC)
+    program_payload = {
+        "name": "Async Cycle Challenge",
+        "slack_channel": "C_JOBS_001",
+        "start_date": datetime(now.year, now.month, 1, tzinfo=UTC).isoformat(),
+    }
+    resp = await async_client.post("/programs", json=program_payload)
+    assert resp.status_code == 201
+
+    for day in range(1, 13):
+        performed_at = datetime(now.year, now.month, day, 12, tzinfo=UTC)
+        resp = await async_client.post(
+            "/programs/C_JOBS_001/activities",
+            json={
+                "description": f"Run {day}",
+                "performed_at": performed_at.isoformat(),
+            },
+            headers={"x-slack-user-id": "U_JOBS_001"},
+        )
+        assert resp.status_code == 201
+
+    cycle_ref = f"{now.year}-{now.month:02d}"
+    response = await async_client.post(
+        f"/programs/Async Cycle Challenge/close-cycle/{cycle_ref}",
+        headers={"Prefer": "respond-async"},
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["location"] == f"/jobs/{job['id']}"
+    assert job["kind"] == "close_cycle"
+    assert job["status"] == "queued"
+
+    assert await build_job_worker().run_next() is True
+
+    status_response = await async_client.get(response.headers["location"])
+    assert status_response.status_code == 200
+    job = status_response.json()
+    assert job["status"] == "succeeded"
+    assert job["progress"] == 100
+    assert job["result"]["total_created"] == 0
+    assert job["result"]["users"] == ["User Jobs"]
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_job_returns_404(async_client: AsyncClient):
+    response = await async_client.get("/jobs/999999")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_slack_directory_sync_runs_as_job(async_client: AsyncClient):
+    response = await async_client.post("/users/slack-sync")
+
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["location"] == f"/jobs/{job['id']}"
+    assert job["kind"] == "slack_directory_sync"
+    assert job["status"] == "queued"
+
+    assert await build_job_worker().run_next() is True
+
+    job = (await async_client.get(response.headers["location"])).json()
+    assert job["status"] == "succeeded"
+    assert job["result"]["workspaces"] == 0
+    assert job["result"]["failed_workspaces"] == []
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+
+
+@pytest.fixture
+async def sqlite_sessions():
+    """
+    Returns `create(*models)`, which builds an in-memory SQLite database with
+    the tables of `models` and returns an async_sessionmaker bound to it.
+    """
+    engines = []
+
+    async def create(*models) -> async_sessionmaker[AsyncSession]:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        engines.append(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all, tables=[model.__table__ for model in models]
+            )
+        return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    yield create
+    for engine in engines:
+        await engine.dispose()
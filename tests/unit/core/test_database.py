@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.database import ConcurrentReads, LazySession
+
+
+def _session_factory(sessions: list):
+    def factory():
+        session = AsyncMock()
+        sessions.append(session)
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    return factory
+
+
+@pytest.mark.anyio
+async def test_concurrent_reads_uses_one_session_per_query():
+    sessions = []
+    reads = ConcurrentReads(_session_factory(sessions))
+
+    async def first(session):
+        return ("first", session)
+
+    async def second(session):
+        return ("second", session)
+
+    result = await reads.gather(first, second)
+
+    assert [name for name, _ in result] == ["first", "second"]
+    assert len(sessions) == 2
+    assert result[0][1] is not result[1][1]
+
+
+@pytest.mark.anyio
+async def test_concurrent_reads_runs_queries_concurrently():
+    reads = ConcurrentReads(_session_factory([]))
+    started = asyncio.Event()
+
+    async def waiter(session):
+        await asyncio.wait_for(started.wait(), timeout=1)
+        return "waited"
+
+    async def signaler(session):
+        started.set()
+        return "signaled"
+
+    result = await reads.gather(waiter, signaler)
+
+    assert result == ["waited", "signaled"]
+
+
+@pytest.mark.anyio
+async def test_concurrent_reads_propagates_errors():
+    reads = ConcurrentReads(_session_factory([]))
+
+    async def failing(session):
+        raise RuntimeError("DB Error")
+
+    with pytest.raises(RuntimeError, match="DB Error"):
+        await reads.gather(failing)
+
+
+@pytest.mark.anyio
+async def test_lazy_session_is_not_created_until_used():
+    factory = MagicMock()
+    db = LazySession(factory)
+
+    await db.aclose()
+
+    factory.assert_not_called()
+    assert not db.opened
+
+
+@pytest.mark.anyio
+async def test_lazy_session_creates_session_once_on_first_use():
+    session = AsyncMock()
+    factory = MagicMock(return_value=session)
+    db = LazySession(factory)
+
+    await db.execute("SELECT 1")
+    await db.commit()
+    await db.aclose()
+
+    factory.assert_called_once_with()
+    session.execute.assert_awaited_once_with("SELECT 1")
+    session.commit.assert_awaited_once()
+    session.close.assert_awaited_once()
+    assert not db.opened
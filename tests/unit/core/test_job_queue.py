@@ -0,0 +1,189 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.job_queue import JobWorker, enqueue_job, is_retryable
+from app.exceptions.business import (
+    BusinessRuleViolationError,
+    EntityNotFoundError,
+    ExternalServiceError,
+)
+from app.models.job import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, Job
+from app.repositories.job_repository import JobRepository
+
+
+@pytest.fixture
+async def session_factory(sqlite_sessions):
+    return await sqlite_sessions(Job)
+
+
+async def _enqueue(session_factory, kind="echo", payload=None, max_attempts=3):
+    async with session_factory() as session:
+        return await enqueue_job(session, kind, payload or {}, max_attempts)
+
+
+async def _job(session_factory, job_id):
+    async with session_factory() as session:
+        return await JobRepository(session).get_by_id(job_id)
+
+
+def test_is_retryable():
+    assert is_retryable(RuntimeError("db down"))
+    assert is_retryable(ExternalServiceError("Slack", "timeout"))
+    assert not is_retryable(EntityNotFoundError("Program", "x"))
+    assert not is_retryable(BusinessRuleViolationError("invalid"))
+
+
+@pytest.mark.anyio
+async def test_claim_takes_each_job_once(session_factory):
+    job = await _enqueue(session_factory)
+    now = datetime.now(UTC)
+    lock = now + timedelta(minutes=5)
+
+    async with session_factory() as session:
+        claimed = await JobRepository(session).claim("worker-1", now, lock)
+    async with session_factory() as session:
+        again = await JobRepository(session).claim("worker-2", now, lock)
+
+    assert claimed.id == job.id
+    assert claimed.status == JOB_RUNNING
+    assert claimed.attempts == 1
+    assert claimed.locked_by == "worker-1"
+    assert again is None
+
+
+@pytest.mark.anyio
+async def test_claim_recovers_job_with_expired_lock(session_factory):
+    await _enqueue(session_factory)
+    now = datetime.now(UTC)
+
+    async with session_factory() as session:
+        await JobRepository(session).claim("dead", now, now - timedelta(seconds=1))
+    async with session_factory() as session:
+        claimed = await JobRepository(session).claim(
+            "worker-2", now, now + timedelta(minutes=5)
+        )
+
+    assert claimed.locked_by == "worker-2"
+    assert claimed.attempts == 2
+
+
+@pytest.mark.anyio
+async def test_worker_fails_expired_job_without_attempts_left(session_factory):
+    job = await _enqueue(session_factory, max_attempts=1)
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        await JobRepository(session).claim("dead", now, now - timedelta(seconds=1))
+
+    worker = JobWorker(session_factory, {})
+
+    assert await worker.run_next() is False
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_FAILED
+    assert stored.attempts == 1
+    assert stored.locked_by is None
+    assert stored.finished_at is not None
+
+
+@pytest.mark.anyio
+async def test_claim_skips_jobs_not_yet_due(session_factory):
+    job = await _enqueue(session_factory)
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        await JobRepository(session).claim("worker-1", now, now + timedelta(minutes=5))
+        await JobRepository(session).mark_failed(
+            job.id, "worker-1", "boom", now + timedelta(minutes=1), now
+        )
+        claimed = await JobRepository(session).claim(
+            "worker-1", now, now + timedelta(minutes=5)
+        )
+
+    assert claimed is None
+
+
+@pytest.mark.anyio
+async def test_outcome_of_a_lost_lease_is_not_recorded(session_factory):
+    job = await _enqueue(session_factory)
+    now = datetime.now(UTC)
+
+    async with session_factory() as session:
+        repo = JobRepository(session)
+        await repo.claim("dead", now, now - timedelta(seconds=1))
+        await repo.claim("worker-2", now, now + timedelta(minutes=5))
+
+        assert await repo.mark_succeeded(job.id, "dead", None, now) is False
+        assert await repo.mark_failed(job.id, "dead", "boom", None, now) is False
+        assert await repo.mark_succeeded(job.id, "worker-2", None, now) is True
+
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_SUCCEEDED
+    assert stored.last_error is None
+
+
+@pytest.mark.anyio
+async def test_worker_runs_handler_and_stores_result(session_factory):
+    async def echo(context):
+        await context.report_progress(50, "halfway")
+        return {"echo": context.payload["value"], "attempt": context.attempt}
+
+    job = await _enqueue(session_factory, payload={"value": 7})
+    worker = JobWorker(session_factory, {"echo": echo})
+
+    assert await worker.run_next() is True
+    assert await worker.run_next() is False
+
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_SUCCEEDED
+    assert stored.progress == 100
+    assert stored.progress_detail == "halfway"
+    assert stored.result == '{"echo": 7, "attempt": 1}'
+    assert stored.locked_by is None
+    assert stored.finished_at is not None
+
+
+@pytest.mark.anyio
+async def test_worker_retries_with_backoff_then_fails(session_factory):
+    async def flaky(context):
+        raise RuntimeError("db down")
+
+    job = await _enqueue(session_factory, kind="flaky", max_attempts=2)
+    worker = JobWorker(session_factory, {"flaky": flaky}, retry_backoff_seconds=0)
+
+    before = datetime.now(UTC)
+    await worker.run_next()
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_QUEUED
+    assert stored.attempts == 1
+    assert "db down" in stored.last_error
+    assert stored.run_after.replace(tzinfo=UTC) >= before.replace(microsecond=0)
+
+    await worker.run_next()
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_FAILED
+    assert stored.attempts == 2
+
+
+@pytest.mark.anyio
+async def test_worker_does_not_retry_business_errors(session_factory):
+    async def missing(context):
+        raise EntityNotFoundError("Program", "x")
+
+    job = await _enqueue(session_factory, kind="missing")
+    worker = JobWorker(session_factory, {"missing": missing})
+
+    await worker.run_next()
+
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_FAILED
+    assert stored.attempts == 1
+
+
+@pytest.mark.anyio
+async def test_worker_fails_jobs_without_handler(session_factory):
+    job = await _enqueue(session_factory, kind="unknown", max_attempts=1)
+
+    await JobWorker(session_factory, {}).run_next()
+
+    stored = await _job(session_factory, job.id)
+    assert stored.status == JOB_FAILED
+    assert "unknown" in stored.last_error
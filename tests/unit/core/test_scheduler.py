@@ -0,0 +1,134 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.scheduler import ScheduledJob, Scheduler, daily_at, every, monthly_at
+from app.models.scheduled_job import JobLease, JobRun
+
+
+@pytest.fixture
+async def session_factory(sqlite_sessions):
+    return await sqlite_sessions(JobLease, JobRun)
+
+
+async def _runs(session_factory):
+    async with session_factory() as session:
+        return (await session.execute(select(JobRun))).scalars().all()
+
+
+def test_every_adds_interval():
+    now = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+
+    assert every(60)(now) == datetime(2026, 3, 10, 12, 1, tzinfo=UTC)
+
+
+def test_daily_at_uses_local_time():
+    # 12:00 UTC is 09:00 in Sao Paulo, so 03:00 local is the next day
+    now = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+
+    assert daily_at(3)(now) == datetime(2026, 3, 11, 6, 0, tzinfo=UTC)
+
+
+def test_monthly_at_rolls_over_the_year():
+    now = datetime(2026, 12, 15, 12, 0, tzinfo=UTC)
+
+    assert monthly_at(1, 0, 10)(now) == datetime(2027, 1, 1, 3, 10, tzinfo=UTC)
+
+
+def test_monthly_at_same_month_when_still_ahead():
+    now = datetime(2026, 3, 1, 2, 0, tzinfo=UTC)
+
+    assert monthly_at(1, 0, 10)(now) == datetime(2026, 3, 1, 3, 10, tzinfo=UTC)
+
+
+@pytest.mark.anyio
+async def test_only_one_replica_runs_a_job(session_factory):
+    calls = []
+
+    async def job():
+        calls.append(True)
+        return {"closed": 1}
+
+    leader = Scheduler(session_factory, lease_seconds=60, holder="replica-1")
+    follower = Scheduler(session_factory, lease_seconds=60, holder="replica-2")
+    scheduled = ScheduledJob("close-previous-cycle", every(60), job)
+
+    assert await leader.run_once(scheduled) is True
+    assert await follower.run_once(scheduled) is False
+    assert await leader.run_once(scheduled) is True
+
+    assert len(calls) == 2
+    runs = await _runs(session_factory)
+    assert [run.holder for run in runs] == ["replica-1", "replica-1"]
+    assert runs[0].status == "succeeded"
+    assert runs[0].detail == "{'closed': 1}"
+    assert runs[0].duration_ms >= 0
+
+
+@pytest.mark.anyio
+async def test_expired_lease_is_taken_over(session_factory):
+    async def job():
+        return None
+
+    crashed = Scheduler(session_factory, lease_seconds=-1, holder="replica-1")
+    survivor = Scheduler(session_factory, lease_seconds=60, holder="replica-2")
+    scheduled = ScheduledJob("purge-expired-records", every(60), job)
+
+    assert await crashed.run_once(scheduled) is True
+    assert await survivor.run_once(scheduled) is True
+
+
+@pytest.mark.anyio
+async def test_failed_run_is_recorded(session_factory):
+    async def job():
+        raise RuntimeError("boom")
+
+    scheduler = Scheduler(session_factory, lease_seconds=60, holder="replica-1")
+
+    assert await scheduler.run_once(ScheduledJob("broken", every(60), job)) is True
+
+    [run] = await _runs(session_factory)
+    assert run.status == "failed"
+    assert "boom" in run.error
+
+
+@pytest.mark.anyio
+async def test_start_and_stop_cancel_job_loops(session_factory):
+    scheduler = Scheduler(session_factory, lease_seconds=60, holder="replica-1")
+    scheduler.add("idle", every(3600), lambda: None)
+
+    scheduler.start()
+    await scheduler.stop()
+
+    assert await _runs(session_factory) == []
+
+
+@pytest.mark.anyio
+async def test_catch_up_runs_each_missed_occurrence(session_factory):
+    calls = []
+
+    async def job(scheduled_at):
+        calls.append(scheduled_at)
+
+    scheduler = Scheduler(session_factory, lease_seconds=60, holder="replica-1")
+    scheduled = ScheduledJob("close-previous-cycle", every(3600), job, catch_up=True)
+    assert await scheduler.catch_up(scheduled) == 0
+
+    last_run = datetime.now(UTC) - timedelta(hours=2, minutes=30)
+    async with session_factory() as session:
+        session.add(
+            JobRun(
+                job_name=scheduled.name,
+                holder="replica-0",
+                status="succeeded",
+                started_at=last_run,
+                finished_at=last_run,
+                duration_ms=0,
+            )
+        )
+        await session.commit()
+
+    assert await scheduler.catch_up(scheduled) == 2
+    assert calls == [last_run + timedelta(hours=1), last_run + timedelta(hours=2)]
+    assert await scheduler.catch_up(scheduled) == 0
@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+from app.core.database import LazySession
+from app.core.slack import (
+    BUSY_TEXT,
+    bounded_listener,
+    close_db_session,
+    deduplicate_events,
+    inject_db_session,
+    is_actionable_event,
+    prefilter_events,
+    slack_app,
+)
+from app.core.slack_events import SlackEventDeduplicator
+from app.core.slack_executor import ListenerExecutor, ListenerPriority
+
+
+def _event_body(**event):
+    return {"type": "event_callback", "event": event}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        _event_body(type="message", channel_type="im", text="help"),
+        _event_body(type="app_mention", channel_type="channel", text="<@B1> run"),
+        {"command": "/list-programs"},
+    ],
+)
+def test_actionable_events(body):
+    assert is_actionable_event(body)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        _event_body(type="message", channel_type="channel", text="hi"),
+        _event_body(type="message", channel_type="im", bot_id="B1"),
+        _event_body(type="message", channel_type="im", subtype="message_changed"),
+        _event_body(type="app_mention", bot_id="B1", text="<@B2> hi"),
+    ],
+)
+def test_non_actionable_events(body):
+    assert not is_actionable_event(body)
+
+
+@pytest.mark.anyio
+async def test_prefilter_acks_and_stops_non_actionable_events():
+    ack = AsyncMock()
+    next_ = AsyncMock()
+
+    await prefilter_events(
+        _event_body(type="message", channel_type="channel"), ack, next_
+    )
+
+    ack.assert_awaited_once()
+    next_.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_prefilter_passes_actionable_events():
+    ack = AsyncMock()
+    next_ = AsyncMock()
+
+    await prefilter_events(_event_body(type="message", channel_type="im"), ack, next_)
+
+    ack.assert_not_awaited()
+    next_.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_inject_db_session_sets_lazy_session():
+    context = {}
+    factory = MagicMock()
+    next_ = AsyncMock()
+
+    with patch("app.core.slack.async_session", factory):
+        await inject_db_session(context, next_)
+
+    assert isinstance(context["db"], LazySession)
+    factory.assert_not_called()
+    next_.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_completion_handler_closes_session_after_listener():
+    session = AsyncMock()
+    request = AsyncBoltRequest(body="", headers={})
+    request.context["db"] = LazySession(MagicMock(return_value=session))
+    await request.context["db"].execute("SELECT 1")
+
+    handler = slack_app.listener_runner.listener_completion_handler
+    await handler.handle(request=request, response=None)
+
+    session.close.assert_awaited_once()
+    assert not request.context["db"].opened
+
+
+@pytest.mark.anyio
+async def test_close_db_session_skips_unused_session():
+    factory = MagicMock()
+
+    await close_db_session({"db": LazySession(factory)})
+
+    factory.assert_not_called()
+
+
+def _draining_executor():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=0)
+    executor._draining = True
+    return executor
+
+
+@pytest.mark.anyio
+async def test_rejected_command_gets_busy_reply_in_ack_body():
+    ack = AsyncMock()
+    ack.response = None
+    listener_body = AsyncMock()
+
+    with patch("app.core.slack.slack_listener_executor", _draining_executor()):
+        await bounded_listener()(listener_body)(
+            ack=ack, command={"text": ""}, context={}
+        )
+
+    listener_body.assert_not_awaited()
+    ack.assert_awaited_once_with(text=BUSY_TEXT, response_type="ephemeral")
+
+
+@pytest.mark.anyio
+async def test_rejected_mention_gets_busy_ephemeral():
+    context = MagicMock()
+    context.get.return_value = None
+    context.client.chat_postEphemeral = AsyncMock()
+    event = {"type": "app_mention", "channel": "C123", "user": "U123"}
+
+    with patch("app.core.slack.slack_listener_executor", _draining_executor()):
+        await bounded_listener()(AsyncMock())(event=event, context=context)
+
+    context.client.chat_postEphemeral.assert_awaited_once_with(
+        channel="C123", user="U123", text=BUSY_TEXT
+    )
+
+
+@pytest.mark.anyio
+async def test_rejected_low_priority_listener_is_dropped_silently():
+    context = MagicMock()
+    context.get.return_value = None
+    context.say = AsyncMock()
+    event = {"type": "message", "channel_type": "im", "text": "help"}
+
+    with patch("app.core.slack.slack_listener_executor", _draining_executor()):
+        await bounded_listener(ListenerPriority.LOW)(AsyncMock())(
+            event=event, context=context
+        )
+
+    context.say.assert_not_awaited()
+    context.client.chat_postEphemeral.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_deduplicate_events_drops_redelivery():
+    request = MagicMock()
+    request.headers = {"x-slack-retry-num": ["1"]}
+    body = _event_body(type="app_mention", text="<@B1> run")
+    body["event_id"] = "Ev1"
+    ack = AsyncMock()
+    next_ = AsyncMock()
+
+    with patch("app.core.slack.slack_event_deduplicator", SlackEventDeduplicator()):
+        await deduplicate_events(body, request, ack, next_)
+        await deduplicate_events(body, request, ack, next_)
+
+    next_.assert_awaited_once()
+    ack.assert_awaited_once()
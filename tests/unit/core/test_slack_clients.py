@@ -0,0 +1,41 @@
+import pytest
+
+from app.core.slack_clients import SlackClientPool
+
+
+def test_pool_reuses_client_per_token():
+    pool = SlackClientPool(max_clients=2)
+
+    assert pool.get("xoxb-1") is pool.get("xoxb-1")
+    assert pool.get("xoxb-1") is not pool.get("xoxb-2")
+
+
+def test_pool_evicts_least_recently_used_workspace():
+    pool = SlackClientPool(max_clients=2)
+    first = pool.get("xoxb-1")
+    pool.get("xoxb-2")
+    pool.get("xoxb-1")
+
+    pool.get("xoxb-3")
+
+    assert list(pool._clients) == ["xoxb-1", "xoxb-3"]
+    assert pool.get("xoxb-1") is first
+
+
+@pytest.mark.anyio
+async def test_pool_clients_share_one_session():
+    pool = SlackClientPool(max_clients=2)
+    early = pool.get("xoxb-1")
+
+    session = await pool.start()
+    late = pool.get("xoxb-2")
+
+    assert early.session is session
+    assert late.session is session
+    assert late.token == "xoxb-2"
+
+    await pool.close()
+
+    assert session.closed
+    assert pool.session is None
+    assert pool._clients == {}
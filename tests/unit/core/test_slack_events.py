@@ -0,0 +1,69 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from app.core.slack_events import SlackEventDeduplicator
+from app.models.slack_event import SlackEvent
+
+
+@pytest.fixture
+async def session_factory(sqlite_sessions):
+    return await sqlite_sessions(SlackEvent)
+
+
+@pytest.mark.anyio
+async def test_in_memory_window_drops_redeliveries():
+    dedup = SlackEventDeduplicator(window_size=10)
+
+    assert not await dedup.is_duplicate("Ev1")
+    assert await dedup.is_duplicate("Ev1")
+    assert not await dedup.is_duplicate("Ev2")
+
+
+@pytest.mark.anyio
+async def test_in_memory_window_is_bounded():
+    dedup = SlackEventDeduplicator(window_size=2)
+
+    for event_id in ("Ev1", "Ev2", "Ev3"):
+        await dedup.is_duplicate(event_id)
+
+    assert not await dedup.is_duplicate("Ev1")
+    assert await dedup.is_duplicate("Ev3")
+
+
+@pytest.mark.anyio
+async def test_database_claim_is_shared_between_replicas(session_factory):
+    first = SlackEventDeduplicator(session_factory=session_factory)
+    second = SlackEventDeduplicator(session_factory=session_factory)
+
+    assert not await first.is_duplicate("Ev1")
+    assert await second.is_duplicate("Ev1")
+    assert not await second.is_duplicate("Ev2")
+
+
+@pytest.mark.anyio
+async def test_expired_events_are_purged(session_factory):
+    async with session_factory() as session:
+        session.add(
+            SlackEvent(
+                event_id="EvOld", received_at=datetime.now(UTC) - timedelta(days=1)
+            )
+        )
+        await session.commit()
+    dedup = SlackEventDeduplicator(session_factory=session_factory, retention_seconds=0)
+
+    await dedup.is_duplicate("EvNew")
+
+    async with session_factory() as session:
+        ids = (await session.execute(select(SlackEvent.event_id))).scalars().all()
+    assert ids == ["EvNew"]
+
+
+@pytest.mark.anyio
+async def test_database_errors_fail_open():
+    factory = MagicMock(side_effect=RuntimeError("database down"))
+    dedup = SlackEventDeduplicator(session_factory=factory)
+
+    assert not await dedup.is_duplicate("Ev1")
@@ -0,0 +1,208 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from app.core.slack_executor import (
+    ListenerExecutor,
+    ListenerPriority,
+    ListenerRejectedError,
+)
+
+
+@pytest.mark.anyio
+async def test_executor_limits_concurrency():
+    executor = ListenerExecutor(max_concurrency=2, max_queue=10)
+    running = 0
+    peak = 0
+
+    async def listener():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await asyncio.gather(*(executor.run(listener) for _ in range(6)))
+
+    assert peak == 2
+    assert executor.stats().completed == 6
+
+
+@pytest.mark.anyio
+async def test_executor_reports_queue_depth_and_age():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=10)
+    release = asyncio.Event()
+
+    async def listener():
+        await release.wait()
+
+    tasks = [asyncio.create_task(executor.run(listener)) for _ in range(3)]
+    await asyncio.sleep(0.02)
+
+    stats = executor.stats()
+    assert stats.running == 1
+    assert stats.queued == 2
+    assert stats.oldest_queued_seconds > 0
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert executor.stats().queued == 0
+
+
+@pytest.mark.anyio
+async def test_executor_rejects_when_queue_is_full():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def listener():
+        await release.wait()
+
+    tasks = [asyncio.create_task(executor.run(listener)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ListenerRejectedError):
+        await executor.run(listener)
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert executor.stats().rejected == 1
+
+
+@pytest.mark.anyio
+async def test_executor_counts_failures():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=1)
+
+    async def listener():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await executor.run(listener)
+
+    assert executor.stats().failed == 1
+    assert executor.stats().running == 0
+
+
+@pytest.mark.anyio
+async def test_drain_waits_for_in_flight_listeners():
+    executor = ListenerExecutor(max_concurrency=2, max_queue=10)
+    finished = []
+
+    async def listener():
+        await asyncio.sleep(0.02)
+        finished.append(True)
+
+    tasks = [asyncio.create_task(executor.run(listener)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    assert await executor.drain(timeout=1)
+    assert finished == [True, True]
+    with pytest.raises(ListenerRejectedError):
+        await executor.run(listener)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.anyio
+async def test_drain_gives_up_after_timeout():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=1)
+
+    async def listener():
+        await asyncio.sleep(1)
+
+    task = asyncio.create_task(executor.run(listener))
+    await asyncio.sleep(0)
+
+    assert not await executor.drain(timeout=0.01)
+    task.cancel()
+
+
+@pytest.mark.anyio
+async def test_high_priority_listeners_are_admitted_first():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=10)
+    release = asyncio.Event()
+    order = []
+
+    async def blocker():
+        await release.wait()
+
+    async def listener(name):
+        order.append(name)
+
+    first = asyncio.create_task(executor.run(blocker))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(
+        executor.run(listener, "low", priority=ListenerPriority.LOW)
+    )
+    await asyncio.sleep(0)
+    high = asyncio.create_task(executor.run(listener, "high"))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(first, low, high)
+    assert order == ["high", "low"]
+
+
+@pytest.mark.anyio
+async def test_low_priority_queue_is_shorter():
+    executor = ListenerExecutor(
+        max_concurrency=1, max_queue=10, max_low_priority_queue=0
+    )
+    release = asyncio.Event()
+
+    async def listener():
+        await release.wait()
+
+    running = asyncio.create_task(executor.run(listener))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ListenerRejectedError):
+        await executor.run(listener, priority=ListenerPriority.LOW)
+    queued = asyncio.create_task(executor.run(listener))
+    await asyncio.sleep(0)
+    assert executor.stats().queued == 1
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+@pytest.mark.anyio
+async def test_waiting_listener_is_rejected_after_max_wait():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=10, max_wait_seconds=0.01)
+    release = asyncio.Event()
+
+    async def listener():
+        await release.wait()
+
+    running = asyncio.create_task(executor.run(listener))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ListenerRejectedError):
+        await executor.run(listener)
+    assert executor.stats().queued == 0
+
+    release.set()
+    await running
+    await executor.run(listener)
+    assert executor.stats().completed == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_leak_a_granted_slot():
+    executor = ListenerExecutor(max_concurrency=1, max_queue=10)
+    executor._available = 0
+
+    async def listener():
+        pass
+
+    waiting = asyncio.create_task(executor.run(listener))
+    await asyncio.sleep(0)
+    assert executor.stats().queued == 1
+
+    # The slot is granted, then the waiter is cancelled before it wakes up
+    executor._release()
+    waiting.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await waiting
+
+    assert executor._available == 1
+    assert executor.stats().running == 0
@@ -3,7 +3,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from slack_sdk.oauth.installation_store import Installation
 
-from app.core.slack_stores import SQLAlchemyInstallationStore, SQLAlchemyStateStore
+from app.core.slack_stores import (
+    SignedStateStore,
+    SQLAlchemyInstallationStore,
+    SQLAlchemyStateStore,
+)
 
 
 @pytest.mark.anyio
@@ -129,3 +133,74 @@ async def test_sqlalchemy_state_store_async_consume_failure_returns_false():
         result = await store.async_consume("state123")
 
         assert result is False
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_issues_single_use_states():
+    store = SignedStateStore("secret", expiration_seconds=600)
+
+    state = await store.async_issue()
+
+    assert await store.async_consume(state) is True
+    assert await store.async_consume(state) is False
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_rejects_tampered_and_foreign_states():
+    store = SignedStateStore("secret", expiration_seconds=600)
+    other = SignedStateStore("other-secret", expiration_seconds=600)
+    nonce, expires, signature = (await store.async_issue()).split(".")
+
+    assert (
+        await store.async_consume(f"{nonce}.{int(expires) + 60}.{signature}") is False
+    )
+    assert await store.async_consume(await other.async_issue()) is False
+    assert await store.async_consume("not-a-state") is False
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_rejects_expired_states():
+    store = SignedStateStore("secret", expiration_seconds=-1)
+
+    assert await store.async_consume(await store.async_issue()) is False
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_spent_set_is_bounded():
+    store = SignedStateStore("secret", expiration_seconds=600, max_spent=2)
+
+    for _ in range(3):
+        assert await store.async_consume(await store.async_issue()) is True
+
+    assert len(store._spent) == 2
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_checks_database_spent_set():
+    store = SignedStateStore(
+        "secret", expiration_seconds=600, session_factory=MagicMock()
+    )
+    state = await store.async_issue()
+
+    with patch("app.core.slack_stores.slack_oauth_context") as mock_context:
+        mock_service = AsyncMock()
+        mock_context.return_value.__aenter__.return_value = mock_service
+        mock_service.mark_state_spent.return_value = False
+
+        result = await store.async_consume(state)
+
+    assert result is False
+    mock_service.mark_state_spent.assert_called_once()
+    assert mock_service.mark_state_spent.call_args[0][0] == state.split(".")[0]
+
+
+@pytest.mark.anyio
+async def test_signed_state_store_fails_closed_on_database_error():
+    store = SignedStateStore(
+        "secret", expiration_seconds=600, session_factory=MagicMock()
+    )
+
+    with patch("app.core.slack_stores.slack_oauth_context") as mock_context:
+        mock_context.return_value.__aenter__.side_effect = Exception("DB Error")
+
+        assert await store.async_consume(await store.async_issue()) is False
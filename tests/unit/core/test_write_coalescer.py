@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.write_coalescer import WriteCoalescer
+from app.models.activity import Activity
+
+
+def _rows(batch):
+    return [SimpleNamespace(id=values["n"]) for values in batch]
+
+
+@pytest.fixture
+def coalescer():
+    return WriteCoalescer(MagicMock(), Activity, window_seconds=0.01, max_batch=50)
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_commits_burst_in_one_batch(coalescer):
+    coalescer._insert = AsyncMock(side_effect=_rows)
+
+    ids = await asyncio.gather(*(coalescer.submit({"n": n}) for n in range(20)))
+    await coalescer.close()
+
+    assert ids == list(range(20))
+    coalescer._insert.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_respects_max_batch(coalescer):
+    coalescer.max_batch = 5
+    coalescer._insert = AsyncMock(side_effect=_rows)
+
+    ids = await asyncio.gather(*(coalescer.submit({"n": n}) for n in range(12)))
+    await coalescer.close()
+
+    assert ids == list(range(12))
+    assert [len(call.args[0]) for call in coalescer._insert.await_args_list] == [
+        5,
+        5,
+        2,
+    ]
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_isolates_failing_row(coalescer):
+    async def insert(batch):
+        if any(values["n"] == 3 for values in batch):
+            raise ValueError("Integrity Error")
+        return _rows(batch)
+
+    coalescer._insert = AsyncMock(side_effect=insert)
+
+    results = await asyncio.gather(
+        *(coalescer.submit({"n": n}) for n in range(5)), return_exceptions=True
+    )
+    await coalescer.close()
+
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], ValueError)
+    assert results[4] == 4
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_close_without_writer(coalescer):
+    await coalescer.close()
+
+    assert coalescer._writer is None
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_fails_batch_on_unexpected_error(coalescer):
+    coalescer._insert = AsyncMock(side_effect=[[], _rows([{"n": 1}])])
+
+    with pytest.raises(ValueError):
+        await coalescer.submit({"n": 0})
+    assert await coalescer.submit({"n": 1}) == 1
+    await coalescer.close()
+
+
+@pytest.mark.anyio
+async def test_write_coalescer_new_writer_drains_queue_of_dead_one(coalescer):
+    coalescer._insert = AsyncMock(side_effect=_rows)
+    coalescer._ensure_writer()
+    coalescer._writer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await coalescer._writer
+    loop = asyncio.get_running_loop()
+    queued = loop.create_future()
+    await coalescer._queue.put(({"n": 0}, queued))
+
+    assert await coalescer.submit({"n": 1}) == 1
+    assert await queued == 0
+    await coalescer.close()
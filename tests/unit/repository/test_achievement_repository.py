@@ -19,21 +19,6 @@ def repo(mock_session):
     return AchievementRepository(mock_session)
 
 
-@pytest.mark.anyio
-async def test_achievement_repository_find_existing_user_ids(repo, mock_session):
-    # Mock result for existing achievements
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [1, 2]
-    mock_session.execute.return_value = mock_result
-
-    result = await repo.find_existing_user_ids(
-        program_id=1, cycle_reference="2023-10", user_ids=[1, 2, 3]
-    )
-
-    assert result == {1, 2}
-    mock_session.execute.assert_called_once()
-
-
 @pytest.mark.anyio
 async def test_find_pending_notification_returns_achievements(repo, mock_session):
     user = User(id=1, slack_id="U123", display_name="John")
@@ -92,3 +77,37 @@ async def test_mark_as_notified_empty_list(repo, mock_session):
     assert result == 0
     mock_session.execute.assert_not_called()
     mock_session.commit.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_achievement_repository_award_and_revoke_on_sqlite(sqlite_sessions):
+    session_factory = await sqlite_sessions(User, Program, Achievement)
+
+    async with session_factory() as session:
+        repo = AchievementRepository(session)
+
+        assert await repo.award(1, 1, "2026-10", ["bronze", "silver"]) == [
+            "bronze",
+            "silver",
+        ]
+        assert await repo.award(1, 1, "2026-10", ["bronze", "silver"]) == []
+        assert await repo.revoke_unnotified(1, 1, "2026-10", ["silver"]) == 1
+
+        created = await repo.award_many(
+            [
+                {"user_id": 1, "program_id": 1, "cycle_reference": "2026-10",
+                 "tier": "silver"},
+                {"user_id": 2, "program_id": 1, "cycle_reference": "2026-10",
+                 "tier": "bronze"},
+                {"user_id": 1, "program_id": 1, "cycle_reference": "2026-10",
+                 "tier": "bronze"},
+            ]
+        )
+        assert [(row.user_id, row.tier) for row in created] == [
+            (1, "silver"),
+            (2, "bronze"),
+        ]
+
+        achievements = await repo.find_by_program_and_cycle(1, "2026-10")
+        await repo.mark_as_notified([achievement.id for achievement in achievements])
+        assert await repo.revoke_unnotified(2, 1, "2026-10", ["bronze"]) == 0
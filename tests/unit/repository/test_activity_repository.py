@@ -1,4 +1,3 @@
-from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -75,45 +74,17 @@ async def test_find_by_user_id_and_slack_channel_and_date(repo, mock_session):
 
 
 @pytest.mark.anyio
-async def test_count_monthly(repo, mock_session):
-    mock_result = MagicMock()
-    mock_result.scalar.return_value = 0
-    mock_session.execute.return_value = mock_result
-
-    result = await repo.count_monthly(1, 2025, 12)
-
-    mock_session.execute.assert_called_once()
-    assert result == 0
-
-
-@pytest.mark.anyio
-async def test_check_activity_same_day(repo, mock_session):
+async def test_find_by_user_id_and_cycle_range(repo, mock_session):
     activity = mock_activity()
 
     mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = activity
+    mock_result.all.return_value = [(activity, 1)]
     mock_session.execute.return_value = mock_result
 
-    test_date = date(2025, 12, 15)
-
-    result = await repo.check_activity_same_day(3, 1, test_date)
-
-    mock_session.execute.assert_called()
-    assert result == activity
+    result = await repo.find_by_user_id_and_cycle_range(1, 24311, 24312, "C123")
 
-    result_excluded = await repo.check_activity_same_day(3, 1, test_date, exclude_id=99)
-    assert result_excluded == activity
-
-
-@pytest.mark.anyio
-async def test_find_users_with_completed_program(repo, mock_session):
-    user_ids = [1, 2, 3]
-
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = user_ids
-    mock_session.execute.return_value = mock_result
-
-    result = await repo.find_users_with_completed_program(1, 2025, 12, 10)
-
-    mock_session.execute.assert_called()
-    assert result == user_ids
+    mock_session.execute.assert_called_once()
+    stmt = str(mock_session.execute.call_args.args[0])
+    assert "BETWEEN" in stmt
+    assert "OVER (PARTITION BY activities.cycle_key)" in stmt
+    assert result == [(activity, 1)]
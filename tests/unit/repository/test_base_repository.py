@@ -1,6 +1,7 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -120,3 +121,160 @@ async def test_base_repository_create_many_rollback_on_exception():
         await repo.create_many(objs)
 
     session.rollback.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_insert_chunks_rows():
+    session = AsyncMock(spec=AsyncSession)
+    repo = BaseRepository(session, User)
+    rows = [{"slack_id": f"U{i}", "display_name": f"User {i}"} for i in range(5)]
+
+    results = [MagicMock(), MagicMock(), MagicMock()]
+    results[0].all.return_value = [(1,), (2,)]
+    results[1].all.return_value = [(3,), (4,)]
+    results[2].all.return_value = [(5,)]
+    session.execute.side_effect = results
+
+    result = await repo.bulk_insert(rows, chunk_size=2)
+
+    assert session.execute.call_count == 3
+    assert result == [(1,), (2,), (3,), (4,), (5,)]
+    session.commit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_insert_empty():
+    session = AsyncMock(spec=AsyncSession)
+    repo = BaseRepository(session, User)
+
+    result = await repo.bulk_insert([])
+
+    session.execute.assert_not_called()
+    assert result == []
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_insert_rollback_on_exception():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.side_effect = Exception("DB Error")
+    repo = BaseRepository(session, User)
+
+    with pytest.raises(Exception, match="DB Error"):
+        await repo.bulk_insert([{"slack_id": "U1", "display_name": "User 1"}])
+
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_update():
+    session = AsyncMock(spec=AsyncSession)
+    repo = BaseRepository(session, User)
+    rows = [{"id": i, "display_name": f"User {i}"} for i in range(1, 4)]
+
+    await repo.bulk_update(rows, chunk_size=2)
+
+    assert session.execute.call_count == 2
+    _, params = session.execute.call_args_list[0].args
+    assert params == [
+        {"_pk": 1, "display_name": "User 1"},
+        {"_pk": 2, "display_name": "User 2"},
+    ]
+    session.commit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_upsert_sqlite():
+    session = AsyncMock(spec=AsyncSession)
+    session.get_bind = MagicMock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repo = BaseRepository(session, User)
+
+    mock_result = MagicMock()
+    mock_result.all.return_value = [(1,)]
+    session.execute.return_value = mock_result
+
+    result = await repo.bulk_upsert(
+        [{"slack_id": "U1", "display_name": "User 1"}], conflict_columns=["slack_id"]
+    )
+
+    assert result == [(1,)]
+    stmt = session.execute.call_args.args[0]
+    assert "ON CONFLICT" in str(stmt.compile(dialect=sqlite.dialect()))
+    session.commit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_upsert_unsupported_dialect():
+    session = AsyncMock(spec=AsyncSession)
+    session.get_bind = MagicMock()
+    session.get_bind.return_value.dialect.name = "mysql"
+    repo = BaseRepository(session, User)
+
+    with pytest.raises(NotImplementedError):
+        await repo.bulk_upsert(
+            [{"slack_id": "U1", "display_name": "User 1"}],
+            conflict_columns=["slack_id"],
+        )
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_delete():
+    session = AsyncMock(spec=AsyncSession)
+    repo = BaseRepository(session, User)
+
+    mock_result = MagicMock()
+    mock_result.rowcount = 2
+    session.execute.return_value = mock_result
+
+    result = await repo.bulk_delete([1, 2, 3, 4], chunk_size=2)
+
+    assert result == 4
+    assert session.execute.call_count == 2
+    session.commit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_base_repository_bulk_insert_without_commit_leaves_the_transaction():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.side_effect = Exception("DB Error")
+    repo = BaseRepository(session, User)
+
+    with pytest.raises(Exception, match="DB Error"):
+        await repo.bulk_insert(
+            [{"slack_id": "U1", "display_name": "User 1"}], commit=False
+        )
+
+    session.commit.assert_not_called()
+    session.rollback.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_base_repository_groups_writes_in_the_caller_transaction(
+    sqlite_sessions,
+):
+    session_factory = await sqlite_sessions(User)
+
+    async with session_factory() as session:
+        repo = BaseRepository(session, User)
+        await repo.create(User(slack_id="U1", display_name="User 1"), commit=False)
+        await repo.bulk_insert(
+            [{"slack_id": "U2", "display_name": "User 2"}], commit=False
+        )
+        await session.rollback()
+
+        assert await repo.get_all() == []
+
+        [row] = await repo.bulk_insert(
+            [{"slack_id": "U3", "display_name": "User 3"}], commit=False
+        )
+        await repo.bulk_update(
+            [{"id": row.id, "display_name": "Renamed"}], commit=False
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        users = await BaseRepository(session, User).get_all()
+        assert [(user.slack_id, user.display_name) for user in users] == [
+            ("U3", "Renamed")
+        ]
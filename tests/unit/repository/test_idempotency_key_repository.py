@@ -0,0 +1,43 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+
+SCOPE = "POST /programs"
+
+
+@pytest.mark.anyio
+async def test_idempotency_key_repository_take_over_on_sqlite(sqlite_sessions):
+    session_factory = await sqlite_sessions(IdempotencyKey)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    lock = timedelta(seconds=60)
+
+    async with session_factory() as session:
+        repo = IdempotencyKeyRepository(session)
+        assert await repo.claim(SCOPE, "key-1", "hash", now, now + lock)
+        assert not await repo.claim(SCOPE, "key-1", "hash", now, now + lock)
+
+        assert not await repo.take_over(SCOPE, "key-1", now + lock / 2, now + lock * 2)
+        assert await repo.take_over(SCOPE, "key-1", now + lock * 2, now + lock * 3)
+
+        await repo.save_response(SCOPE, "key-1", 201, "{}", "{}")
+        assert not await repo.take_over(SCOPE, "key-1", now + lock * 4, now + lock * 5)
+        assert (await repo.find_by_key(SCOPE, "key-1")).locked_until is None
+
+
+@pytest.mark.anyio
+async def test_idempotency_key_repository_scopes_keys_on_sqlite(sqlite_sessions):
+    session_factory = await sqlite_sessions(IdempotencyKey)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    async with session_factory() as session:
+        repo = IdempotencyKeyRepository(session)
+        assert await repo.claim(SCOPE, "key-1", "hash", now, now)
+        assert await repo.claim("POST /achievements", "key-1", "other", now, now)
+
+        await repo.delete_by_key(SCOPE, "key-1")
+
+        assert await repo.find_by_key(SCOPE, "key-1") is None
+        assert await repo.find_by_key("POST /achievements", "key-1") is not None
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -60,3 +61,29 @@ async def test_slack_installation_repository_get_by_team_or_enterprise_team_prio
     assert result.team_id == "T123"
     # Should stop after finding by team
     assert session.execute.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_slack_installation_repository_find_latest_on_sqlite(sqlite_sessions):
+    session_factory = await sqlite_sessions(SlackInstallation)
+    installed_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    async with session_factory() as session:
+        repo = SlackInstallationRepository(session)
+        assert await repo.find_latest() is None
+
+        session.add_all(
+            [
+                SlackInstallation(
+                    team_id="T2", bot_token="xoxb-new", installed_at=installed_at
+                ),
+                SlackInstallation(
+                    team_id="T1",
+                    bot_token="xoxb-old",
+                    installed_at=installed_at - timedelta(days=1),
+                ),
+            ]
+        )
+        await session.commit()
+
+        assert (await repo.find_latest()).bot_token == "xoxb-new"
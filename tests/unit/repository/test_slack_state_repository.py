@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -25,17 +26,55 @@ async def test_slack_state_repository_find_by_state():
 
 
 @pytest.mark.anyio
-async def test_slack_state_repository_delete_by_state():
+async def test_slack_state_repository_consume_deletes_in_one_statement():
     session = AsyncMock(spec=AsyncSession)
     repo = SlackStateRepository(session)
-    state_obj = SlackState(id=1, state="state123")
 
-    # Mock find_by_state
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = state_obj
+    mock_result.first.return_value = (1,)
     session.execute.return_value = mock_result
 
-    await repo.delete_by_state("state123")
+    result = await repo.consume("state123", datetime.now(UTC))
 
-    session.delete.assert_called_once_with(state_obj)
+    assert result is True
+    session.execute.assert_called_once()
     session.commit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_slack_state_repository_consume_unknown_or_expired_state():
+    session = AsyncMock(spec=AsyncSession)
+    repo = SlackStateRepository(session)
+
+    mock_result = MagicMock()
+    mock_result.first.return_value = None
+    session.execute.return_value = mock_result
+
+    result = await repo.consume("state123", datetime.now(UTC))
+
+    assert result is False
+
+
+@pytest.mark.anyio
+async def test_slack_state_repository_consume_and_purge_on_sqlite(sqlite_sessions):
+    session_factory = await sqlite_sessions(SlackState)
+    now = datetime.now(UTC)
+
+    async with session_factory() as session:
+        repo = SlackStateRepository(session)
+        session.add_all(
+            [
+                SlackState(state="valid", expire_at=now + timedelta(minutes=5)),
+                SlackState(state="expired", expire_at=now - timedelta(minutes=5)),
+            ]
+        )
+        await session.commit()
+
+        assert await repo.consume("valid", now) is True
+        assert await repo.consume("valid", now) is False
+        assert await repo.consume("expired", now) is False
+        assert await repo.purge_expired(now) == 1
+        assert await repo.mark_spent("nonce", now + timedelta(minutes=5)) is True
+        assert await repo.mark_spent("nonce", now + timedelta(minutes=5)) is False
+        assert await repo.find_by_state("nonce") is None
+        assert await repo.consume("nonce", now) is False
@@ -35,3 +35,42 @@ async def test_user_repository_find_by_slack_id_not_found():
     result = await repo.find_by_slack_id("U999")
 
     assert result is None
+
+def _sqlite_session():
+    session = AsyncMock(spec=AsyncSession)
+    session.get_bind = MagicMock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    return session
+
+@pytest.mark.anyio
+async def test_user_repository_get_or_create_inserts():
+    session = _sqlite_session()
+    repo = UserRepository(session)
+    user = User(id=1, slack_id="U123", display_name="Test User")
+
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = user
+    session.execute.return_value = mock_result
+
+    result = await repo.get_or_create("U123", "Test User")
+
+    assert result == user
+    session.execute.assert_called_once()
+    session.commit.assert_called_once()
+
+@pytest.mark.anyio
+async def test_user_repository_get_or_create_returns_existing_on_conflict():
+    session = _sqlite_session()
+    repo = UserRepository(session)
+    user = User(id=1, slack_id="U123", display_name="Test User")
+
+    conflict_result = MagicMock()
+    conflict_result.scalar_one_or_none.return_value = None
+    select_result = MagicMock()
+    select_result.scalars.return_value.first.return_value = user
+    session.execute.side_effect = [conflict_result, select_result]
+
+    result = await repo.get_or_create("U123", "Other Name")
+
+    assert result == user
+    assert session.execute.call_count == 2
@@ -3,21 +3,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.exceptions.business import (
-    DatabaseError,
     EntityNotFoundError,
     ExternalServiceError,
 )
 from app.models.achievement import Achievement
 from app.models.program import Program
+from app.models.slack_installation import SlackInstallation
 from app.models.user import User
 from app.repositories.achievement_repository import AchievementRepository
 from app.repositories.activity_repository import ActivityRepository
 from app.repositories.program_repository import ProgramRepository
-from app.repositories.user_repository import UserRepository
+from app.repositories.slack_installation_repository import SlackInstallationRepository
 from app.schemas.achievement import (
-    AchievementBatchCreate,
     AchievementBatchResponse,
-    AchievementCreate,
 )
 from app.services.achievement_service import AchievementService
 
@@ -27,11 +25,6 @@ def mock_achievement_repo():
     return AsyncMock(spec=AchievementRepository)
 
 
-@pytest.fixture
-def mock_user_repo():
-    return AsyncMock(spec=UserRepository)
-
-
 @pytest.fixture
 def mock_program_repo():
     return AsyncMock(spec=ProgramRepository)
@@ -42,141 +35,28 @@ def mock_activity_repo():
     return AsyncMock(spec=ActivityRepository)
 
 
+@pytest.fixture
+def mock_installation_repo():
+    repo = AsyncMock(spec=SlackInstallationRepository)
+    repo.find_latest.return_value = SlackInstallation(bot_token="xoxb-team")
+    return repo
+
+
 @pytest.fixture
 def service(
         mock_achievement_repo,
-        mock_user_repo,
         mock_program_repo,
-        mock_activity_repo
+        mock_activity_repo,
+        mock_installation_repo,
 ):
     return AchievementService(
         achievement_repo=mock_achievement_repo,
-        user_repo=mock_user_repo,
         program_repo=mock_program_repo,
         activity_repo=mock_activity_repo,
+        installation_repo=mock_installation_repo,
     )
 
 
-@pytest.mark.anyio
-async def test_achievement_service_create_success(service, mock_achievement_repo):
-    achievement_create = AchievementCreate(cycle_reference="2023-10")
-    expected_achievement = Achievement(
-        id=1, user_id=1, program_id=1, cycle_reference="2023-10"
-    )
-
-    mock_achievement_repo.user_has_achievement.return_value = False
-    mock_achievement_repo.create.return_value = expected_achievement
-
-    result = await service.create(achievement_create, program_id=1, user_id=1)
-
-    assert result == expected_achievement
-    mock_achievement_repo.user_has_achievement.assert_called_once_with(
-        user_id=1, program_id=1, cycle_reference="2023-10"
-    )
-    mock_achievement_repo.create.assert_called_once()
-
-
-@pytest.mark.anyio
-async def test_achievement_service_create_database_error(
-    service, mock_achievement_repo
-):
-    achievement_create = AchievementCreate(cycle_reference="2023-10")
-
-    mock_achievement_repo.user_has_achievement.return_value = False
-
-    mock_achievement_repo.create.side_effect = Exception("DB Fail")
-
-    with pytest.raises(DatabaseError):
-        await service.create(achievement_create, program_id=1, user_id=1)
-
-
-@pytest.mark.anyio
-async def test_achievement_service_create_batch_success(
-    service, mock_achievement_repo, mock_user_repo
-):
-    batch_create = AchievementBatchCreate(
-        program_id=1, user_ids=[1, 2], cycle_reference="2023-10", program_name="Test"
-    )
-
-    # Mock no existing achievements
-    mock_achievement_repo.find_existing_user_ids.return_value = set()
-    # Mock user name fetching
-    mock_user_repo.find_all_by_ids.return_value = [
-        User(id=1, display_name="User 1"),
-        User(id=2, display_name="User 2"),
-    ]
-
-    result = await service.create_batch(batch_create)
-
-    assert result.total_created == 2
-    assert result.program_name == "Test"
-    assert "User 1" in result.users
-    assert "User 2" in result.users
-    mock_achievement_repo.find_existing_user_ids.assert_called_once()
-    mock_achievement_repo.create_many.assert_called_once()
-
-
-@pytest.mark.anyio
-async def test_achievement_service_create_batch_some_already_exist(
-    service, mock_achievement_repo, mock_user_repo, caplog
-):
-    batch_create = AchievementBatchCreate(
-        program_id=1, user_ids=[1, 2], cycle_reference="2023-10", program_name="Test"
-    )
-
-    # User 1 already has achievement
-    mock_achievement_repo.find_existing_user_ids.return_value = {1}
-    mock_user_repo.find_all_by_ids.return_value = [
-        User(id=2, display_name="User 2"),
-    ]
-
-    result = await service.create_batch(batch_create)
-
-    assert result.total_created == 1
-    assert "User 2" in result.users
-    assert "User 1" not in result.users
-    assert "Skipped 1 existing users" in caplog.text
-
-    mock_achievement_repo.create_many.assert_called_once()
-    args, _ = mock_achievement_repo.create_many.call_args
-    assert len(args[0]) == 1
-    assert args[0][0].user_id == 2
-
-
-@pytest.mark.anyio
-async def test_achievement_service_create_batch_database_error(
-    service, mock_achievement_repo
-):
-    batch_create = AchievementBatchCreate(
-        program_id=1, user_ids=[1], cycle_reference="2023-10", program_name="Test"
-    )
-
-    mock_achievement_repo.find_existing_user_ids.return_value = set()
-    mock_achievement_repo.create_many.side_effect = Exception("DB Error")
-
-    with pytest.raises(DatabaseError):
-        await service.create_batch(batch_create)
-
-
-@pytest.mark.anyio
-async def test_achievement_service_create_batch_all_already_exist(
-    service, mock_achievement_repo, mock_user_repo
-):
-    batch_create = AchievementBatchCreate(
-        program_id=1, user_ids=[1], cycle_reference="2023-10", program_name="Test"
-    )
-
-    # All users already have achievement
-    mock_achievement_repo.find_existing_user_ids.return_value = {1}
-
-    result = await service.create_batch(batch_create)
-
-    assert result.total_created == 0
-    assert result.users == []
-    mock_achievement_repo.create_many.assert_not_called()
-    mock_user_repo.find_all_by_ids.assert_not_called()
-
-
 @pytest.mark.anyio
 async def test_notify_achievements_program_not_found(service, mock_program_repo):
     mock_program_repo.find_by_name.return_value = None
@@ -213,7 +93,8 @@ async def test_notify_achievements_success(
         mock_program_repo,
         mock_achievement_repo
 ):
-    with patch("app.services.achievement_service.slack_app") as mock_slack:
+    with patch("app.services.utils.slack_client.slack_client_pool") as mock_pool:
+        mock_slack = mock_pool.get.return_value
         program = Program(id=1, name="Challenge", slack_channel="C123")
         user1 = User(id=1, slack_id="U111", display_name="John")
         user2 = User(id=2, slack_id="U222", display_name="Jane")
@@ -232,7 +113,7 @@ async def test_notify_achievements_success(
         mock_achievement_repo.find_pending_notification.return_value = [
             achievement1, achievement2
         ]
-        mock_slack.client.chat_postMessage = AsyncMock()
+        mock_slack.chat_postMessage = AsyncMock()
         mock_achievement_repo.mark_as_notified = AsyncMock()
 
         result = await service.notify_achievements(
@@ -244,7 +125,8 @@ async def test_notify_achievements_success(
         assert "Jane" in result.users
         assert "<@U111>" in result.message
         assert "<@U222>" in result.message
-        mock_slack.client.chat_postMessage.assert_called_once()
+        mock_pool.get.assert_called_once_with("xoxb-team")
+        mock_slack.chat_postMessage.assert_called_once()
         mock_achievement_repo.mark_as_notified.assert_called_once_with([1, 2])
 
 
@@ -254,7 +136,8 @@ async def test_notify_achievements_slack_error(
         mock_program_repo,
         mock_achievement_repo
 ):
-    with patch("app.services.achievement_service.slack_app") as mock_slack:
+    with patch("app.services.utils.slack_client.slack_client_pool") as mock_pool:
+        mock_slack = mock_pool.get.return_value
         program = Program(id=1, name="Challenge", slack_channel="C123")
         user = User(id=1, slack_id="U111", display_name="John")
 
@@ -265,7 +148,7 @@ async def test_notify_achievements_slack_error(
 
         mock_program_repo.find_by_name.return_value = program
         mock_achievement_repo.find_pending_notification.return_value = [achievement]
-        mock_slack.client.chat_postMessage = AsyncMock(
+        mock_slack.chat_postMessage = AsyncMock(
             side_effect=Exception("Slack API Error")
         )
 
@@ -278,38 +161,79 @@ async def test_notify_achievements_slack_error(
 
 
 @pytest.mark.anyio
-async def test_close_cycle_success(
+async def test_close_cycle_confirms_awarded_achievements(
         service,
         mock_program_repo,
         mock_activity_repo,
         mock_achievement_repo,
-        mock_user_repo
 ):
     program_name = "Challenge"
     cycle_reference = "2023-10"
     program = Program(id=1, name=program_name)
-    user_ids = [1, 2]
+    user1 = User(id=1, display_name="User 1")
+    user2 = User(id=2, display_name="User 2")
 
     mock_program_repo.find_by_name.return_value = program
-    mock_activity_repo.find_users_with_completed_program.return_value = user_ids
-    mock_achievement_repo.find_existing_user_ids.return_value = set()
-    mock_user_repo.find_all_by_ids.return_value = [
-        User(id=1, display_name="User 1"),
-        User(id=2, display_name="User 2"),
+    mock_achievement_repo.find_by_program_and_cycle.return_value = [
+        Achievement(id=1, user=user1, tier="bronze"),
+        Achievement(id=2, user=user1, tier="silver"),
+        Achievement(id=3, user=user2, tier="bronze"),
     ]
 
     result = await service.close_cycle(program_name, cycle_reference)
 
     assert isinstance(result, AchievementBatchResponse)
-    assert result.total_created == 2
+    assert result.total_created == 0
     assert result.program_name == program_name
     assert result.cycle_reference == cycle_reference
-    assert "User 1" in result.users
-    assert "User 2" in result.users
+    assert result.users == ["User 1", "User 2"]
+    assert result.tiers == {"bronze": ["User 1", "User 2"], "silver": ["User 1"]}
 
-    mock_program_repo.find_by_name.assert_called_once_with(program_name)
-    mock_activity_repo.find_users_with_completed_program.assert_called_once()
-    mock_achievement_repo.create_many.assert_called_once()
+    mock_achievement_repo.find_by_program_and_cycle.assert_called_once_with(
+        1, cycle_reference
+    )
+    mock_activity_repo.count_by_user_in_cycle.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_close_cycle_reconcile_awards_all_tiers_in_one_write(
+        service,
+        mock_program_repo,
+        mock_activity_repo,
+        mock_achievement_repo,
+):
+    program = Program(
+        id=1,
+        name="Challenge",
+        goal_tiers=[
+            {"name": "gold", "threshold": 20},
+            {"name": "bronze", "threshold": 8},
+            {"name": "silver", "threshold": 12},
+        ],
+    )
+    mock_program_repo.find_by_name.return_value = program
+    mock_activity_repo.count_by_user_in_cycle.return_value = [(1, 20), (2, 9)]
+    mock_achievement_repo.award_many.return_value = [(4, 2, "bronze")]
+    mock_achievement_repo.find_by_program_and_cycle.return_value = [
+        Achievement(id=1, user=User(id=1, display_name="User 1"), tier="bronze"),
+        Achievement(id=4, user=User(id=2, display_name="User 2"), tier="bronze"),
+    ]
+
+    result = await service.close_cycle("Challenge", "2023-10", reconcile=True)
+
+    assert result.total_created == 1
+    assert result.users == ["User 1", "User 2"]
+
+    mock_activity_repo.count_by_user_in_cycle.assert_called_once_with(
+        1, 2023, 10, 8
+    )
+    rows = mock_achievement_repo.award_many.call_args[0][0]
+    assert [(row["user_id"], row["tier"]) for row in rows] == [
+        (1, "bronze"),
+        (1, "silver"),
+        (1, "gold"),
+        (2, "bronze"),
+    ]
 
 
 @pytest.mark.anyio
@@ -323,16 +247,15 @@ async def test_close_cycle_program_not_found(service, mock_program_repo):
 
 @pytest.mark.anyio
 async def test_close_cycle_no_users_completed(
-    service, mock_program_repo, mock_activity_repo
+    service, mock_program_repo, mock_achievement_repo
 ):
     program_name = "Challenge"
     cycle_reference = "2023-10"
     program = Program(id=1, name=program_name)
 
     mock_program_repo.find_by_name.return_value = program
-    mock_activity_repo.find_users_with_completed_program.return_value = []
+    mock_achievement_repo.find_by_program_and_cycle.return_value = []
 
     result = await service.close_cycle(program_name, cycle_reference)
 
     assert result is None
-    mock_activity_repo.find_users_with_completed_program.assert_called_once()
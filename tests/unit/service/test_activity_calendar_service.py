@@ -0,0 +1,130 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions.business import BusinessRuleViolationError
+from app.models.activity import Activity
+from app.models.activity_calendar import ActivityCalendar
+from app.repositories.activity_calendar_repository import ActivityCalendarRepository
+from app.repositories.activity_repository import ActivityRepository
+from app.services.activity_calendar_service import ActivityCalendarService
+from app.utils.day_bitmap import BITMAP_BYTES, from_bytes, from_days
+
+PROGRAM_ID = 1
+YEAR = 2025
+
+
+@pytest.fixture
+async def session(sqlite_sessions):
+    session_factory = await sqlite_sessions(Activity, ActivityCalendar)
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def service(session):
+    return ActivityCalendarService(
+        ActivityCalendarRepository(session), ActivityRepository(session)
+    )
+
+
+async def _stored(session: AsyncSession, user_id: int = 1, year: int = YEAR) -> int:
+    result = await session.execute(
+        select(ActivityCalendar.days).where(
+            ActivityCalendar.user_id == user_id, ActivityCalendar.year == year
+        )
+    )
+    return from_bytes(result.scalar_one())
+
+
+@pytest.mark.anyio
+async def test_record_remove_and_move_day(service, session):
+    await service.record_day(1, PROGRAM_ID, date(YEAR, 1, 1))
+    await service.record_day(1, PROGRAM_ID, date(YEAR, 1, 2))
+    await service.record_day(1, PROGRAM_ID, date(YEAR, 1, 2))
+    assert await _stored(session) == from_days([date(YEAR, 1, 1), date(YEAR, 1, 2)])
+
+    await service.move_day(1, PROGRAM_ID, date(YEAR, 1, 2), date(YEAR + 1, 1, 5))
+    await service.remove_day(1, PROGRAM_ID, date(YEAR, 1, 1))
+
+    assert await _stored(session) == 0
+    assert await _stored(session, year=YEAR + 1) == from_days([date(YEAR + 1, 1, 5)])
+
+
+@pytest.mark.anyio
+async def test_bitmap_is_stored_in_46_bytes(service, session):
+    await service.record_day(1, PROGRAM_ID, date(2024, 12, 31))
+
+    result = await session.execute(select(ActivityCalendar.days))
+    assert len(result.scalar_one()) == BITMAP_BYTES
+
+
+@pytest.mark.anyio
+async def test_rebuild_from_activities(service, session):
+    session.add_all(
+        [
+            Activity(
+                user_id=1,
+                program_id=PROGRAM_ID,
+                description="Run",
+                performed_at=datetime(YEAR, month, 10, 12),
+            )
+            for month in (1, 2, 3)
+        ]
+    )
+    await session.commit()
+    await service.record_day(1, PROGRAM_ID, date(YEAR, 6, 1))
+
+    bitmap = await service.rebuild(1, PROGRAM_ID, YEAR)
+
+    assert bitmap == await _stored(session)
+    assert bitmap == from_days(
+        [date(YEAR, 1, 10), date(YEAR, 2, 10), date(YEAR, 3, 10)]
+    )
+
+
+@pytest.mark.anyio
+async def test_heatmap_range_aggregates(service):
+    for day in (1, 2, 3, 10):
+        await service.record_day(1, PROGRAM_ID, date(YEAR, 1, day))
+
+    heatmap = await service.heatmap(
+        1, PROGRAM_ID, YEAR, date(YEAR, 1, 2), date(YEAR, 1, 31)
+    )
+
+    assert heatmap.days == [date(YEAR, 1, 2), date(YEAR, 1, 3), date(YEAR, 1, 10)]
+    assert heatmap.days_active == 3
+    assert heatmap.longest_gap == 21
+    assert len(bytes.fromhex(heatmap.bitmap)) == BITMAP_BYTES
+
+    full_year = await service.heatmap(1, PROGRAM_ID, YEAR)
+    assert full_year.end == date(YEAR, 12, 31)
+    assert full_year.longest_gap == 355
+
+
+@pytest.mark.anyio
+async def test_heatmap_rejects_ranges_outside_the_year(service):
+    with pytest.raises(BusinessRuleViolationError):
+        await service.heatmap(1, PROGRAM_ID, YEAR, date(YEAR - 1, 12, 1))
+
+
+@pytest.mark.anyio
+async def test_team_heatmap_intersects_and_unites_members(service):
+    for user_id, days in ((1, (1, 2, 3)), (2, (2, 3, 4)), (3, (3,))):
+        for day in days:
+            await service.record_day(user_id, PROGRAM_ID, date(YEAR, 1, day))
+
+    team = await service.team_heatmap(PROGRAM_ID, YEAR, [1, 2])
+    assert team.members == 2
+    assert team.all_active == [date(YEAR, 1, 2), date(YEAR, 1, 3)]
+    assert team.days_any_active == 4
+
+    everyone = await service.team_heatmap(PROGRAM_ID, YEAR)
+    assert everyone.members == 3
+    assert everyone.all_active == [date(YEAR, 1, 3)]
+
+    with_inactive = await service.team_heatmap(PROGRAM_ID, YEAR, [1, 99])
+    assert with_inactive.days_all_active == 0
+    assert with_inactive.days_any_active == 3
@@ -1,9 +1,12 @@
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from freezegun import freeze_time
+from sqlalchemy.exc import IntegrityError
 
+from app.core.database import ConcurrentReads
+from app.core.write_coalescer import WriteCoalescer
 from app.exceptions.business import (
     BusinessRuleViolationError,
     DatabaseError,
@@ -11,13 +14,23 @@ from app.exceptions.business import (
 )
 from app.models.activity import Activity
 from app.models.program import Program
+from app.models.streak import Streak
 from app.models.user import User
 from app.repositories.achievement_repository import AchievementRepository
 from app.repositories.activity_repository import ActivityRepository
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
 from app.schemas.activity_schema import ActivityCreate, ActivityUpdate
+from app.schemas.streak_schema import StreakResponse
+from app.schemas.user_schema import UserCreate
+from app.services.activity_calendar_service import ActivityCalendarService
 from app.services.activity_service import ActivityService
+from app.services.leaderboard_service import CycleLeaderboard, leaderboard_cache
 from app.services.program_service import ProgramService
+from app.services.streak_service import StreakService
 from app.services.user_service import UserService
+from app.utils.cycle import LOCAL_TIMEZONE, cycle_key
+
+DISPLAY_NAME_RESOLVER = "app.services.activity_service.display_name_resolver"
 
 
 @pytest.fixture
@@ -45,6 +58,28 @@ def mock_achievement_repo():
     return AsyncMock(spec=AchievementRepository)
 
 
+@pytest.fixture
+def mock_calendar_service():
+    return AsyncMock(spec=ActivityCalendarService)
+
+
+@pytest.fixture
+def mock_streak_service():
+    streak_service = AsyncMock(spec=StreakService)
+    streak_service.record_day.return_value = None
+    streak_service.move_day.return_value = None
+    streak_service.remove_day.return_value = None
+    streak_service.find.return_value = StreakResponse(
+        current_length=0, longest_length=0
+    )
+    return streak_service
+
+
+@pytest.fixture
+def mock_daily_stats_repo():
+    return AsyncMock(spec=ProgramDailyStatRepository)
+
+
 @pytest.fixture
 def activity_service(
     mock_db,
@@ -52,6 +87,9 @@ def activity_service(
     mock_program_service,
     mock_activity_repo,
     mock_achievement_repo,
+    mock_calendar_service,
+    mock_streak_service,
+    mock_daily_stats_repo,
 ):
     return ActivityService(
         db=mock_db,
@@ -59,12 +97,16 @@ def activity_service(
         program_service=mock_program_service,
         activity_repo=mock_activity_repo,
         achievement_repo=mock_achievement_repo,
+        calendar_service=mock_calendar_service,
+        streak_service=mock_streak_service,
+        daily_stats_repo=mock_daily_stats_repo,
     )
 
 
 @pytest.fixture
 def today():
-    return datetime.now()
+    # Naive dates are local time
+    return datetime.now(LOCAL_TIMEZONE).replace(tzinfo=None)
 
 
 @pytest.fixture
@@ -98,9 +140,7 @@ def setup_mocks(
     mock_program_service.find_by_id.return_value = program
     mock_program_service.find_by_name.return_value = program
 
-    mock_activity_repo.check_activity_same_day.return_value = None
-    mock_activity_repo.count_monthly.return_value = 5
-    mock_achievement_repo.user_has_achievement.return_value = False
+    mock_activity_repo.count_in_cycle.return_value = 5
 
     mock_activity_repo.create.side_effect = lambda act: setattr(
         act, "id", 1
@@ -108,6 +148,15 @@ def setup_mocks(
     return {"user": user, "program": program}
 
 
+def _integrity_error(constraint_name=None):
+    """An IntegrityError as SQLAlchemy's asyncpg adapter raises it."""
+    cause = Exception("duplicate key value violates unique constraint")
+    cause.constraint_name = constraint_name
+    orig = Exception("IntegrityError")
+    orig.__cause__ = cause
+    return IntegrityError("INSERT INTO activities", {}, orig)
+
+
 async def _assert_error(coroutine, expected_error, match=None):
     with pytest.raises(expected_error) as exc:
         await coroutine
@@ -127,22 +176,70 @@ class TestActivityCreate:
 
         assert result.count_month == 5
         mock_activity_repo.create.assert_called_once()
-        mock_activity_repo.count_monthly.assert_called_once()
+        mock_activity_repo.count_in_cycle.assert_awaited_once()
 
     async def test_create_activity_auto_create_user(
         self, activity_service, mock_user_service, setup_mocks, today
     ):
         mock_user_service.find_by_slack_id.return_value = None
-        mock_user_service.get_slack_display_name.return_value = "New User"
-        mock_user_service.create.return_value = User(
-            id=99, slack_id="U_NEW", display_name="New User"
+        mock_user_service.get_or_create.return_value = User(
+            id=99, slack_id="U_NEW", display_name="U_NEW"
         )
 
-        await activity_service.create(
-            ActivityCreate(description="Run",
-                           performed_at=today), "C123", "U_NEW"
+        with patch(DISPLAY_NAME_RESOLVER) as mock_resolver:
+            await activity_service.create(
+                ActivityCreate(description="Run",
+                               performed_at=today), "C123", "U_NEW"
+            )
+
+        mock_user_service.get_or_create.assert_called_once_with(
+            UserCreate(slack_id="U_NEW", display_name="U_NEW")
         )
-        mock_user_service.create.assert_called_once()
+        mock_user_service.get_slack_display_name.assert_not_called()
+        mock_resolver.schedule.assert_called_once_with("U_NEW")
+
+    async def test_create_activity_with_concurrent_reads(
+        self,
+        activity_service,
+        setup_mocks,
+        today,
+        user,
+        program,
+        mock_user_service,
+        mock_program_service,
+        mock_activity_repo,
+    ):
+        concurrent_reads = AsyncMock(spec=ConcurrentReads)
+        concurrent_reads.gather.return_value = [user, [program]]
+        activity_service.concurrent_reads = concurrent_reads
+
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
+
+        assert result.id == 1
+        concurrent_reads.gather.assert_awaited_once()
+        assert len(concurrent_reads.gather.call_args.args) == 2
+        mock_user_service.find_by_slack_id.assert_not_called()
+        mock_program_service.find_by_slack_channel.assert_not_called()
+        mock_activity_repo.create.assert_called_once()
+
+    async def test_create_activity_with_write_coalescer(
+        self, activity_service, setup_mocks, today, mock_activity_repo
+    ):
+        write_coalescer = AsyncMock(spec=WriteCoalescer)
+        write_coalescer.submit.return_value = 42
+        activity_service.write_coalescer = write_coalescer
+
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
+
+        assert result.id == 42
+        values = write_coalescer.submit.call_args.args[0]
+        assert values["description"] == "Run"
+        assert values["user_id"] == 1
+        mock_activity_repo.create.assert_not_called()
 
     @pytest.mark.parametrize(
         "find_programs_return, expected_error, match",
@@ -177,8 +274,8 @@ class TestActivityCreate:
     async def test_create_fails_when_activity_already_exists(
         self, activity_service, setup_mocks, today, mock_activity_repo
     ):
-        mock_activity_repo.check_activity_same_day.return_value = Activity(
-            id=99
+        mock_activity_repo.create.side_effect = _integrity_error(
+            "ix_activities_user_program_performed_on"
         )
         await _assert_error(
             activity_service.create(
@@ -187,6 +284,36 @@ class TestActivityCreate:
             BusinessRuleViolationError,
             "already registered",
         )
+        mock_activity_repo.exists_on_day.assert_not_called()
+
+    async def test_create_reports_other_constraint_violations_as_database_errors(
+        self, activity_service, setup_mocks, today, mock_activity_repo
+    ):
+        mock_activity_repo.create.side_effect = _integrity_error(
+            "activities_user_id_fkey"
+        )
+        await _assert_error(
+            activity_service.create(
+                ActivityCreate(description="R", performed_at=today), "C", "U"
+            ),
+            DatabaseError,
+        )
+
+    async def test_create_checks_the_day_when_the_driver_names_no_constraint(
+        self, activity_service, setup_mocks, today, mock_activity_repo
+    ):
+        mock_activity_repo.create.side_effect = _integrity_error()
+        mock_activity_repo.exists_on_day.return_value = True
+        await _assert_error(
+            activity_service.create(
+                ActivityCreate(description="R", performed_at=today), "C", "U"
+            ),
+            BusinessRuleViolationError,
+            "already registered",
+        )
+        mock_activity_repo.exists_on_day.assert_awaited_once_with(
+            1, 1, today.date(), exclude_id=None
+        )
 
     @pytest.mark.parametrize(
         "delta, match",
@@ -280,14 +407,13 @@ class TestActivityUpdate:
         )
 
     async def test_update_fails_when_date_conflict(
-        self, activity_service, setup_mocks, today, mock_activity_repo
+        self, activity_service, setup_mocks, today, mock_activity_repo, mock_db
     ):
         mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
             id=1, program_id=1, performed_at=today - timedelta(days=1), user_id=1
         )
-        mock_activity_repo.check_activity_same_day.return_value = Activity(
-            id=99
-        )
+        mock_db.commit.side_effect = _integrity_error()
+        mock_activity_repo.exists_on_day.return_value = True
 
         await _assert_error(
             activity_service.update(
@@ -345,16 +471,12 @@ class TestActivityQuery:
         repo.find_by_user_id_and_date.return_value = [Activity(id=1)]
         repo.find_by_user_id_and_slack_channel_and_date.return_value = [
             Activity(id=2)]
-        repo.find_users_with_completed_program.return_value = [1]
         repo.find_by_id_and_slack_id.return_value = Activity(id=3)
 
         assert (await activity_service.find_by_user("U", "2023-10"))[0].id == 1
         assert (await activity_service.find_by_user_and_program("C", "U", "2023-10"))[
             0
         ].id == 2
-        assert (
-            await activity_service.find_all_user_by_program_completed("P", "2023-10")
-        ) == [1]
         assert (await activity_service.find_by_id(1, "U")).id == 3
 
     @pytest.mark.parametrize(
@@ -381,13 +503,6 @@ class TestActivityQuery:
                 EntityNotFoundError,
                 "User",
             ),
-            (
-                "find_all_user_by_program_completed",
-                ("P", "2023-10"),
-                "program_service.find_by_name",
-                EntityNotFoundError,
-                "Program",
-            ),
         ],
     )
     async def test_query_fails_when_not_found(
@@ -413,6 +528,86 @@ class TestActivityQuery:
         )
 
 
+def history_activity(id: int, year: int, month: int) -> Activity:
+    performed_at = datetime(year, month, 10, 12, 0)
+    return Activity(
+        id=id,
+        description=f"Run {id}",
+        performed_at=performed_at,
+        created_at=performed_at,
+    )
+
+
+@pytest.mark.anyio
+class TestActivityHistory:
+    async def test_groups_range_by_cycle_in_one_query(
+        self, activity_service, setup_mocks, mock_activity_repo
+    ):
+        mock_activity_repo.find_by_user_id_and_cycle_range.return_value = [
+            (history_activity(1, 2025, 11), 1),
+            (history_activity(2, 2026, 1), 2),
+            (history_activity(3, 2026, 1), 2),
+        ]
+
+        history = await activity_service.find_history_by_user_and_program(
+            "C", "U", from_cycle="2025-11", to_cycle="2026-01"
+        )
+
+        mock_activity_repo.find_by_user_id_and_cycle_range.assert_awaited_once_with(
+            setup_mocks["user"].id, cycle_key(2025, 11), cycle_key(2026, 1), "C"
+        )
+        assert [(g.cycle_reference, g.count) for g in history] == [
+            ("2025-11", 1),
+            ("2025-12", 0),
+            ("2026-01", 2),
+        ]
+        assert [a.id for a in history[2].activities] == [2, 3]
+        mock_activity_repo.find_by_user_id_and_date.assert_not_called()
+
+    @freeze_time("2026-03-15 12:00:00")
+    async def test_range_defaults_to_current_cycle(
+        self, activity_service, setup_mocks, mock_activity_repo
+    ):
+        mock_activity_repo.find_by_user_id_and_cycle_range.return_value = []
+
+        history = await activity_service.find_history_by_user("U", from_cycle="2026-01")
+
+        assert [g.cycle_reference for g in history] == [
+            "2026-01",
+            "2026-02",
+            "2026-03",
+        ]
+        mock_activity_repo.find_by_user_id_and_cycle_range.assert_awaited_once_with(
+            setup_mocks["user"].id, cycle_key(2026, 1), cycle_key(2026, 3), None
+        )
+
+    @pytest.mark.parametrize(
+        "from_cycle, to_cycle, match",
+        [
+            ("2026-02", "2026-01", "must not be after"),
+            ("2023-01", "2026-01", "at most 24 cycles"),
+            ("2026-13", "2026-12", "YYYY-MM"),
+        ],
+    )
+    async def test_invalid_range(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        from_cycle,
+        to_cycle,
+        match,
+    ):
+        await _assert_error(
+            activity_service.find_history_by_user(
+                "U", from_cycle=from_cycle, to_cycle=to_cycle
+            ),
+            BusinessRuleViolationError,
+            match,
+        )
+        mock_activity_repo.find_by_user_id_and_cycle_range.assert_not_called()
+
+
 @pytest.mark.anyio
 class TestActivityTimezone:
     @pytest.mark.parametrize("tz_offset", [0, -3, 5])
@@ -437,223 +632,508 @@ class TestActivityTimezone:
         created = mock_activity_repo.create.call_args[0][0]
         assert created.performed_at.tzinfo == tz
 
+    async def test_naive_date_is_local_time(
+        self, activity_service, setup_mocks, today, mock_activity_repo
+    ):
+        await activity_service.create(
+            ActivityCreate(description="R", performed_at=today), "C", "U"
+        )
+
+        created = mock_activity_repo.create.call_args[0][0]
+        assert created.performed_at == today.replace(tzinfo=LOCAL_TIMEZONE)
+
+    async def test_missing_date_defaults_to_aware_now(
+        self, activity_service, setup_mocks, mock_activity_repo
+    ):
+        await activity_service.create(ActivityCreate(description="R"), "C", "U")
+
+        created = mock_activity_repo.create.call_args[0][0]
+        assert created.performed_at.tzinfo is UTC
+
 
 @pytest.mark.anyio
-class TestCreateRetroactiveAchievement:
-    async def test_create_activity_triggers_retro_achievement_when_12_prev_month(
+class TestGoalAchievement:
+    async def test_create_awards_achievement_when_goal_is_reached(
         self,
         activity_service,
-        mock_user_service,
-        mock_program_service,
+        setup_mocks,
         mock_activity_repo,
         mock_achievement_repo,
-        user,
+        today,
     ):
-        with freeze_time("2026-01-20"):
-            program_2025 = Program(
-                id=1,
-                slack_channel="C123",
-                start_date=datetime(2025, 1, 1),
-                end_date=datetime(2026, 12, 31),
-            )
+        mock_activity_repo.count_in_cycle.return_value = 12
+        mock_achievement_repo.award.return_value = ["goal"]
 
-            # Setup mocks
-            mock_user_service.find_by_slack_id.return_value = user
-            mock_program_service.find_by_slack_channel.return_value = [
-                program_2025]
-            mock_activity_repo.check_activity_same_day.return_value = None
-            mock_activity_repo.count_monthly.return_value = 12
-            mock_achievement_repo.user_has_achievement.return_value = False
+        result = await activity_service.create(
+            ActivityCreate(description="12th run", performed_at=today), "C123", "U123"
+        )
 
-            async def assign_id(activity):
-                activity.id = 1
+        assert result.achievement_awarded is True
+        assert result.awarded_tiers == ["goal"]
+        mock_activity_repo.count_in_cycle.assert_awaited_once_with(
+            1, 1, today.year, today.month
+        )
+        mock_achievement_repo.award.assert_awaited_once_with(
+            1, 1, f"{today.year}-{today.month:02d}", ["goal"]
+        )
 
-            mock_activity_repo.create.side_effect = assign_id
+    async def test_create_below_goal_does_not_award(
+        self, activity_service, setup_mocks, mock_achievement_repo, today
+    ):
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
 
-            previous_month_date = datetime(2025, 12, 15)
+        assert result.achievement_awarded is False
+        mock_achievement_repo.award.assert_not_called()
 
-            activity_create = ActivityCreate(
-                description="12ª Activity",
-                performed_at=previous_month_date,
-                evidence_url="http://test.com",
-            )
+    async def test_create_beyond_goal_does_not_award_twice(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        today,
+    ):
+        mock_activity_repo.count_in_cycle.return_value = 13
+        mock_achievement_repo.award.return_value = []
 
-            result = await activity_service.create(activity_create, "C123", "U123")
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
 
-            assert result.count_month == 12
+        assert result.achievement_awarded is False
 
-            mock_achievement_repo.create.assert_called_once()
+    async def test_create_awards_previous_month_achievement(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        program,
+    ):
+        with freeze_time("2026-01-20"):
+            program.start_date = datetime(2025, 1, 1)
+            mock_activity_repo.count_in_cycle.return_value = 12
+            mock_achievement_repo.award.return_value = ["goal"]
+
+            await activity_service.create(
+                ActivityCreate(description="Run", performed_at=datetime(2025, 12, 15)),
+                "C123",
+                "U123",
+            )
 
-            call_args = mock_achievement_repo.create.call_args
-            achievement = call_args[0][0]  # First positional argument
-            assert achievement.user_id == 1
-            assert achievement.program_id == 1
-            assert achievement.cycle_reference == "2025-12"
+        mock_achievement_repo.award.assert_awaited_once_with(
+            1, 1, "2025-12", ["goal"]
+        )
 
-    async def test_create_activity_does_not_trigger_achievement_when_only_11_activities(
+    async def test_create_succeeds_and_enqueues_retry_when_award_fails(
         self,
         activity_service,
-        mock_user_service,
-        mock_program_service,
+        setup_mocks,
         mock_activity_repo,
         mock_achievement_repo,
-        user,
+        today,
     ):
-        with freeze_time("2026-01-20"):
-            program_2025 = Program(
-                id=1,
-                slack_channel="C123",
-                start_date=datetime(2025, 1, 1),
-                end_date=datetime(2026, 12, 31),
+        mock_activity_repo.count_in_cycle.return_value = 12
+        mock_achievement_repo.award.side_effect = Exception("DB Error")
+
+        with patch(
+            "app.services.activity_service.enqueue_job", new_callable=AsyncMock
+        ) as enqueue_job:
+            result = await activity_service.create(
+                ActivityCreate(description="Run", performed_at=today), "C123", "U123"
             )
 
-            mock_user_service.find_by_slack_id.return_value = user
-            mock_program_service.find_by_slack_channel.return_value = [
-                program_2025]
-            mock_activity_repo.check_activity_same_day.return_value = None
-            mock_activity_repo.count_monthly.return_value = 11
+        assert result.id == 1
+        assert result.achievement_awarded is False
+        enqueue_job.assert_awaited_once_with(
+            activity_service.db,
+            "award_achievement",
+            {
+                "user_id": 1,
+                "program_id": 1,
+                "cycle_reference": f"{today.year}-{today.month:02d}",
+                "tiers": ["goal"],
+            },
+        )
 
-            async def assign_id(activity):
-                activity.id = 1
+    async def test_delete_revokes_achievement_when_count_drops_below_goal(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        today,
+    ):
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+        mock_activity_repo.count_in_cycle.return_value = 11
 
-            mock_activity_repo.create.side_effect = assign_id
+        await activity_service.delete(1, "U123")
 
-            previous_month_date = datetime(2025, 12, 15)
+        mock_achievement_repo.revoke_unnotified.assert_awaited_once_with(
+            1, 1, f"{today.year}-{today.month:02d}", ["goal"]
+        )
 
-            activity_create = ActivityCreate(
-                description="11ª Activity",
-                performed_at=previous_month_date,
-                evidence_url="http://test.com",
-            )
+    async def test_delete_keeps_achievement_while_goal_still_met(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        today,
+    ):
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+        mock_activity_repo.count_in_cycle.return_value = 12
 
-            await activity_service.create(activity_create, "C123", "U123")
+        await activity_service.delete(1, "U123")
 
-            mock_achievement_repo.create.assert_not_called()
+        mock_achievement_repo.revoke_unnotified.assert_not_called()
 
-    async def test_create_activity_does_not_trigger_achievement_when_current_month(
+    async def test_update_moving_activity_across_cycles_rechecks_both(
         self,
         activity_service,
-        mock_user_service,
-        mock_program_service,
+        setup_mocks,
         mock_activity_repo,
         mock_achievement_repo,
-        user,
+        program,
     ):
         with freeze_time("2026-01-20"):
-            program_2026 = Program(
-                id=1,
-                slack_channel="C123",
-                start_date=datetime(2026, 1, 1),
-                end_date=datetime(2026, 12, 31),
+            program.start_date = datetime(2025, 1, 1)
+            mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+                id=1, program_id=1, performed_at=datetime(2026, 1, 5), user_id=1
             )
+            mock_activity_repo.count_in_cycle.side_effect = [12, 11]
+            mock_achievement_repo.award.return_value = ["goal"]
 
-            mock_user_service.find_by_slack_id.return_value = user
-            mock_program_service.find_by_slack_channel.return_value = [
-                program_2026]
-            mock_activity_repo.check_activity_same_day.return_value = None
-            mock_activity_repo.count_monthly.return_value = 12
+            result = await activity_service.update(
+                ActivityUpdate(performed_at=datetime(2025, 12, 20)), 1, "U123"
+            )
 
-            async def assign_id(activity):
-                activity.id = 1
+        assert result.achievement_awarded is True
+        mock_achievement_repo.revoke_unnotified.assert_awaited_once_with(
+            1, 1, "2026-01", ["goal"]
+        )
+        mock_achievement_repo.award.assert_awaited_once_with(
+            1, 1, "2025-12", ["goal"]
+        )
 
-            mock_activity_repo.create.side_effect = assign_id
+    async def test_update_within_same_cycle_skips_goal_check(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        today,
+    ):
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
 
-            current_month_date = datetime(2026, 1, 15)
+        result = await activity_service.update(
+            ActivityUpdate(description="Up"), 1, "U123"
+        )
 
-            activity_create = ActivityCreate(
-                description="Activity",
-                performed_at=current_month_date,
-                evidence_url="http://test.com",
-            )
+        assert result.count_month == 5
+        mock_activity_repo.count_in_cycle.assert_awaited_once()
+        mock_achievement_repo.award.assert_not_called()
+        mock_achievement_repo.revoke_unnotified.assert_not_called()
 
-            await activity_service.create(activity_create, "C123", "U123")
+    async def test_create_awards_every_tier_reached(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_achievement_repo,
+        program,
+        today,
+    ):
+        program.goal_tiers = [
+            {"name": "gold", "threshold": 20},
+            {"name": "bronze", "threshold": 8},
+            {"name": "silver", "threshold": 12},
+        ]
+        mock_activity_repo.count_in_cycle.return_value = 12
+        mock_achievement_repo.award.return_value = ["silver"]
+
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
 
-            mock_achievement_repo.create.assert_not_called()
+        assert result.awarded_tiers == ["silver"]
+        mock_achievement_repo.award.assert_awaited_once_with(
+            1, 1, f"{today.year}-{today.month:02d}", ["bronze", "silver"]
+        )
 
-    async def test_create_activity_does_not_duplicate_achievement_when_already_exists(
+    async def test_delete_revokes_only_tiers_no_longer_met(
         self,
         activity_service,
-        mock_user_service,
-        mock_program_service,
+        setup_mocks,
         mock_activity_repo,
         mock_achievement_repo,
-        user,
+        program,
+        today,
     ):
-        with freeze_time("2026-01-20"):
-            program_2025 = Program(
-                id=1,
-                slack_channel="C123",
-                start_date=datetime(2025, 1, 1),
-                end_date=datetime(2026, 12, 31),
-            )
+        program.goal_tiers = [
+            {"name": "bronze", "threshold": 8},
+            {"name": "silver", "threshold": 12},
+            {"name": "gold", "threshold": 20},
+        ]
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+        mock_activity_repo.count_in_cycle.return_value = 11
+
+        await activity_service.delete(1, "U123")
+
+        mock_achievement_repo.revoke_unnotified.assert_awaited_once_with(
+            1, 1, f"{today.year}-{today.month:02d}", ["silver", "gold"]
+        )
 
-            mock_user_service.find_by_slack_id.return_value = user
-            mock_program_service.find_by_slack_channel.return_value = [
-                program_2025]
-            mock_activity_repo.check_activity_same_day.return_value = None
-            mock_activity_repo.count_monthly.return_value = 12
-            mock_achievement_repo.user_has_achievement.return_value = True
 
-            async def assign_id(activity):
-                activity.id = 1
+@pytest.mark.anyio
+class TestStreakTracking:
+    async def test_create_records_the_day_and_returns_the_streak(
+        self, activity_service, setup_mocks, mock_streak_service, today
+    ):
+        mock_streak_service.record_day.return_value = Streak(
+            current_start=today.date() - timedelta(days=2),
+            last_date=today.date(),
+            longest_length=5,
+        )
 
-            mock_activity_repo.create.side_effect = assign_id
+        result = await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
 
-            previous_month_date = datetime(2025, 12, 15)
+        mock_streak_service.record_day.assert_awaited_once_with(1, 1, today.date())
+        assert result.current_streak == 3
+        assert result.longest_streak == 5
 
-            activity_create = ActivityCreate(
-                description="12ª Activity",
-                performed_at=previous_month_date,
-                evidence_url="http://test.com",
+    async def test_update_moves_the_day_when_the_date_changes(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_streak_service,
+        today,
+    ):
+        yesterday = today - timedelta(days=1)
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+        mock_streak_service.move_day.return_value = None
+
+        await activity_service.update(ActivityUpdate(performed_at=yesterday), 1, "U123")
+
+        mock_streak_service.move_day.assert_awaited_once_with(
+            1, 1, today.date(), yesterday.date()
+        )
+
+    async def test_delete_removes_the_day(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_streak_service,
+        today,
+    ):
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+        mock_streak_service.remove_day.return_value = None
+
+        await activity_service.delete(1, "U123")
+
+        mock_streak_service.remove_day.assert_awaited_once_with(1, 1, today.date())
+
+    async def test_failed_update_enqueues_a_recompute(
+        self, activity_service, setup_mocks, mock_streak_service, today
+    ):
+        mock_streak_service.record_day.side_effect = Exception("DB Error")
+
+        with patch(
+            "app.services.activity_service.enqueue_job", new_callable=AsyncMock
+        ) as enqueue_job:
+            result = await activity_service.create(
+                ActivityCreate(description="Run", performed_at=today), "C123", "U123"
             )
 
-            result = await activity_service.create(activity_create, "C123", "U123")
+        assert result.id == 1
+        assert result.current_streak == 0
+        enqueue_job.assert_awaited_once_with(
+            activity_service.db,
+            "recompute_streak",
+            {"user_id": 1, "program_id": 1},
+        )
+
+    async def test_find_streak(
+        self, activity_service, setup_mocks, mock_streak_service
+    ):
+        await activity_service.find_streak("C123", "U123")
+
+        mock_streak_service.find.assert_awaited_once_with(1, 1)
+
+
+@pytest.mark.anyio
+class TestCalendarTracking:
+    async def test_create_records_the_day(
+        self, activity_service, setup_mocks, mock_calendar_service, today
+    ):
+        await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
 
-            assert result.count_month == 12
-            mock_achievement_repo.user_has_achievement.assert_called_once()
-            mock_achievement_repo.create.assert_not_called()
+        mock_calendar_service.record_day.assert_awaited_once_with(1, 1, today.date())
 
-    async def test_create_activity_succeeds_even_when_achievement_creation_fails(
+    async def test_failed_move_enqueues_a_rebuild_per_year(
         self,
         activity_service,
-        mock_user_service,
-        mock_program_service,
+        setup_mocks,
         mock_activity_repo,
-        mock_achievement_repo,
-        user,
+        mock_calendar_service,
+        program,
     ):
-        with freeze_time("2026-01-20"):
-            program_2025 = Program(
-                id=1,
-                name="Test Program",
-                slack_channel="C123",
-                start_date=datetime(2025, 1, 1),
-                end_date=datetime(2026, 12, 31),
+        program.start_date = datetime(2025, 1, 1)
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=datetime(2026, 1, 1, 12), user_id=1
+        )
+        mock_calendar_service.move_day.side_effect = Exception("DB Error")
+
+        with (
+            freeze_time("2026-01-15"),
+            patch(
+                "app.services.activity_service.enqueue_job", new_callable=AsyncMock
+            ) as enqueue_job,
+        ):
+            await activity_service.update(
+                ActivityUpdate(performed_at=datetime(2025, 12, 31, 12)), 1, "U123"
             )
 
-            mock_user_service.find_by_slack_id.return_value = user
-            mock_program_service.find_by_slack_channel.return_value = [
-                program_2025]
-            mock_activity_repo.check_activity_same_day.return_value = None
-            mock_activity_repo.count_monthly.return_value = 12
-            mock_achievement_repo.user_has_achievement.return_value = False
-            mock_achievement_repo.create.side_effect = Exception("DB Error")
+        assert [call.args[2]["year"] for call in enqueue_job.await_args_list] == [
+            2025,
+            2026,
+        ]
+        assert {call.args[1] for call in enqueue_job.await_args_list} == {
+            "rebuild_calendar"
+        }
 
-            async def assign_id(activity):
-                activity.id = 1
+    async def test_find_heatmap_reads_the_calendar(
+        self, activity_service, setup_mocks, mock_calendar_service
+    ):
+        await activity_service.find_heatmap("C123", "U123", 2026)
+
+        mock_calendar_service.heatmap.assert_awaited_once_with(1, 1, 2026, None, None)
 
-            mock_activity_repo.create.side_effect = assign_id
+    async def test_find_team_heatmap_rejects_unknown_users(
+        self, activity_service, setup_mocks, mock_user_service, user
+    ):
+        mock_user_service.find_all_by_slack_ids.return_value = [user]
 
-            previous_month_date = datetime(2025, 12, 15)
+        with pytest.raises(EntityNotFoundError, match="U404"):
+            await activity_service.find_team_heatmap("C123", 2026, ["U123", "U404"])
 
-            activity_create = ActivityCreate(
-                description="12ª Activity",
-                performed_at=previous_month_date,
-                evidence_url="http://test.com",
+
+@pytest.mark.anyio
+class TestLeaderboardTracking:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        leaderboard_cache.clear()
+        yield
+        leaderboard_cache.clear()
+
+    async def test_create_counts_towards_a_loaded_board(
+        self, activity_service, setup_mocks, today
+    ):
+        board = CycleLeaderboard()
+        leaderboard_cache.put(1, cycle_key(today.year, today.month), board)
+
+        await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
+
+        assert board.count_of(1) == 1
+
+    async def test_create_drops_a_board_loaded_during_the_insert(
+        self, activity_service, setup_mocks, mock_activity_repo, today
+    ):
+        key = cycle_key(today.year, today.month)
+
+        async def insert_while_a_board_loads(activity):
+            activity.id = 1
+            leaderboard_cache.put(1, key, CycleLeaderboard([(1, 1)]))
+
+        mock_activity_repo.create.side_effect = insert_while_a_board_loads
+
+        await activity_service.create(
+            ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+        )
+
+        assert leaderboard_cache.get(1, key) is None
+
+    async def test_update_moves_the_count_between_cycles(
+        self, activity_service, setup_mocks, mock_activity_repo, program
+    ):
+        program.start_date = datetime(2025, 1, 1)
+        old_board = CycleLeaderboard([(1, 3)])
+        new_board = CycleLeaderboard()
+        leaderboard_cache.put(1, cycle_key(2026, 1), old_board)
+        leaderboard_cache.put(1, cycle_key(2025, 12), new_board)
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=datetime(2026, 1, 1, 12), user_id=1
+        )
+
+        with freeze_time("2026-01-15"):
+            await activity_service.update(
+                ActivityUpdate(performed_at=datetime(2025, 12, 31, 12)), 1, "U123"
             )
 
-            # Should not raise exception, activity creation should succeed
-            result = await activity_service.create(activity_create, "C123", "U123")
+        assert old_board.count_of(1) == 2
+        assert new_board.count_of(1) == 1
+
 
-            assert result.count_month == 12
-            assert result.id == 1
+@pytest.mark.anyio
+class TestDailyStatsTracking:
+    async def test_update_moves_the_activity_between_days(
+        self,
+        activity_service,
+        setup_mocks,
+        mock_activity_repo,
+        mock_daily_stats_repo,
+        today,
+    ):
+        yesterday = today - timedelta(days=1)
+        mock_activity_repo.find_by_id_and_slack_id.return_value = Activity(
+            id=1, program_id=1, performed_at=today, user_id=1
+        )
+
+        await activity_service.update(ActivityUpdate(performed_at=yesterday), 1, "U123")
+
+        calls = mock_daily_stats_repo.increment.await_args_list
+        assert [call.args for call in calls] == [
+            (1, 1, today.date(), -1),
+            (1, 1, yesterday.date(), 1),
+        ]
+
+    async def test_failed_increment_enqueues_a_rebuild_of_the_day(
+        self, activity_service, setup_mocks, mock_daily_stats_repo, today
+    ):
+        mock_daily_stats_repo.increment.side_effect = Exception("DB Error")
+
+        with patch(
+            "app.services.activity_service.enqueue_job", new_callable=AsyncMock
+        ) as enqueue_job:
+            await activity_service.create(
+                ActivityCreate(description="Run", performed_at=today), "C123", "U123"
+            )
+
+        day = today.date().isoformat()
+        enqueue_job.assert_awaited_once_with(
+            activity_service.db,
+            "rebuild_daily_stats",
+            {"program_id": 1, "start": day, "end": day},
+        )
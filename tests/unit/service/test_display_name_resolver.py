@@ -0,0 +1,84 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.display_name_resolver import DisplayNameResolver
+
+RESOLVER_PATH = "app.services.display_name_resolver"
+
+
+def _session_factory():
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=MagicMock())
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
+
+
+@pytest.mark.anyio
+async def test_resolver_updates_placeholder_name():
+    resolver = DisplayNameResolver(_session_factory())
+
+    with (
+        patch(f"{RESOLVER_PATH}.UserRepository") as mock_repo_cls,
+        patch(f"{RESOLVER_PATH}.UserService") as mock_service_cls,
+    ):
+        mock_repo = mock_repo_cls.return_value
+        mock_repo.update_display_name = AsyncMock(return_value=1)
+        mock_service_cls.return_value.get_slack_display_name = AsyncMock(
+            return_value="John Doe"
+        )
+
+        await resolver.schedule("U123")
+        await resolver.close()
+
+    mock_repo.update_display_name.assert_awaited_once_with(
+        "U123", "John Doe", placeholder="U123"
+    )
+
+
+@pytest.mark.anyio
+async def test_resolver_coalesces_concurrent_lookups():
+    resolver = DisplayNameResolver(_session_factory())
+    release = asyncio.Event()
+
+    async def slow_lookup(slack_id):
+        await release.wait()
+        return "John Doe"
+
+    with (
+        patch(f"{RESOLVER_PATH}.UserRepository") as mock_repo_cls,
+        patch(f"{RESOLVER_PATH}.UserService") as mock_service_cls,
+    ):
+        mock_repo_cls.return_value.update_display_name = AsyncMock(return_value=1)
+        lookup = AsyncMock(side_effect=slow_lookup)
+        mock_service_cls.return_value.get_slack_display_name = lookup
+
+        first = resolver.schedule("U123")
+        second = resolver.schedule("U123")
+        release.set()
+        await resolver.close()
+
+    assert first is second
+    lookup.assert_awaited_once()
+    assert resolver._pending == {}
+
+
+@pytest.mark.anyio
+async def test_resolver_swallows_slack_errors():
+    resolver = DisplayNameResolver(_session_factory())
+
+    with (
+        patch(f"{RESOLVER_PATH}.UserRepository") as mock_repo_cls,
+        patch(f"{RESOLVER_PATH}.UserService") as mock_service_cls,
+    ):
+        mock_repo_cls.return_value.update_display_name = AsyncMock()
+        mock_service_cls.return_value.get_slack_display_name = AsyncMock(
+            side_effect=Exception("user_not_found")
+        )
+
+        task = resolver.schedule("U123")
+        await resolver.close()
+
+    assert task.exception() is None
+    mock_repo_cls.return_value.update_display_name.assert_not_called()
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.exceptions.business import BusinessRuleViolationError, RequestInProgressError
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from app.services.idempotency_service import IdempotencyService, StoredResponse
+
+SCOPE = "POST /programs"
+
+
+@pytest.fixture
+def mock_idempotency_repo():
+    return AsyncMock(spec=IdempotencyKeyRepository)
+
+
+@pytest.fixture
+def idempotency_service(mock_idempotency_repo):
+    return IdempotencyService(idempotency_repo=mock_idempotency_repo, ttl_seconds=60)
+
+
+@pytest.mark.anyio
+async def test_begin_claims_new_key(idempotency_service, mock_idempotency_repo):
+    mock_idempotency_repo.claim.return_value = True
+
+    result = await idempotency_service.begin(SCOPE, "key-1", "hash")
+
+    assert result is None
+    mock_idempotency_repo.delete_by_key_if_created_before.assert_awaited_once()
+    mock_idempotency_repo.find_by_key.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_begin_returns_stored_response(
+    idempotency_service, mock_idempotency_repo
+):
+    mock_idempotency_repo.claim.return_value = False
+    mock_idempotency_repo.find_by_key.return_value = IdempotencyKey(
+        key="key-1",
+        request_hash="hash",
+        status_code=201,
+        response_body='{"id": 1}',
+        response_headers=json.dumps({"location": "/activities/1"}),
+    )
+
+    result = await idempotency_service.begin(SCOPE, "key-1", "hash")
+
+    assert result == StoredResponse(201, '{"id": 1}', {"location": "/activities/1"})
+
+
+@pytest.mark.anyio
+async def test_begin_rejects_key_reused_for_other_request(
+    idempotency_service, mock_idempotency_repo
+):
+    mock_idempotency_repo.claim.return_value = False
+    mock_idempotency_repo.find_by_key.return_value = IdempotencyKey(
+        key="key-1", request_hash="other-hash", status_code=201
+    )
+
+    with pytest.raises(BusinessRuleViolationError):
+        await idempotency_service.begin(SCOPE, "key-1", "hash")
+
+
+@pytest.mark.anyio
+async def test_begin_rejects_key_still_in_progress(
+    idempotency_service, mock_idempotency_repo
+):
+    mock_idempotency_repo.claim.return_value = False
+    mock_idempotency_repo.take_over.return_value = False
+    mock_idempotency_repo.find_by_key.return_value = IdempotencyKey(
+        key="key-1", request_hash="hash", status_code=None
+    )
+
+    with pytest.raises(RequestInProgressError):
+        await idempotency_service.begin(SCOPE, "key-1", "hash")
+
+
+@pytest.mark.anyio
+async def test_begin_takes_over_key_whose_lock_expired(
+    idempotency_service, mock_idempotency_repo
+):
+    mock_idempotency_repo.claim.return_value = False
+    mock_idempotency_repo.take_over.return_value = True
+    mock_idempotency_repo.find_by_key.return_value = IdempotencyKey(
+        key="key-1", request_hash="hash", status_code=None
+    )
+
+    result = await idempotency_service.begin(SCOPE, "key-1", "hash")
+
+    assert result is None
+    mock_idempotency_repo.take_over.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_begin_rejects_oversized_key(idempotency_service, mock_idempotency_repo):
+    with pytest.raises(BusinessRuleViolationError):
+        await idempotency_service.begin(SCOPE, "k" * 256, "hash")
+
+    mock_idempotency_repo.claim.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_complete_stores_response(idempotency_service, mock_idempotency_repo):
+    await idempotency_service.complete(
+        SCOPE, "key-1", StoredResponse(201, "{}", {"location": "/activities/1"})
+    )
+
+    mock_idempotency_repo.save_response.assert_awaited_once_with(
+        SCOPE, "key-1", 201, "{}", '{"location": "/activities/1"}'
+    )
+
+
+@pytest.mark.anyio
+async def test_abandon_deletes_key(idempotency_service, mock_idempotency_repo):
+    await idempotency_service.abandon(SCOPE, "key-1")
+
+    mock_idempotency_repo.delete_by_key.assert_awaited_once_with(SCOPE, "key-1")
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.exceptions.business import EntityNotFoundError
+from app.models.job import Job
+from app.services.job_service import JobService
+
+
+@pytest.mark.anyio
+async def test_find_by_id_returns_job():
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=Job(id=1, kind="close_cycle"))
+
+    job = await JobService(repo).find_by_id(1)
+
+    assert job.id == 1
+
+
+@pytest.mark.anyio
+async def test_find_by_id_raises_when_missing():
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=None)
+
+    with pytest.raises(EntityNotFoundError):
+        await JobService(repo).find_by_id(1)
+
+
+@pytest.mark.anyio
+async def test_enqueue_uses_repository_session():
+    repo = MagicMock()
+    job = Job(id=1, kind="close_cycle")
+
+    with patch(
+        "app.services.job_service.enqueue_job", AsyncMock(return_value=job)
+    ) as enqueue:
+        result = await JobService(repo).enqueue("close_cycle", {"a": 1})
+
+    enqueue.assert_awaited_once_with(repo.session, "close_cycle", {"a": 1})
+    assert result is job
@@ -0,0 +1,159 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.exceptions.business import EntityNotFoundError
+from app.models.program import Program
+from app.models.user import User
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.user_repository import UserRepository
+from app.services.leaderboard_service import (
+    CycleLeaderboard,
+    LeaderboardCache,
+    LeaderboardService,
+    leaderboard_cache,
+)
+from app.services.program_service import ProgramService
+from app.utils.cycle import cycle_key
+
+USERS = [
+    User(id=1, slack_id="U1", display_name="Ana"),
+    User(id=2, slack_id="U2", display_name="Bia"),
+    User(id=3, slack_id="U3", display_name="Caio"),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    leaderboard_cache.clear()
+    yield
+    leaderboard_cache.clear()
+
+
+@pytest.fixture
+def mock_activity_repo():
+    repo = AsyncMock(spec=ActivityRepository)
+    repo.count_by_user_in_cycle.return_value = [(1, 5), (2, 7), (3, 5)]
+    return repo
+
+
+@pytest.fixture
+def mock_user_repo():
+    repo = AsyncMock(spec=UserRepository)
+    repo.find_all_by_ids.side_effect = lambda ids: [u for u in USERS if u.id in ids]
+    repo.find_by_slack_id.side_effect = lambda slack_id: next(
+        (u for u in USERS if u.slack_id == slack_id), None
+    )
+    return repo
+
+
+@pytest.fixture
+def service(mock_activity_repo, mock_user_repo):
+    program_service = AsyncMock(spec=ProgramService)
+    program_service.find_one_by_slack_channel.return_value = Program(
+        id=1, name="Move", slack_channel="C123"
+    )
+    return LeaderboardService(mock_activity_repo, mock_user_repo, program_service)
+
+
+def test_cycle_leaderboard_ranks_ties_together():
+    board = CycleLeaderboard([(1, 5), (2, 7), (3, 5), (4, 1)])
+
+    assert board.top(3) == [(1, 2, 7), (2, 1, 5), (2, 3, 5)]
+    assert board.top(10)[-1] == (4, 4, 1)
+    assert board.rank_of(4) == 4
+    assert board.rank_of(99) is None
+
+    board.add(4, 7)
+    assert board.rank_of(4) == 1
+    assert board.rank_of(2) == 2
+
+    board.add(2, -7)
+    assert board.participants == 3
+    assert board.count_of(2) == 0
+
+
+def test_cache_only_updates_loaded_boards_and_expires():
+    cache = LeaderboardCache()
+    cache.record(1, 100, user_id=1, delta=1, started=cache.begin())
+    assert cache.get(1, 100) is None
+
+    cache.put(1, 100, CycleLeaderboard())
+    cache.record(1, 100, user_id=1, delta=1, started=cache.begin())
+    assert cache.get(1, 100).count_of(1) == 1
+
+    with patch("app.services.leaderboard_service.settings") as mock_settings:
+        mock_settings.LEADERBOARD_TTL_SECONDS = -1
+        assert cache.get(1, 100) is not None
+        mock_settings.LEADERBOARD_TTL_SECONDS = 1
+        with patch("app.services.leaderboard_service.time.monotonic") as monotonic:
+            monotonic.return_value = 10**9
+            assert cache.get(1, 100) is None
+
+
+def test_board_stored_during_a_write_is_dropped_not_adjusted():
+    cache = LeaderboardCache()
+    write_started = cache.begin()
+    # A cold load reads the committed activity before the write records it
+    cache.put(1, 100, CycleLeaderboard([(1, 1)]), cache.begin())
+
+    cache.record(1, 100, user_id=1, delta=1, started=write_started)
+
+    assert cache.get(1, 100) is None
+
+
+def test_load_overlapping_a_recorded_write_is_not_stored():
+    cache = LeaderboardCache()
+    load_started = cache.begin()
+    # The load read the counts before this write committed
+    cache.record(1, 100, user_id=1, delta=1, started=cache.begin())
+
+    cache.put(1, 100, CycleLeaderboard(), load_started)
+
+    assert cache.get(1, 100) is None
+    cache.put(1, 100, CycleLeaderboard(), cache.begin())
+    assert cache.get(1, 100) is not None
+
+
+@pytest.mark.anyio
+async def test_find_falls_back_to_sql_once_then_uses_the_cache(
+    service, mock_activity_repo
+):
+    first = await service.find("C123", "2026-10", limit=2, slack_id="U3")
+    leaderboard_cache.record(
+        1, cycle_key(2026, 10), user_id=3, delta=3, started=leaderboard_cache.begin()
+    )
+    second = await service.find("C123", "2026-10", limit=2, slack_id="U3")
+
+    mock_activity_repo.count_by_user_in_cycle.assert_awaited_once_with(
+        1, 2026, 10, min_count=1
+    )
+    assert [(e.rank, e.display_name, e.count) for e in first.entries] == [
+        (1, "Bia", 7),
+        (2, "Ana", 5),
+    ]
+    assert first.me.rank == 2
+    assert first.participants == 3
+    assert second.entries[0].display_name == "Caio"
+    assert second.me.count == 8
+
+
+@pytest.mark.anyio
+async def test_find_without_activities_in_the_cycle(service, mock_activity_repo):
+    mock_activity_repo.count_by_user_in_cycle.return_value = []
+
+    result = await service.find("C123", "2026-09", slack_id="U1")
+
+    assert result.entries == []
+    assert result.me is None
+    assert result.cycle_reference == "2026-09"
+
+
+@pytest.mark.anyio
+async def test_find_unknown_program(service):
+    service.program_service.find_one_by_slack_channel.side_effect = EntityNotFoundError(
+        "Program", "C404"
+    )
+
+    with pytest.raises(EntityNotFoundError):
+        await service.find("C404")
@@ -0,0 +1,133 @@
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from freezegun import freeze_time
+
+from app.models.activity import Activity
+from app.models.program import Program
+from app.models.program_cycle_user import ProgramCycleUser
+from app.models.program_daily_stat import ProgramDailyStat
+from app.repositories.program_daily_stat_repository import ProgramDailyStatRepository
+from app.services.program_dashboard_service import ProgramDashboardService
+from app.services.program_service import ProgramService
+from app.utils.cycle import cycle_key
+
+PROGRAM_ID = 1
+
+
+@pytest.fixture
+async def session(sqlite_sessions):
+    session_factory = await sqlite_sessions(
+        Activity, ProgramDailyStat, ProgramCycleUser
+    )
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def stats_repo(session):
+    return ProgramDailyStatRepository(session)
+
+
+@pytest.fixture
+def service(stats_repo):
+    program_service = AsyncMock(spec=ProgramService)
+    program_service.find_one_by_slack_channel.return_value = Program(
+        id=PROGRAM_ID, name="Move", slack_channel="C123"
+    )
+    return ProgramDashboardService(stats_repo, program_service)
+
+
+async def _stats(stats_repo, start=date(2026, 1, 1), end=date(2026, 12, 31)):
+    rows = await stats_repo.find_between(PROGRAM_ID, start, end)
+    return {row.day: (row.activity_count, row.distinct_users) for row in rows}
+
+
+async def _log(stats_repo, day, *user_ids):
+    for user_id in user_ids:
+        await stats_repo.increment(PROGRAM_ID, user_id, day, 1)
+
+
+@pytest.mark.anyio
+async def test_increment_upserts_and_accumulates(stats_repo, session):
+    day = date(2026, 2, 3)
+    key = cycle_key(2026, 2)
+
+    await stats_repo.increment(PROGRAM_ID, 1, day, 1)
+    await stats_repo.increment(PROGRAM_ID, 2, day, 1)
+    await stats_repo.increment(PROGRAM_ID, 2, date(2026, 2, 4), 1)
+    await stats_repo.increment(PROGRAM_ID, 1, day, -1)
+    session.expire_all()
+
+    assert await _stats(stats_repo) == {day: (1, 1), date(2026, 2, 4): (1, 1)}
+    assert await stats_repo.count_active_users(PROGRAM_ID, key) == 1
+    assert await stats_repo.count_members(PROGRAM_ID) == 1
+
+
+@pytest.mark.anyio
+async def test_rebuild_replaces_rows_in_chunks(service, stats_repo, session):
+    session.add_all(
+        [
+            Activity(
+                user_id=user_id,
+                program_id=PROGRAM_ID,
+                description="Run",
+                performed_at=datetime(2026, month, day, 12),
+            )
+            for user_id, month, day in ((1, 1, 5), (2, 1, 5), (1, 3, 1))
+        ]
+    )
+    await session.commit()
+    await _log(stats_repo, date(2026, 2, 10), 5, 6, 7)
+    progress = AsyncMock()
+
+    written = await service.rebuild(
+        PROGRAM_ID, date(2026, 1, 1), date(2026, 3, 31), on_progress=progress
+    )
+    session.expire_all()
+
+    assert written == 2
+    assert await _stats(stats_repo) == {
+        date(2026, 1, 5): (2, 2),
+        date(2026, 3, 1): (1, 1),
+    }
+    assert progress.await_count == 3
+    assert [
+        await stats_repo.count_active_users(PROGRAM_ID, cycle_key(2026, month))
+        for month in (1, 2, 3)
+    ] == [2, 0, 1]
+    assert progress.await_args.args == (100, "90/90 days")
+
+
+@pytest.mark.anyio
+@freeze_time("2026-02-04 15:00:00")
+async def test_dashboard_trend_participation_and_month_over_month(service, stats_repo):
+    await _log(stats_repo, date(2025, 12, 10), 4)
+    await _log(stats_repo, date(2026, 1, 20), 1, 2)
+    await _log(stats_repo, date(2026, 2, 1), 1, 2)
+    await _log(stats_repo, date(2026, 2, 3), 1, 3)
+
+    dashboard = await service.find("C123")
+
+    assert dashboard.program == "Move"
+    assert [stat.activity_count for stat in dashboard.daily] == [2, 0, 2, 0]
+    assert dashboard.current.cycle_reference == "2026-02"
+    assert dashboard.current.total_activities == 4
+    assert dashboard.current.active_users == 3
+    assert dashboard.current.active_days == 2
+    assert dashboard.current.average_daily_users == 1.0
+    assert dashboard.participation_rate == 0.75
+    assert dashboard.previous.total_activities == 2
+    assert dashboard.activities_change_pct == 100.0
+    assert dashboard.active_users_change_pct == 50.0
+
+
+@pytest.mark.anyio
+@freeze_time("2026-02-04 15:00:00")
+async def test_dashboard_of_a_past_cycle_without_previous_data(service):
+    dashboard = await service.find("C123", "2026-01")
+
+    assert len(dashboard.daily) == 31
+    assert dashboard.previous.cycle_reference == "2025-12"
+    assert dashboard.activities_change_pct is None
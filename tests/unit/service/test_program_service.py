@@ -266,6 +266,7 @@ async def test_create_program_sets_start_date_to_beginning_of_day(
         mock_instance.slack_channel = "C12345"
         mock_instance.start_date = input_date
         mock_instance.end_date = None
+        mock_instance.goal_tiers = [{"name": "goal", "threshold": 12}]
         mock_instance.id = 1
         mock_instance.created_at = datetime.now()
 
@@ -300,6 +301,7 @@ async def test_update_program_sets_start_date_to_beginning_of_day(
     db_program.slack_channel = "C123"
     db_program.start_date = datetime(2026, 1, 19, 0, 0, 0)
     db_program.end_date = None
+    db_program.goal_tiers = [{"name": "goal", "threshold": 12}]
     db_program.created_at = datetime.now()
 
     mock_program_repo.get_by_id.return_value = db_program
@@ -313,3 +315,64 @@ async def test_update_program_sets_start_date_to_beginning_of_day(
     assert db_program.start_date.hour == 0
     assert db_program.start_date.minute == 0
     assert db_program.start_date.second == 1
+
+
+def test_program_create_sorts_goal_tiers_and_defaults_to_single_goal():
+    start_date = datetime(2026, 1, 1)
+    default = ProgramCreate(name="P", slack_channel="C1", start_date=start_date)
+    tiered = ProgramCreate(
+        name="P",
+        slack_channel="C1",
+        start_date=start_date,
+        goal_tiers=[
+            {"name": "gold", "threshold": 20},
+            {"name": "bronze", "threshold": 8},
+        ],
+    )
+
+    assert [tier.model_dump() for tier in default.goal_tiers] == [
+        {"name": "goal", "threshold": 12}
+    ]
+    assert [tier.name for tier in tiered.goal_tiers] == ["bronze", "gold"]
+
+
+@pytest.mark.anyio
+async def test_find_one_by_slack_channel(program_service, mock_program_repo):
+    program = Program(id=1, name="P", slack_channel="C1")
+    mock_program_repo.find_by_slack_channel.return_value = [program]
+    assert await program_service.find_one_by_slack_channel("C1") is program
+
+    mock_program_repo.find_by_slack_channel.return_value = []
+    with pytest.raises(EntityNotFoundError):
+        await program_service.find_one_by_slack_channel("C1")
+
+    mock_program_repo.find_by_slack_channel.return_value = [program, program]
+    with pytest.raises(BusinessRuleViolationError, match="2 programs"):
+        await program_service.find_one_by_slack_channel("C1")
+
+
+@pytest.mark.parametrize(
+    "goal_tiers",
+    [
+        [],
+        [{"name": "gold", "threshold": 8}, {"name": "gold", "threshold": 12}],
+        [{"name": "bronze", "threshold": 8}, {"name": "silver", "threshold": 8}],
+        [{"name": "bronze", "threshold": 0}],
+    ],
+)
+def test_program_create_rejects_invalid_goal_tiers(goal_tiers):
+    with pytest.raises(ValueError):
+        ProgramCreate(
+            name="P",
+            slack_channel="C1",
+            start_date=datetime(2026, 1, 1),
+            goal_tiers=goal_tiers,
+        )
+
+
+@pytest.mark.parametrize("name", ["leaderboard", "streak", "heatmap", "dashboard"])
+def test_program_schemas_reject_names_shadowed_by_program_routes(name):
+    with pytest.raises(ValueError, match="reserved"):
+        ProgramCreate(name=name, slack_channel="C1", start_date=datetime(2026, 1, 1))
+    with pytest.raises(ValueError, match="reserved"):
+        ProgramUpdate(name=name)
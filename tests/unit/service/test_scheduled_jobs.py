@@ -0,0 +1,131 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.exceptions.business import ExternalServiceError
+from app.models.program import Program
+from app.schemas.achievement import AchievementBatchResponse, NotifyResponse
+from app.services.scheduled_jobs import (
+    build_scheduler,
+    close_previous_cycle,
+    previous_cycle_reference,
+)
+
+JOBS_PATH = "app.services.scheduled_jobs"
+
+
+def _session_factory():
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=AsyncMock())
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
+
+
+def test_previous_cycle_reference_uses_local_time():
+    # 2026-03-01 01:00 UTC is still February in Sao Paulo
+    assert previous_cycle_reference(datetime(2026, 3, 1, 1, 0, tzinfo=UTC)) == "2026-01"
+    assert (
+        previous_cycle_reference(datetime(2026, 1, 1, 12, 0, tzinfo=UTC)) == "2025-12"
+    )
+
+
+@pytest.mark.anyio
+async def test_close_previous_cycle_closes_and_notifies_programs_that_ran():
+    programs = [
+        Program(name="Running", start_date=datetime(2026, 1, 1), end_date=None),
+        Program(name="Future", start_date=datetime(2026, 6, 1), end_date=None),
+        Program(
+            name="Finished",
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 12, 31),
+        ),
+    ]
+    with (
+        patch(f"{JOBS_PATH}.async_session", _session_factory()),
+        patch(f"{JOBS_PATH}.ProgramRepository") as mock_program_repo,
+        patch(f"{JOBS_PATH}.AchievementService") as mock_service_cls,
+    ):
+        mock_program_repo.return_value.get_all = AsyncMock(return_value=programs)
+        service = mock_service_cls.return_value
+        service.close_cycle = AsyncMock(
+            return_value=AchievementBatchResponse(
+                total_created=2,
+                program_name="Running",
+                cycle_reference="2026-02",
+                users=["A", "B"],
+            )
+        )
+        service.notify_achievements = AsyncMock(
+            return_value=NotifyResponse(total_notified=2, message="ok")
+        )
+
+        summary = await close_previous_cycle(datetime(2026, 3, 1, 12, 0, tzinfo=UTC))
+
+    service.close_cycle.assert_awaited_once_with(
+        "Running", "2026-02", reconcile=True
+    )
+    service.notify_achievements.assert_awaited_once_with("Running", "2026-02")
+    assert summary == {"programs": 1, "achievements": 2, "notified": 2, "failed": 0}
+
+
+@pytest.mark.anyio
+async def test_close_previous_cycle_keeps_going_when_slack_fails():
+    programs = [
+        Program(name="First", start_date=datetime(2026, 1, 1), end_date=None),
+        Program(name="Second", start_date=datetime(2026, 1, 1), end_date=None),
+    ]
+    with (
+        patch(f"{JOBS_PATH}.async_session", _session_factory()),
+        patch(f"{JOBS_PATH}.ProgramRepository") as mock_program_repo,
+        patch(f"{JOBS_PATH}.AchievementService") as mock_service_cls,
+    ):
+        mock_program_repo.return_value.get_all = AsyncMock(return_value=programs)
+        service = mock_service_cls.return_value
+        service.close_cycle = AsyncMock(return_value=None)
+        service.notify_achievements = AsyncMock(
+            side_effect=[
+                ExternalServiceError("Slack", "down"),
+                NotifyResponse(total_notified=1, message="ok"),
+            ]
+        )
+
+        summary = await close_previous_cycle(datetime(2026, 3, 1, 12, 0, tzinfo=UTC))
+
+    assert summary == {"programs": 2, "achievements": 0, "notified": 1, "failed": 1}
+
+
+def test_build_scheduler_registers_directory_sync_only_when_enabled():
+    with patch(f"{JOBS_PATH}.settings") as mock_settings:
+        mock_settings.SLACK_DIRECTORY_SYNC_INTERVAL_SECONDS = 0
+        assert set(build_scheduler().jobs) == {
+            "close-previous-cycle",
+            "purge-expired-records",
+        }
+
+        mock_settings.SLACK_DIRECTORY_SYNC_INTERVAL_SECONDS = 3600
+        assert "slack-directory-sync" in build_scheduler().jobs
+
+
+@pytest.mark.anyio
+async def test_close_previous_cycle_keeps_going_when_a_close_fails():
+    programs = [
+        Program(name="First", start_date=datetime(2026, 1, 1), end_date=None),
+        Program(name="Second", start_date=datetime(2026, 1, 1), end_date=None),
+    ]
+    with (
+        patch(f"{JOBS_PATH}.async_session", _session_factory()),
+        patch(f"{JOBS_PATH}.ProgramRepository") as mock_program_repo,
+        patch(f"{JOBS_PATH}.AchievementService") as mock_service_cls,
+    ):
+        mock_program_repo.return_value.get_all = AsyncMock(return_value=programs)
+        service = mock_service_cls.return_value
+        service.close_cycle = AsyncMock(side_effect=[RuntimeError("db down"), None])
+        service.notify_achievements = AsyncMock(
+            return_value=NotifyResponse(total_notified=1, message="ok")
+        )
+
+        summary = await close_previous_cycle(datetime(2026, 3, 1, 12, 0, tzinfo=UTC))
+
+    service.notify_achievements.assert_awaited_once_with("Second", "2026-02")
+    assert summary == {"programs": 2, "achievements": 0, "notified": 1, "failed": 1}
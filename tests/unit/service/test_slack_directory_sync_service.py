@@ -0,0 +1,136 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import web
+
+from app.core.slack_clients import SlackClientPool
+from app.models.slack_installation import SlackInstallation
+from app.models.user import User
+from app.repositories.slack_installation_repository import SlackInstallationRepository
+from app.repositories.user_repository import UserRepository
+from app.services.slack_directory_sync_service import SlackDirectorySyncService
+
+PAGES = {
+    None: {
+        "ok": True,
+        "members": [
+            {"id": "U1", "profile": {"display_name": "Alice"}},
+            {"id": "U2", "profile": {"display_name": "Bob"}},
+            {"id": "B1", "is_bot": True, "name": "bot"},
+        ],
+        "response_metadata": {"next_cursor": "page-2"},
+    },
+    "page-2": {
+        "ok": True,
+        "members": [
+            {"id": "U3", "real_name": "Carol"},
+            {"id": "U4", "deleted": True, "name": "gone"},
+        ],
+        "response_metadata": {"next_cursor": ""},
+    },
+}
+
+
+@pytest.fixture
+def mock_user_repo():
+    repo = AsyncMock(spec=UserRepository)
+    repo.find_all_by_slack_ids.side_effect = lambda slack_ids: [
+        user
+        for user in [
+            User(id=1, slack_id="U1", display_name="U1"),
+            User(id=2, slack_id="U2", display_name="Bob"),
+            User(id=3, slack_id="U3", display_name="Old Carol"),
+        ]
+        if user.slack_id in slack_ids
+    ]
+    return repo
+
+
+@pytest.fixture
+def mock_installation_repo():
+    repo = AsyncMock(spec=SlackInstallationRepository)
+    repo.get_all.return_value = [SlackInstallation(team_id="T1", bot_token="xoxb")]
+    return repo
+
+
+@pytest.fixture
+def service(mock_user_repo, mock_installation_repo):
+    return SlackDirectorySyncService(mock_user_repo, mock_installation_repo)
+
+
+def _fake_client(pages):
+    client = AsyncMock()
+    client.users_list.side_effect = lambda cursor, limit: pages[cursor]
+    return client
+
+
+@pytest.mark.anyio
+async def test_sync_updates_only_changed_names(service, mock_user_repo):
+    service.client_factory = lambda token: _fake_client(PAGES)
+    progress = []
+
+    report = await service.sync(on_progress=lambda r: progress.append(r.pages))
+
+    assert report.workspaces == 1
+    assert report.pages == 2
+    assert report.members_seen == 5
+    assert report.users_updated == 2
+    assert progress == [1, 2]
+    updated = [call.args[0] for call in mock_user_repo.bulk_update.call_args_list]
+    assert updated == [
+        [{"id": 1, "display_name": "Alice"}],
+        [{"id": 3, "display_name": "Carol"}],
+    ]
+
+
+@pytest.mark.anyio
+async def test_sync_reports_failed_workspace(service, mock_installation_repo):
+    mock_installation_repo.get_all.return_value = [
+        SlackInstallation(team_id="T1", bot_token="xoxb-1"),
+        SlackInstallation(team_id="T2", bot_token="xoxb-2"),
+    ]
+
+    def client_factory(token):
+        if token == "xoxb-1":
+            client = AsyncMock()
+            client.users_list.side_effect = Exception("invalid_auth")
+            return client
+        return _fake_client(PAGES)
+
+    service.client_factory = client_factory
+
+    report = await service.sync()
+
+    assert report.workspaces == 2
+    assert report.failed_workspaces == ["T1"]
+    assert report.users_updated == 2
+
+
+@pytest.mark.anyio
+async def test_sync_against_local_fake_slack_api(
+    service, mock_user_repo, unused_tcp_port
+):
+    seen_tokens = []
+
+    async def users_list(request):
+        seen_tokens.append(request.headers.get("Authorization"))
+        return web.json_response(PAGES[request.query.get("cursor")])
+
+    app = web.Application()
+    app.router.add_get("/api/users.list", users_list)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", unused_tcp_port).start()
+
+    pool = SlackClientPool(base_url=f"http://127.0.0.1:{unused_tcp_port}/api/")
+    await pool.start()
+    service.client_factory = pool.get
+    try:
+        report = await service.sync()
+    finally:
+        await pool.close()
+        await runner.cleanup()
+
+    assert report.pages == 2
+    assert report.users_updated == 2
+    assert seen_tokens == ["Bearer xoxb", "Bearer xoxb"]
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock
 import pytest
 from slack_sdk.oauth.installation_store import Installation
 
-from app.models.slack_installation import SlackInstallation, SlackState
+from app.models.slack_installation import SlackInstallation
 from app.repositories.slack_installation_repository import SlackInstallationRepository
 from app.repositories.slack_state_repository import SlackStateRepository
 from app.services.slack_oauth_service import SlackOAuthService
@@ -161,32 +161,34 @@ async def test_issue_state(slack_oauth_service, mock_state_repo):
 
 @pytest.mark.anyio
 async def test_consume_state_valid(slack_oauth_service, mock_state_repo):
-    state = "state123"
-    db_state = SlackState(
-        state=state,
-        expire_at=datetime.fromtimestamp(datetime.now(UTC).timestamp() + 100, tz=UTC),
-    )
-    mock_state_repo.find_by_state.return_value = db_state
+    mock_state_repo.consume.return_value = True
 
-    result = await slack_oauth_service.consume_state(state)
+    result = await slack_oauth_service.consume_state("state123")
 
     assert result is True
-    mock_state_repo.delete_by_state.assert_called_once_with(state)
+    mock_state_repo.consume.assert_called_once()
+    assert mock_state_repo.consume.call_args[0][0] == "state123"
+    mock_state_repo.find_by_state.assert_not_called()
 
 
 @pytest.mark.anyio
 async def test_consume_state_expired(slack_oauth_service, mock_state_repo):
-    state = "state123"
-    db_state = SlackState(
-        state=state,
-        expire_at=datetime.fromtimestamp(datetime.now(UTC).timestamp() - 100, tz=UTC),
-    )
-    mock_state_repo.find_by_state.return_value = db_state
+    mock_state_repo.consume.return_value = False
 
-    result = await slack_oauth_service.consume_state(state)
+    result = await slack_oauth_service.consume_state("state123")
 
     assert result is False
-    mock_state_repo.delete_by_state.assert_called_once_with(state)
+
+
+@pytest.mark.anyio
+async def test_mark_state_spent(slack_oauth_service, mock_state_repo):
+    expire_at = datetime.now(UTC)
+    mock_state_repo.mark_spent.return_value = True
+
+    result = await slack_oauth_service.mark_state_spent("nonce", expire_at)
+
+    assert result is True
+    mock_state_repo.mark_spent.assert_called_once_with("nonce", expire_at)
 
 
 @pytest.mark.anyio
@@ -0,0 +1,190 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.activity import Activity
+from app.models.streak import Streak
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.streak_repository import StreakRepository
+from app.services.streak_service import StreakService, to_streak_response
+
+USER_ID = 1
+PROGRAM_ID = 1
+DAY = date(2026, 10, 1)
+
+
+@pytest.fixture
+async def session(sqlite_sessions):
+    session_factory = await sqlite_sessions(Activity, Streak)
+    async with session_factory() as session:
+        yield session
+
+
+def _service(session: AsyncSession) -> StreakService:
+    return StreakService(StreakRepository(session), ActivityRepository(session))
+
+
+def _day(offset: int) -> date:
+    return DAY + timedelta(days=offset)
+
+
+async def _add(session: AsyncSession, *offsets: int) -> StreakService:
+    for offset in offsets:
+        day = _day(offset)
+        session.add(
+            Activity(
+                user_id=USER_ID,
+                program_id=PROGRAM_ID,
+                description="Run",
+                performed_at=datetime(day.year, day.month, day.day, 12),
+            )
+        )
+    await session.commit()
+    return _service(session)
+
+
+async def _remove(session: AsyncSession, *offsets: int) -> StreakService:
+    await session.execute(
+        delete(Activity).where(Activity.performed_on.in_([_day(o) for o in offsets]))
+    )
+    await session.commit()
+    return _service(session)
+
+
+async def _state(session: AsyncSession) -> tuple | None:
+    result = await session.execute(select(Streak))
+    streak = result.scalar_one_or_none()
+    if streak is None:
+        return None
+    await session.refresh(streak)
+    return streak.current_start, streak.last_date, streak.longest_length
+
+
+@pytest.mark.anyio
+async def test_record_day_extends_and_restarts_the_current_run(session):
+    for offset in (0, 1, 2):
+        service = await _add(session, offset)
+        await service.record_day(USER_ID, PROGRAM_ID, _day(offset))
+    assert await _state(session) == (_day(0), _day(2), 3)
+
+    service = await _add(session, 5)
+    streak = await service.record_day(USER_ID, PROGRAM_ID, _day(5))
+
+    assert streak.current_length == 1
+    assert await _state(session) == (_day(5), _day(5), 3)
+
+
+@pytest.mark.anyio
+async def test_backfill_bridges_the_runs_around_the_day(session):
+    service = await _add(session, 0, 1, 3, 4, 5)
+    await service.recompute(USER_ID, PROGRAM_ID)
+    assert await _state(session) == (_day(3), _day(5), 3)
+
+    service = await _add(session, 2)
+    streak = await service.record_day(USER_ID, PROGRAM_ID, _day(2))
+
+    assert streak.current_length == 6
+    assert await _state(session) == (_day(0), _day(5), 6)
+
+
+@pytest.mark.anyio
+async def test_backfill_before_the_current_run_only_updates_longest(session):
+    service = await _add(session, 0, 1, 3, 4, 10)
+    await service.recompute(USER_ID, PROGRAM_ID)
+
+    service = await _add(session, 2)
+    await service.record_day(USER_ID, PROGRAM_ID, _day(2))
+
+    assert await _state(session) == (_day(10), _day(10), 5)
+
+
+@pytest.mark.anyio
+async def test_remove_day_splits_the_current_run(session):
+    service = await _add(session, 0, 1, 2, 3, 4, 10, 11, 12)
+    await service.recompute(USER_ID, PROGRAM_ID)
+
+    service = await _remove(session, 11)
+    await service.remove_day(USER_ID, PROGRAM_ID, _day(11))
+    assert await _state(session) == (_day(12), _day(12), 5)
+
+    service = await _remove(session, 12)
+    await service.remove_day(USER_ID, PROGRAM_ID, _day(12))
+    assert await _state(session) == (_day(10), _day(10), 5)
+
+    service = await _remove(session, 10)
+    await service.remove_day(USER_ID, PROGRAM_ID, _day(10))
+    assert await _state(session) == (_day(0), _day(4), 5)
+
+
+@pytest.mark.anyio
+async def test_remove_day_from_the_longest_run_recomputes(session):
+    service = await _add(session, 0, 1, 2, 3, 10, 11)
+    await service.recompute(USER_ID, PROGRAM_ID)
+
+    service = await _remove(session, 1)
+    await service.remove_day(USER_ID, PROGRAM_ID, _day(1))
+
+    assert await _state(session) == (_day(10), _day(11), 2)
+
+
+@pytest.mark.anyio
+async def test_remove_last_day_deletes_the_state(session):
+    service = await _add(session, 0)
+    await service.record_day(USER_ID, PROGRAM_ID, _day(0))
+
+    service = await _remove(session, 0)
+    streak = await service.remove_day(USER_ID, PROGRAM_ID, _day(0))
+
+    assert streak is None
+    assert await _state(session) is None
+
+
+@pytest.mark.anyio
+async def test_move_day_matches_a_full_recompute(session):
+    service = await _add(session, 0, 1, 2, 5, 6)
+    await service.recompute(USER_ID, PROGRAM_ID)
+
+    await session.execute(
+        Activity.__table__.update()
+        .where(Activity.performed_on == _day(6))
+        .values(performed_on=_day(3))
+    )
+    await session.commit()
+    await service.move_day(USER_ID, PROGRAM_ID, _day(6), _day(3))
+
+    assert await _state(session) == (_day(5), _day(5), 4)
+
+
+@pytest.mark.anyio
+async def test_incremental_updates_match_recompute(session):
+    rng = random.Random(46)
+    days = set()
+    service = _service(session)
+
+    for _ in range(120):
+        offset = rng.randrange(40)
+        if offset in days:
+            days.discard(offset)
+            service = await _remove(session, offset)
+            await service.remove_day(USER_ID, PROGRAM_ID, _day(offset))
+        else:
+            days.add(offset)
+            service = await _add(session, offset)
+            await service.record_day(USER_ID, PROGRAM_ID, _day(offset))
+
+        incremental = await _state(session)
+        await service.recompute(USER_ID, PROGRAM_ID)
+        assert incremental == await _state(session)
+
+
+def test_to_streak_response_drops_a_broken_current_run():
+    streak = Streak(current_start=_day(0), last_date=_day(2), longest_length=4)
+
+    assert to_streak_response(streak, _day(3)).current_length == 3
+    broken = to_streak_response(streak, _day(4))
+    assert broken.current_length == 0
+    assert broken.longest_length == 4
+    assert to_streak_response(None, _day(4)).longest_length == 0
@@ -7,7 +7,9 @@ from app.exceptions.business import (
     DuplicateEntityError,
     ExternalServiceError,
 )
+from app.models.slack_installation import SlackInstallation
 from app.models.user import User
+from app.repositories.slack_installation_repository import SlackInstallationRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate
 from app.services.user_service import UserService
@@ -18,14 +20,25 @@ def mock_user_repo():
     return AsyncMock(spec=UserRepository)
 
 
+@pytest.fixture
+def mock_installation_repo():
+    repo = AsyncMock(spec=SlackInstallationRepository)
+    repo.find_latest.return_value = SlackInstallation(bot_token="xoxb-team")
+    return repo
+
+
 @pytest.fixture
 def mock_slack_client():
-    return AsyncMock()
+    with patch("app.services.utils.slack_client.slack_client_pool") as pool:
+        pool.get.return_value = AsyncMock()
+        yield pool.get.return_value
 
 
 @pytest.fixture
-def user_service(mock_user_repo):
-    return UserService(user_repo=mock_user_repo)
+def user_service(mock_user_repo, mock_installation_repo):
+    return UserService(
+        user_repo=mock_user_repo, installation_repo=mock_installation_repo
+    )
 
 
 @pytest.mark.anyio
@@ -64,6 +77,34 @@ async def test_user_service_create_database_error(user_service, mock_user_repo):
         await user_service.create(user_create)
 
 
+@pytest.mark.anyio
+async def test_user_service_get_or_create(user_service, mock_user_repo):
+    user = User(id=1, slack_id="U123", display_name="Test User")
+    mock_user_repo.get_or_create.return_value = user
+
+    result = await user_service.get_or_create(
+        UserCreate(slack_id="U123", display_name="Test User")
+    )
+
+    assert result == user
+    mock_user_repo.get_or_create.assert_called_once_with(
+        slack_id="U123", display_name="Test User"
+    )
+    mock_user_repo.find_by_slack_id.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_user_service_get_or_create_database_error(
+    user_service, mock_user_repo
+):
+    mock_user_repo.get_or_create.side_effect = Exception("DB Fail")
+
+    with pytest.raises(DatabaseError):
+        await user_service.get_or_create(
+            UserCreate(slack_id="U123", display_name="Test User")
+        )
+
+
 @pytest.mark.anyio
 async def test_user_service_find_all(user_service, mock_user_repo):
     users = [User(id=1), User(id=2)]
@@ -87,85 +128,108 @@ async def test_user_service_find_by_slack_id(user_service, mock_user_repo):
 
 
 @pytest.mark.anyio
-async def test_get_slack_display_name_success_with_display_name(user_service):
-    with patch("app.services.user_service.slack_app") as mock_slack:
-        mock_slack.client.users_info = AsyncMock(return_value={
-            "ok": True,
-            "user": {
-                "profile": {"display_name": "John Doe"},
-                "real_name": "John D.",
-                "name": "johndoe"
-            }
-        })
+async def test_get_slack_display_name_success_with_display_name(
+    user_service, mock_slack_client
+):
+    mock_slack_client.users_info.return_value = {
+        "ok": True,
+        "user": {
+            "profile": {"display_name": "John Doe"},
+            "real_name": "John D.",
+            "name": "johndoe",
+        },
+    }
+
+    result = await user_service.get_slack_display_name("U123ABC")
+
+    assert result == "John Doe"
+    mock_slack_client.users_info.assert_called_once_with(user="U123ABC")
+
+
+@pytest.mark.anyio
+async def test_get_slack_display_name_uses_the_installation_token(
+    user_service, mock_slack_client
+):
+    mock_slack_client.users_info.return_value = {
+        "ok": True,
+        "user": {"name": "johndoe"},
+    }
+
+    with patch("app.services.utils.slack_client.slack_client_pool") as pool:
+        pool.get.return_value = mock_slack_client
+        await user_service.get_slack_display_name("U123ABC")
+
+    pool.get.assert_called_once_with("xoxb-team")
+
+
+@pytest.mark.anyio
+async def test_get_slack_display_name_without_installation(
+    user_service, mock_installation_repo, mock_slack_client
+):
+    mock_installation_repo.find_latest.return_value = None
 
-        result = await user_service.get_slack_display_name("U123ABC")
+    with pytest.raises(ExternalServiceError, match="not installed"):
+        await user_service.get_slack_display_name("U123ABC")
 
-        assert result == "John Doe"
-        mock_slack.client.users_info.assert_called_once_with(user="U123ABC")
+    mock_slack_client.users_info.assert_not_called()
 
 
 @pytest.mark.anyio
-async def test_get_slack_display_name_fallback_to_real_name(user_service):
-    with patch("app.services.user_service.slack_app") as mock_slack:
-        mock_slack.client.users_info = AsyncMock(return_value={
-            "ok": True,
-            "user": {
-                "profile": {"display_name": ""},
-                "real_name": "John D.",
-                "name": "johndoe"
-            }
-        })
+async def test_get_slack_display_name_fallback_to_real_name(
+    user_service, mock_slack_client
+):
+    mock_slack_client.users_info.return_value = {
+        "ok": True,
+        "user": {
+            "profile": {"display_name": ""},
+            "real_name": "John D.",
+            "name": "johndoe",
+        },
+    }
 
-        result = await user_service.get_slack_display_name("U123ABC")
+    result = await user_service.get_slack_display_name("U123ABC")
 
-        assert result == "John D."
+    assert result == "John D."
 
 
 @pytest.mark.anyio
-async def test_get_slack_display_name_fallback_to_name(user_service):
-    with patch("app.services.user_service.slack_app") as mock_slack:
-        mock_slack.client.users_info = AsyncMock(return_value={
-            "ok": True,
-            "user": {
-                "profile": {"display_name": ""},
-                "real_name": "",
-                "name": "johndoe"
-            }
-        })
+async def test_get_slack_display_name_fallback_to_name(
+    user_service, mock_slack_client
+):
+    mock_slack_client.users_info.return_value = {
+        "ok": True,
+        "user": {"profile": {"display_name": ""}, "real_name": "", "name": "johndoe"},
+    }
 
-        result = await user_service.get_slack_display_name("U123ABC")
+    result = await user_service.get_slack_display_name("U123ABC")
 
-        assert result == "johndoe"
+    assert result == "johndoe"
 
 
 @pytest.mark.anyio
-async def test_get_slack_display_name_api_error(user_service):
-    with patch("app.services.user_service.slack_app") as mock_slack:
-        mock_slack.client.users_info = AsyncMock(return_value={
-            "ok": False,
-            "error": "user_not_found"
-        })
+async def test_get_slack_display_name_api_error(user_service, mock_slack_client):
+    mock_slack_client.users_info.return_value = {
+        "ok": False,
+        "error": "user_not_found",
+    }
 
-        with pytest.raises(ExternalServiceError) as exc_info:
-            await user_service.get_slack_display_name("U123ABC")
+    with pytest.raises(ExternalServiceError) as exc_info:
+        await user_service.get_slack_display_name("U123ABC")
 
-        assert "Slack" in str(exc_info.value.message)
-        assert "user_not_found" in str(exc_info.value.message)
+    assert "Slack" in str(exc_info.value.message)
+    assert "user_not_found" in str(exc_info.value.message)
 
 
 @pytest.mark.anyio
-async def test_get_slack_display_name_no_display_name(user_service):
-    with patch("app.services.user_service.slack_app") as mock_slack:
-        mock_slack.client.users_info = AsyncMock(return_value={
-            "ok": True,
-            "user": {
-                "profile": {},
-                "real_name": "",
-                "name": ""
-            }
-        })
-
-        with pytest.raises(ExternalServiceError) as exc_info:
-            await user_service.get_slack_display_name("U123ABC")
-
-        assert "has no display name" in str(exc_info.value.message)
+async def test_get_slack_display_name_no_display_name(
+    user_service, mock_slack_client
+):
+    mock_slack_client.users_info.return_value = {
+        "ok": True,
+        "user": {"profile": {}, "real_name": "", "name": ""},
+    }
+
+    with pytest.raises(ExternalServiceError) as exc_info:
+        await user_service.get_slack_display_name("U123ABC")
+
+    assert "has no display name" in str(exc_info.value.message)
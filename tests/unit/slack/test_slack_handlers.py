@@ -6,6 +6,7 @@ import pytest
 from app.interfaces.slack.slack_handlers import (
     handle_app_mention,
     handle_create_program,
+    handle_leaderboard,
     handle_list_activities,
     handle_list_programs,
     handle_message_events,
@@ -26,6 +27,9 @@ PARSE_ACTIVITY_DATE = f"{HANDLERS_PATH}.parse_activity_date"
 REGISTER_ACTIVITY_ACTION = f"{HANDLERS_PATH}.register_activity_action"
 ACTIVITY_REGISTERED_BLOCKS = f"{HANDLERS_PATH}.activity_registered_blocks"
 HELP_BLOCKS = f"{HANDLERS_PATH}.help_blocks"
+LEADERBOARD_ACTION = f"{HANDLERS_PATH}.leaderboard_action"
+LEADERBOARD_BLOCKS = f"{HANDLERS_PATH}.leaderboard_blocks"
+GET_LEADERBOARD_SERVICE = f"{HANDLERS_PATH}.get_leaderboard_service"
 
 
 def create_mock_command(text="", channel_id="C123", user_id="U123"):
@@ -52,6 +56,7 @@ def mock_ack():
 @pytest.fixture
 def mock_context():
     context = MagicMock()
+    context.get.return_value = None
     context.say = AsyncMock()
     context.client.chat_postEphemeral = AsyncMock()
     context.__getitem__.return_value = MagicMock()
@@ -84,7 +89,7 @@ async def test_handle_create_program_success(mock_ack, mock_context):
 
         await handle_create_program(mock_ack, command, mock_context)
 
-        mock_ack.assert_awaited_once()
+        mock_ack.assert_awaited_once_with()
         mock_create_action.assert_awaited_once()
         mock_context.say.assert_awaited_once()
         args, kwargs = mock_context.say.call_args
@@ -101,8 +106,9 @@ async def test_handle_create_program_no_name(mock_ack, mock_context):
     await handle_create_program(mock_ack, command, mock_context)
 
     mock_ack.assert_awaited_once()
-    mock_context.client.chat_postEphemeral.assert_awaited_once()
-    _, kwargs = mock_context.client.chat_postEphemeral.call_args
+    mock_context.client.chat_postEphemeral.assert_not_awaited()
+    _, kwargs = mock_ack.call_args
+    assert kwargs["response_type"] == "ephemeral"
     assert "undefined program name" in kwargs.get("text", "")
 
 
@@ -122,8 +128,9 @@ async def test_handle_create_program_error(mock_ack, mock_context):
         await handle_create_program(mock_ack, command, mock_context)
 
         mock_ack.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
-        _, kwargs = mock_context.client.chat_postEphemeral.call_args
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
         assert "Error on creating program" in kwargs.get("text", "")
 
 
@@ -146,7 +153,9 @@ async def test_handle_list_programs_success(mock_ack, mock_context):
 
         mock_ack.assert_awaited_once()
         mock_list_action.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["text"] == "Programs"
 
 
 @pytest.mark.anyio
@@ -165,8 +174,9 @@ async def test_handle_list_programs_error(mock_ack, mock_context):
         await handle_list_programs(mock_ack, command, mock_context)
 
         mock_ack.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
-        _, kwargs = mock_context.client.chat_postEphemeral.call_args
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
         assert "Error on listing programs" in kwargs.get("text", "")
 
 
@@ -191,8 +201,9 @@ async def test_handle_list_activities_success(mock_ack, mock_context):
 
         mock_ack.assert_awaited_once()
         mock_action.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
-        _, kwargs = mock_context.client.chat_postEphemeral.call_args
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
         assert "Activities:" in kwargs.get("text", "")
 
 
@@ -206,8 +217,9 @@ async def test_handle_list_activities_invalid_date(mock_ack, mock_context):
         await handle_list_activities(mock_ack, command, mock_context)
 
         mock_ack.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
-        _, kwargs = mock_context.client.chat_postEphemeral.call_args
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
         assert "Invalid date!" in kwargs.get("text", "")
 
 
@@ -229,11 +241,49 @@ async def test_handle_list_activities_error(mock_ack, mock_context):
         await handle_list_activities(mock_ack, command, mock_context)
 
         mock_ack.assert_awaited_once()
-        mock_context.client.chat_postEphemeral.assert_awaited_once()
-        _, kwargs = mock_context.client.chat_postEphemeral.call_args
+        mock_context.client.chat_postEphemeral.assert_not_awaited()
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
         assert "Error on listing activities" in kwargs.get("text", "")
 
 
+@pytest.mark.anyio
+async def test_handle_leaderboard_success(mock_ack, mock_context):
+    command = create_mock_command(text="@09/2026")
+
+    with (
+        patch(LEADERBOARD_ACTION, new_callable=AsyncMock) as mock_action,
+        patch(LEADERBOARD_BLOCKS) as mock_blocks,
+        patch(GET_LEADERBOARD_SERVICE) as mock_get_service,
+    ):
+        mock_blocks.return_value = []
+
+        await handle_leaderboard(mock_ack, command, mock_context)
+
+        mock_action.assert_awaited_once_with(
+            mock_get_service.return_value, "C123", "U123", "2026-09"
+        )
+        _, kwargs = mock_ack.call_args
+        assert kwargs["response_type"] == "ephemeral"
+        assert "Leaderboard:" in kwargs.get("text", "")
+
+
+@pytest.mark.anyio
+async def test_handle_leaderboard_error(mock_ack, mock_context):
+    command = create_mock_command()
+
+    with (
+        patch(LEADERBOARD_ACTION, new_callable=AsyncMock) as mock_action,
+        patch(GET_LEADERBOARD_SERVICE),
+    ):
+        mock_action.side_effect = Exception("Service Error")
+
+        await handle_leaderboard(mock_ack, command, mock_context)
+
+        _, kwargs = mock_ack.call_args
+        assert "Error on loading the leaderboard" in kwargs.get("text", "")
+
+
 @pytest.mark.anyio
 async def test_handle_app_mention_success(mock_context):
     event = create_mock_event(text="Ran 5km", files=[{"url_private": "http://img.com"}])
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.interfaces.slack.slack_replies import CommandReply
+
+RESPONSE_URL = "https://hooks.slack.com/commands/T1/1/abc"
+
+
+def create_reply(response_url=RESPONSE_URL, respond=True, received_at=None):
+    command = {"channel_id": "C123", "user_id": "U123", "text": ""}
+    if response_url:
+        command["response_url"] = response_url
+    context = MagicMock()
+    context.get.return_value = received_at
+    context.client.chat_postEphemeral = AsyncMock()
+    return CommandReply(AsyncMock(), AsyncMock() if respond else None, command, context)
+
+
+@pytest.mark.anyio
+async def test_ephemeral_goes_in_ack_body_before_ack():
+    reply = create_reply()
+
+    await reply.ephemeral(blocks=[], text="Programs")
+
+    reply._ack.assert_awaited_once_with(
+        blocks=[], text="Programs", response_type="ephemeral"
+    )
+    reply._respond.assert_not_awaited()
+    reply.context.client.chat_postEphemeral.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_ephemeral_uses_response_url_after_ack():
+    reply = create_reply()
+
+    await reply.ack()
+    await reply.ephemeral(blocks=[], text="Programs")
+
+    reply._ack.assert_awaited_once_with()
+    reply._respond.assert_awaited_once_with(
+        blocks=[], text="Programs", response_type="ephemeral", replace_original=False
+    )
+    reply.context.client.chat_postEphemeral.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_ephemeral_falls_back_to_web_api_without_response_url():
+    reply = create_reply(response_url=None)
+
+    await reply.ack()
+    await reply.ephemeral(blocks=[], text="Programs")
+
+    reply.context.client.chat_postEphemeral.assert_awaited_once_with(
+        channel="C123", user="U123", blocks=[], text="Programs"
+    )
+
+
+@pytest.mark.anyio
+async def test_ack_is_sent_once():
+    reply = create_reply()
+
+    await reply.ack()
+    await reply.ack()
+
+    reply._ack.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_within_ack_deadline_does_not_ack_fast_work():
+    reply = create_reply()
+
+    async def work():
+        return "done"
+
+    assert await reply.within_ack_deadline(work()) == "done"
+    reply._ack.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_within_ack_deadline_acks_slow_work_and_keeps_waiting():
+    reply = create_reply()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    with patch("app.interfaces.slack.slack_replies.settings") as mock_settings:
+        mock_settings.SLACK_ACK_BUDGET_SECONDS = 0.01
+        assert await reply.within_ack_deadline(work()) == "done"
+
+    reply._ack.assert_awaited_once_with()
+    assert reply.acknowledged
+
+
+def test_ack_budget_counts_from_receipt():
+    reply = create_reply(received_at=time.monotonic() - 1.5)
+
+    with patch("app.interfaces.slack.slack_replies.settings") as mock_settings:
+        mock_settings.SLACK_ACK_BUDGET_SECONDS = 2.0
+        assert 0 < reply.ack_budget() <= 0.5
+
+
+@pytest.mark.anyio
+async def test_within_ack_deadline_acks_at_once_after_a_long_queue_wait():
+    reply = create_reply(received_at=time.monotonic() - 5)
+
+    async def work():
+        return "done"
+
+    assert await reply.within_ack_deadline(work()) == "done"
+    reply._ack.assert_awaited_once_with()
@@ -11,9 +11,11 @@ from app.interfaces.slack.slack_views import (
     help_blocks,
     invalid_date_blocks,
     invalid_reference_date_blocks,
+    leaderboard_blocks,
 )
 from app.models.activity import Activity
 from app.models.program import Program
+from app.schemas.leaderboard_schema import LeaderboardEntry, LeaderboardResponse
 
 
 def get_block_text(block):
@@ -206,6 +208,39 @@ class TestSlackBlocks:
         assert count_text is not None
         assert "0" in count_text
 
+    # --- Tests for leaderboard_blocks ---
+
+    def test_leaderboard_blocks_lists_entries_and_own_rank(self):
+        me = LeaderboardEntry(rank=4, slack_id="U4", display_name="Dani", count=2)
+        leaderboard = LeaderboardResponse(
+            program="Move",
+            cycle_reference="2026-10",
+            participants=4,
+            entries=[
+                LeaderboardEntry(rank=1, slack_id="U1", display_name="Ana", count=9),
+                LeaderboardEntry(rank=2, slack_id="U2", display_name="Bia", count=7),
+            ],
+            me=me,
+        )
+
+        blocks = leaderboard_blocks(leaderboard)
+
+        assert "Move" in blocks[0]["text"]["text"]
+        ranking = find_block_text_containing(blocks, "<@U1>")
+        assert ":first_place_medal:" in ranking
+        assert "<@U2> · 7 activities" in ranking
+        assert "*Your rank:* 4" in find_block_text_containing(blocks, "Your rank")
+
+    def test_leaderboard_blocks_empty_cycle(self):
+        leaderboard = LeaderboardResponse(
+            program="Move", cycle_reference="2026-10", participants=0, entries=[]
+        )
+
+        blocks = leaderboard_blocks(leaderboard)
+
+        assert find_block_text_containing(blocks, "No activities") is not None
+        assert find_block_text_containing(blocks, "Your rank") is None
+
     # --- Tests for help_blocks ---
 
     def test_help_blocks_content(self):
@@ -227,3 +262,4 @@ class TestSlackBlocks:
         assert find_block_text_containing(blocks, "/create-program") is not None
         assert find_block_text_containing(blocks, "/list-programs") is not None
         assert find_block_text_containing(blocks, "/list-activities") is not None
+        assert find_block_text_containing(blocks, "/leaderboard") is not None
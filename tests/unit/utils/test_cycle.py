@@ -0,0 +1,34 @@
+from datetime import UTC, date, datetime
+
+from app.models.activity import Activity
+from app.utils.cycle import cycle_key, cycle_key_of, local_date
+
+
+def test_cycle_key_is_monotonic_across_years():
+    assert cycle_key(2025, 12) + 1 == cycle_key(2026, 1)
+
+
+def test_local_date_converts_aware_datetime_to_sao_paulo():
+    performed_at = datetime(2026, 2, 1, 2, 30, tzinfo=UTC)
+
+    assert local_date(performed_at) == date(2026, 1, 31)
+    assert cycle_key_of(performed_at) == cycle_key(2026, 1)
+
+
+def test_local_date_keeps_naive_datetime():
+    performed_at = datetime(2026, 2, 1, 2, 30)
+
+    assert local_date(performed_at) == date(2026, 2, 1)
+    assert cycle_key_of(performed_at) == cycle_key(2026, 2)
+
+
+def test_activity_syncs_local_calendar_columns():
+    activity = Activity(performed_at=datetime(2026, 3, 1, 1, 0, tzinfo=UTC))
+
+    assert activity.performed_on == date(2026, 2, 28)
+    assert activity.cycle_key == cycle_key(2026, 2)
+
+    activity.performed_at = datetime(2026, 3, 10, 12, 0)
+
+    assert activity.performed_on == date(2026, 3, 10)
+    assert activity.cycle_key == cycle_key(2026, 3)
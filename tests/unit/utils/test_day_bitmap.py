@@ -0,0 +1,55 @@
+from datetime import date
+
+from app.utils.day_bitmap import (
+    BITMAP_BYTES,
+    active_days,
+    day_index,
+    days_active,
+    from_bytes,
+    from_days,
+    longest_gap,
+    longest_run,
+    range_mask,
+    to_bytes,
+    with_day,
+)
+
+
+def test_bitmap_round_trips_through_46_bytes():
+    bitmap = from_days([date(2024, 1, 1), date(2024, 12, 31)])
+
+    data = to_bytes(bitmap)
+
+    assert len(data) == BITMAP_BYTES == 46
+    assert from_bytes(data) == bitmap
+    assert day_index(date(2024, 12, 31)) == 365
+    assert from_bytes(None) == 0
+
+
+def test_with_day_sets_and_clears_a_bit():
+    bitmap = with_day(0, date(2026, 3, 1))
+
+    assert active_days(bitmap, 2026) == [date(2026, 3, 1)]
+    assert with_day(bitmap, date(2026, 3, 1), active=False) == 0
+
+
+def test_range_mask_is_clamped_to_the_year():
+    assert days_active(-1, range_mask(2026)) == 365
+    assert days_active(-1, range_mask(2024)) == 366
+    assert days_active(-1, range_mask(2026, date(2025, 6, 1), date(2026, 1, 10))) == 10
+    assert range_mask(2026, date(2027, 1, 1)) == 0
+    assert range_mask(2026, date(2026, 5, 1), date(2026, 4, 1)) == 0
+
+
+def test_range_aggregates():
+    bitmap = from_days(
+        [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3), date(2026, 1, 10)]
+    )
+    january = range_mask(2026, date(2026, 1, 1), date(2026, 1, 31))
+
+    assert days_active(bitmap, january) == 4
+    assert longest_run(bitmap) == 3
+    assert longest_gap(bitmap, january) == 21
+    assert (
+        longest_gap(bitmap, range_mask(2026, date(2026, 1, 1), date(2026, 1, 3))) == 0
+    )